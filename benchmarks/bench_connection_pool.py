@@ -0,0 +1,141 @@
+"""Benchmark AsyncRestSession throughput as request concurrency grows.
+
+Starts a minimal HTTP/1.1 keep-alive server on localhost that answers every
+request with a small Webex-style JSON body after a fixed delay (standing in
+for the round trip to the Webex cloud), then drives it through
+AsyncRestSession with several connection-pool sizes and concurrency levels.
+
+Usage (from the repository root, with the package installed by
+`pip install -e .`, or from the source tree by prefixing the commands with
+`PYTHONPATH=.`):
+    python benchmarks/bench_connection_pool.py
+    python benchmarks/bench_connection_pool.py --latency 0.05 --requests 2000
+    python benchmarks/bench_connection_pool.py --json results.json
+
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from webexpythonsdk_async.restsession import AsyncRestSession
+
+
+RESPONSE_BODY = json.dumps(
+    {
+        "id": "Y2lzY29zcGFyazovL3VzL1JPT00vYmVuY2htYXJr",
+        "title": "Benchmark Room",
+        "type": "group",
+        "isLocked": False,
+        "created": "2024-01-01T00:00:00.000Z",
+    }
+).encode("utf-8")
+
+
+async def _handle_connection(reader, writer, latency):
+    """Serve keep-alive HTTP/1.1 requests on a single connection."""
+    try:
+        while True:
+            request_head = await reader.readuntil(b"\r\n\r\n")
+            content_length = 0
+            for line in request_head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    content_length = int(line.split(b":", 1)[1])
+            if content_length:
+                await reader.readexactly(content_length)
+
+            await asyncio.sleep(latency)
+
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: application/json;charset=utf-8\r\n"
+                b"Content-Length: " + str(len(RESPONSE_BODY)).encode() + b"\r\n"
+                b"Connection: keep-alive\r\n\r\n" + RESPONSE_BODY
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _run_level(base_url, max_connections, concurrency, total_requests):
+    """Issue `total_requests` GETs with `concurrency` workers; return req/s."""
+    async with AsyncRestSession(
+        access_token="benchmark-token",
+        base_url=base_url,
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+    ) as session:
+        remaining = iter(range(total_requests))
+
+        async def worker():
+            for _ in remaining:
+                await session.get("rooms/benchmark")
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return total_requests / elapsed
+
+
+async def main(args):
+    """Run the connection pool benchmark against a local HTTP server."""
+    server = await asyncio.start_server(
+        lambda r, w: _handle_connection(r, w, args.latency),
+        host="127.0.0.1",
+        port=0,
+    )
+    port = server.sockets[0].getsockname()[1]
+    base_url = "http://127.0.0.1:{}/v1/".format(port)
+
+    results = []
+    async with server:
+        for max_connections in args.pool_sizes:
+            for concurrency in args.concurrency:
+                rps = await _run_level(base_url, max_connections, concurrency, args.requests)
+                results.append(
+                    {
+                        "max_connections": max_connections,
+                        "concurrency": concurrency,
+                        "requests": args.requests,
+                        "requests_per_second": round(rps, 1),
+                    }
+                )
+                print(
+                    "max_connections={:<5} concurrency={:<5} {:>10.1f} req/s".format(
+                        max_connections,
+                        concurrency,
+                        rps,
+                    )
+                )
+
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump(
+                {"benchmark": "connection_pool", "latency": args.latency, "results": results}, json_file, indent=2
+            )
+
+
+def parse_args(argv):
+    """Parse the benchmark command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.02, help="Simulated server latency in seconds.")
+    parser.add_argument("--requests", type=int, default=1000, help="Requests issued per measurement.")
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[10, 100], help="max_connections values.")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 10, 50, 100, 200],
+        help="Concurrent task counts.",
+    )
+    parser.add_argument("--json", help="Write machine-readable results to this file.")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args(sys.argv[1:])))
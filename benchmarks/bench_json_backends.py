@@ -0,0 +1,158 @@
+"""Compare JSON backends decoding and encoding realistic Webex pages.
+
+Builds `{"items": [...]}` pages shaped like Webex people, messages and
+memberships listings and times, per backend:
+
+  * legacy: `json.loads(body.decode(), object_hook=OrderedDict)`, the decoder
+    used before JSON backends were introduced;
+  * every installed JSONBackend decoding the raw response bytes;
+  * every installed JSONBackend encoding a message request body.
+
+Usage (from the repository root, with the package installed by
+`pip install -e .`, or from the source tree by prefixing the commands with
+`PYTHONPATH=.`):
+    python benchmarks/bench_json_backends.py
+    python benchmarks/bench_json_backends.py --page-sizes 100 1000 --json results.json
+
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from collections import OrderedDict
+
+from webexpythonsdk_async.json_backends import JSON_BACKENDS
+
+
+def person(i):
+    """Return a Webex person object."""
+    return {
+        "id": "Y2lzY29zcGFyazovL3VzL1BFT1BMRS9wZXJzb24tezAwMDAwfQ{:05d}".format(i),
+        "emails": ["user{}@example.com".format(i)],
+        "phoneNumbers": [{"type": "work", "value": "+1 408 555 {:04d}".format(i % 10000)}],
+        "displayName": "Example User {}".format(i),
+        "nickName": "User",
+        "firstName": "Example",
+        "lastName": "User {}".format(i),
+        "avatar": "https://avatar-prod-us-east-2.webexcontent.com/Avtr~V1~{}".format(i),
+        "orgId": "Y2lzY29zcGFyazovL3VzL09SR0FOSVpBVElPTi9leGFtcGxl",
+        "created": "2023-05-04T12:34:56.789Z",
+        "lastModified": "2024-01-02T03:04:05.678Z",
+        "lastActivity": "2024-06-07T08:09:10.111Z",
+        "status": "active",
+        "type": "person",
+    }
+
+
+def message(i):
+    """Return a Webex message object."""
+    return {
+        "id": "Y2lzY29zcGFyazovL3VzL01FU1NBR0UvbWVzc2FnZS17MDAwMDB9{:05d}".format(i),
+        "roomId": "Y2lzY29zcGFyazovL3VzL1JPT00vcm9vbS1leGFtcGxl",
+        "roomType": "group",
+        "text": "Status update #{}: deployment finished, all checks green. ✅".format(i),
+        "markdown": "**Status update #{}**: deployment finished, all checks green. ✅".format(i),
+        "personId": "Y2lzY29zcGFyazovL3VzL1BFT1BMRS9ib3Q",
+        "personEmail": "bot@webex.bot",
+        "mentionedPeople": ["Y2lzY29zcGFyazovL3VzL1BFT1BMRS9wZXJzb24"],
+        "created": "2024-06-07T08:09:10.111Z",
+        "updated": "2024-06-07T08:09:10.111Z",
+    }
+
+
+def membership(i):
+    """Return a Webex membership object."""
+    return {
+        "id": "Y2lzY29zcGFyazovL3VzL01FTUJFUlNISVAvbWVtYmVyc2hpcA{:05d}".format(i),
+        "roomId": "Y2lzY29zcGFyazovL3VzL1JPT00vcm9vbS1leGFtcGxl",
+        "personId": "Y2lzY29zcGFyazovL3VzL1BFT1BMRS9wZXJzb24tezAwMDAwfQ{:05d}".format(i),
+        "personEmail": "user{}@example.com".format(i),
+        "personDisplayName": "Example User {}".format(i),
+        "personOrgId": "Y2lzY29zcGFyazovL3VzL09SR0FOSVpBVElPTi9leGFtcGxl",
+        "isModerator": False,
+        "isMonitor": False,
+        "isRoomHidden": False,
+        "roomType": "group",
+        "created": "2023-05-04T12:34:56.789Z",
+    }
+
+
+OBJECT_BUILDERS = {"people": person, "messages": message, "memberships": membership}
+
+
+def _legacy_loads(body):
+    return json.loads(body.decode("utf-8"), object_hook=OrderedDict)
+
+
+def _time(function, number):
+    """Return the best per-call time (seconds) of `function`."""
+    return min(timeit.repeat(function, number=number, repeat=5)) / number
+
+
+def main(args):
+    """Run the JSON backend benchmark and print the timings."""
+    backends = {}
+    for name, backend_class in JSON_BACKENDS.items():
+        try:
+            backends[name] = backend_class()
+        except ImportError:
+            print("Skipping the {!r} backend (not installed).".format(name))
+
+    results = []
+    for endpoint, builder in OBJECT_BUILDERS.items():
+        for page_size in args.page_sizes:
+            body = json.dumps({"items": [builder(i) for i in range(page_size)]}).encode("utf-8")
+            number = max(1, args.iterations // page_size)
+
+            timings = {"legacy": _time(lambda body=body: _legacy_loads(body), number)}
+            for name, backend in backends.items():
+                timings[name] = _time(lambda backend=backend, body=body: backend.loads(body), number)
+
+            for name, seconds in timings.items():
+                results.append(
+                    {
+                        "operation": "decode",
+                        "endpoint": endpoint,
+                        "page_size": page_size,
+                        "page_bytes": len(body),
+                        "backend": name,
+                        "seconds_per_page": seconds,
+                        "megabytes_per_second": round(len(body) / seconds / 1e6, 1),
+                    }
+                )
+                print(
+                    "decode {:<12} {:>5} items {:<7} {:>10.1f} us/page".format(
+                        endpoint,
+                        page_size,
+                        name,
+                        seconds * 1e6,
+                    )
+                )
+
+    request_body = {
+        "roomId": "Y2lzY29zcGFyazovL3VzL1JPT00vcm9vbS1leGFtcGxl",
+        "markdown": "**Announcement**: " + "lorem ipsum " * 50,
+        "attachments": [{"contentType": "application/vnd.microsoft.card.adaptive", "content": {"body": []}}],
+    }
+    for name, backend in backends.items():
+        seconds = _time(lambda backend=backend: backend.dumps(request_body), args.iterations)
+        results.append({"operation": "encode", "endpoint": "messages", "backend": name, "seconds_per_body": seconds})
+        print("encode messages body        {:<7} {:>10.2f} us/body".format(name, seconds * 1e6))
+
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump({"benchmark": "json_backends", "results": results}, json_file, indent=2)
+
+
+def parse_args(argv):
+    """Parse the benchmark command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[10, 100, 1000], help="Items per page.")
+    parser.add_argument("--iterations", type=int, default=20000, help="Items decoded per measurement.")
+    parser.add_argument("--json", help="Write machine-readable results to this file.")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    main(parse_args(sys.argv[1:]))
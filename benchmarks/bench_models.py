@@ -0,0 +1,173 @@
+"""Benchmark model construction and Adaptive Card serialization.
+
+Times, per object:
+
+  * the immutable, dict and simple data factories building message, person
+    and room models from decoded JSON, plus reading a few attributes;
+  * AdaptiveCard.to_dict() and to_json() on cards of growing size (a
+    container of fact sets, inputs and columns repeated `--card-sections`
+    times).
+
+Usage (from the repository root, with the package installed by
+`pip install -e .`, or from the source tree by prefixing the commands with
+`PYTHONPATH=.`):
+    python benchmarks/bench_models.py
+    python benchmarks/bench_models.py --card-sections 10 100 --json results.json
+
+"""
+
+import argparse
+import json
+import sys
+import timeit
+
+from webexpythonsdk_async import dict_data_factory, immutable_data_factory, simple_data_factory
+from webexpythonsdk_async.models.cards import (
+    AdaptiveCard,
+    Choice,
+    ChoiceSet,
+    Column,
+    ColumnSet,
+    Container,
+    Fact,
+    FactSet,
+    Image,
+    OpenUrl,
+    Submit,
+    Text,
+    TextBlock,
+)
+
+
+FACTORIES = {
+    "immutable": immutable_data_factory,
+    "dict": dict_data_factory,
+    "simple": simple_data_factory,
+}
+
+OBJECTS = {
+    "message": {
+        "id": "Y2lzY29zcGFyazovL3VzL01FU1NBR0UvbWVzc2FnZS0x",
+        "roomId": "Y2lzY29zcGFyazovL3VzL1JPT00vcm9vbS1leGFtcGxl",
+        "roomType": "group",
+        "text": "Status update: deployment finished, all checks green.",
+        "markdown": "**Status update**: deployment finished, all checks green.",
+        "personId": "Y2lzY29zcGFyazovL3VzL1BFT1BMRS9ib3Q",
+        "personEmail": "bot@webex.bot",
+        "created": "2024-06-07T08:09:10.111Z",
+    },
+    "person": {
+        "id": "Y2lzY29zcGFyazovL3VzL1BFT1BMRS9wZXJzb24tMQ",
+        "emails": ["user@example.com"],
+        "displayName": "Example User",
+        "firstName": "Example",
+        "lastName": "User",
+        "orgId": "Y2lzY29zcGFyazovL3VzL09SR0FOSVpBVElPTi9leGFtcGxl",
+        "created": "2023-05-04T12:34:56.789Z",
+        "status": "active",
+        "type": "person",
+    },
+    "room": {
+        "id": "Y2lzY29zcGFyazovL3VzL1JPT00vcm9vbS1leGFtcGxl",
+        "title": "Example Room",
+        "type": "group",
+        "isLocked": False,
+        "lastActivity": "2024-06-07T08:09:10.111Z",
+        "creatorId": "Y2lzY29zcGFyazovL3VzL1BFT1BMRS9ib3Q",
+        "created": "2023-05-04T12:34:56.789Z",
+    },
+}
+
+
+def _time(function, number):
+    """Return the best per-call time (seconds) of `function`."""
+    return min(timeit.repeat(function, number=number, repeat=5)) / number
+
+
+def _read(obj):
+    # Dict models are read by key, the others by attribute
+    if isinstance(obj, dict):
+        return obj["id"], obj["created"]
+    return obj.id, obj.created
+
+
+def build_card(sections):
+    """Return an AdaptiveCard with `sections` repeated sections."""
+    body = [TextBlock("Weekly report", size=None, wrap=True)]
+    for i in range(sections):
+        body.append(
+            Container(
+                items=[
+                    TextBlock("Section {}".format(i), wrap=True),
+                    FactSet(facts=[Fact("Metric {}".format(j), str(j * i)) for j in range(5)]),
+                    ColumnSet(
+                        columns=[
+                            Column(items=[Image(url="https://example.com/{}.png".format(i))]),
+                            Column(items=[TextBlock("Details for section {}".format(i), wrap=True)]),
+                        ]
+                    ),
+                    Text("comment{}".format(i), placeholder="Comment"),
+                    ChoiceSet(
+                        id="choice{}".format(i),
+                        choices=[Choice("Option {}".format(j), str(j)) for j in range(3)],
+                    ),
+                ]
+            )
+        )
+    return AdaptiveCard(
+        body=body,
+        actions=[Submit(title="Send"), OpenUrl(url="https://example.com", title="Open")],
+    )
+
+
+def main(args):
+    """Run the model construction and card serialization benchmark."""
+    results = []
+    for model, json_data in OBJECTS.items():
+        for name, factory in FACTORIES.items():
+            seconds = _time(
+                lambda factory=factory, model=model, json_data=json_data: _read(factory(model, json_data)),
+                args.iterations,
+            )
+            results.append({"operation": "factory", "factory": name, "model": model, "seconds_per_object": seconds})
+            print("factory  {:<10} {:<8} {:>10.2f} us/object".format(name, model, seconds * 1e6))
+
+    for sections in args.card_sections:
+        card = build_card(sections)
+        number = max(1, args.iterations // (sections * 20))
+        card_bytes = len(card.to_json())
+        for operation, function in (("to_dict", card.to_dict), ("to_json", card.to_json)):
+            seconds = _time(function, number)
+            results.append(
+                {
+                    "operation": "card." + operation,
+                    "sections": sections,
+                    "card_bytes": card_bytes,
+                    "seconds_per_card": seconds,
+                }
+            )
+            print(
+                "card.{:<8} sections={:<5} {:>8} bytes {:>12.1f} us/card".format(
+                    operation,
+                    sections,
+                    card_bytes,
+                    seconds * 1e6,
+                )
+            )
+
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump({"benchmark": "models", "results": results}, json_file, indent=2)
+
+
+def parse_args(argv):
+    """Parse the benchmark command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000, help="Objects built per measurement.")
+    parser.add_argument("--card-sections", type=int, nargs="+", default=[1, 10, 100], help="Card sizes.")
+    parser.add_argument("--json", help="Write machine-readable results to this file.")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    main(parse_args(sys.argv[1:]))
@@ -0,0 +1,149 @@
+"""Benchmark paginated listing throughput against the fake Webex API.
+
+Seeds a FakeWebexTransport room with messages and lists them through
+`AsyncRestSession.get_items` (raw JSON items), `MessagesAPI.list` (items
+plus model construction) and `MessagesAPI.list(...).pages()` (models built
+a page at a time), with several page sizes, concurrent listings and
+pagination modes:
+
+  * default: one page request after the other;
+  * prefetch: the next page is fetched while the current one is consumed;
+  * stream: items are decoded incrementally from each response stream.
+
+Runs offline; the per-page latency simulates the Webex round trip.
+
+Usage (from the repository root, with the package installed by
+`pip install -e .`, or from the source tree by prefixing the commands with
+`PYTHONPATH=.`):
+    python benchmarks/bench_pagination.py
+    python benchmarks/bench_pagination.py --items 20000 --latency 0.02 --json results.json
+
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from webexpythonsdk_async import AsyncWebexAPI
+from webexpythonsdk_async.testing import FakeWebexTransport
+
+
+MODES = {
+    "default": {},
+    "prefetch": {"page_prefetch": 1},
+    "stream": {"stream_items": True},
+}
+
+
+def _seed(fake, items):
+    """Create a room holding `items` realistic messages; return its ID."""
+    room = fake.add("rooms", title="Benchmark Room")
+    fake.add_many(
+        "messages",
+        items,
+        roomId=room["id"],
+        roomType="group",
+        text="Status update #{i}: deployment finished, all checks green.",
+        markdown="**Status update #{i}**: deployment finished, all checks green.",
+        personEmail="bot@webex.bot",
+    )
+    return room["id"]
+
+
+async def _list_raw(api, room_id, page_size):
+    count = 0
+    async for _ in api._session.get_items("messages", params={"roomId": room_id, "max": page_size}):
+        count += 1
+    return count
+
+
+async def _list_models(api, room_id, page_size):
+    count = 0
+    async for _ in api.messages.list(roomId=room_id, max=page_size):
+        count += 1
+    return count
+
+
+async def _list_model_pages(api, room_id, page_size):
+    count = 0
+    async for page in api.messages.list(roomId=room_id, max=page_size).pages():
+        count += len(page)
+    return count
+
+
+LISTINGS = {"get_items": _list_raw, "messages.list": _list_models, "messages.pages": _list_model_pages}
+
+
+async def _measure(args, fake, room_id, listing, mode, page_size, concurrency):
+    api = AsyncWebexAPI(access_token="benchmark", transport=fake, **MODES[mode])
+    try:
+        start = time.perf_counter()
+        counts = await asyncio.gather(
+            *(LISTINGS[listing](api, room_id, page_size) for _ in range(concurrency)),
+        )
+        elapsed = time.perf_counter() - start
+    finally:
+        await api.aclose()
+    assert all(count == args.items for count in counts)
+    return sum(counts), elapsed
+
+
+async def main(args):
+    """Run the pagination benchmark against a FakeWebexTransport."""
+    fake = FakeWebexTransport(latency=args.latency)
+    room_id = _seed(fake, args.items)
+
+    results = []
+    for listing in LISTINGS:
+        for mode in args.modes:
+            for page_size in args.page_sizes:
+                for concurrency in args.concurrency:
+                    fake.reset_stats()
+                    items, elapsed = await _measure(args, fake, room_id, listing, mode, page_size, concurrency)
+                    results.append(
+                        {
+                            "listing": listing,
+                            "mode": mode,
+                            "page_size": page_size,
+                            "concurrency": concurrency,
+                            "items": items,
+                            "requests": fake.request_count,
+                            "seconds": round(elapsed, 4),
+                            "items_per_second": round(items / elapsed, 1),
+                        }
+                    )
+                    print(
+                        "{:<14} {:<9} page_size={:<5} concurrency={:<3} {:>12.1f} items/s".format(
+                            listing,
+                            mode,
+                            page_size,
+                            concurrency,
+                            items / elapsed,
+                        )
+                    )
+
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump(
+                {"benchmark": "pagination", "latency": args.latency, "results": results},
+                json_file,
+                indent=2,
+            )
+
+
+def parse_args(argv):
+    """Parse the benchmark command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=5000, help="Messages listed by each listing.")
+    parser.add_argument("--latency", type=float, default=0.005, help="Simulated latency per page in seconds.")
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[50, 100, 1000], help="Page sizes (max=).")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8], help="Concurrent listings.")
+    parser.add_argument("--modes", nargs="+", choices=sorted(MODES), default=list(MODES), help="Pagination modes.")
+    parser.add_argument("--json", help="Write machine-readable results to this file.")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args(sys.argv[1:])))
@@ -0,0 +1,106 @@
+"""Benchmark the per-request CPU overhead of AsyncRestSession.
+
+Sends sequential GET requests to a zero-latency FakeWebexTransport and
+reports the time per request of each layer, so the SDK's own overhead can
+be told apart from the HTTP client's:
+
+  * httpx: the bare httpx.AsyncClient sending the request;
+  * session.request: AsyncRestSession.request (gate, limiter, retries,
+    response checks);
+  * session.get: plus JSON decoding;
+  * rooms.get: plus the immutable model object;
+  * rooms.get+hooks: with a MetricsCollector registered as event hooks.
+
+Usage (from the repository root, with the package installed by
+`pip install -e .`, or from the source tree by prefixing the commands with
+`PYTHONPATH=.`):
+    python benchmarks/bench_request_overhead.py
+    python benchmarks/bench_request_overhead.py --requests 20000 --json results.json
+
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+import httpx
+
+from webexpythonsdk_async import AsyncWebexAPI, MetricsCollector
+from webexpythonsdk_async.testing import FakeWebexTransport
+
+
+async def _time_per_request(function, requests):
+    """Return the best per-call time (seconds) of an async function."""
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(requests):
+            await function()
+        elapsed = (time.perf_counter() - start) / requests
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+async def main(args):
+    """Run the per-request overhead benchmark against a FakeWebexTransport."""
+    fake = FakeWebexTransport()
+    room_id = fake.add("rooms", title="Benchmark Room", type="group", isLocked=False)["id"]
+    url = "{}rooms/{}".format(fake.base_url, room_id)
+
+    client = httpx.AsyncClient(transport=fake, headers={"Authorization": "Bearer benchmark"})
+    api = AsyncWebexAPI(access_token="benchmark", transport=fake)
+    metrics = MetricsCollector()
+    instrumented = AsyncWebexAPI(access_token="benchmark", transport=fake, event_hooks=metrics.event_hooks())
+
+    layers = {
+        "httpx": lambda: client.get(url),
+        "session.request": lambda: api._session.request("GET", url, 200),
+        "session.get": lambda: api._session.get(url),
+        "rooms.get": lambda: api.rooms.get(room_id),
+        "rooms.get+hooks": lambda: instrumented.rooms.get(room_id),
+    }
+
+    results = []
+    baseline = None
+    try:
+        for name, function in layers.items():
+            seconds = await _time_per_request(function, args.requests)
+            baseline = seconds if baseline is None else baseline
+            results.append(
+                {
+                    "layer": name,
+                    "microseconds_per_request": round(seconds * 1e6, 2),
+                    "overhead_microseconds": round((seconds - baseline) * 1e6, 2),
+                }
+            )
+            print(
+                "{:<18} {:>9.1f} us/request  (+{:.1f} us over httpx)".format(
+                    name,
+                    seconds * 1e6,
+                    (seconds - baseline) * 1e6,
+                )
+            )
+    finally:
+        await client.aclose()
+        await api.aclose()
+        await instrumented.aclose()
+
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump(
+                {"benchmark": "request_overhead", "requests": args.requests, "results": results}, json_file, indent=2
+            )
+
+
+def parse_args(argv):
+    """Parse the benchmark command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000, help="Requests per measurement.")
+    parser.add_argument("--json", help="Write machine-readable results to this file.")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args(sys.argv[1:])))
@@ -0,0 +1,74 @@
+"""Run every benchmark and merge the results into one JSON document.
+
+Runs each `bench_*.py` script in this directory with its default settings,
+offline, and writes a single JSON file tagged with the package version and
+platform, so results can be compared across releases.  Run it from the
+repository root, with the package installed by `pip install -e .`, or from
+the source tree by prefixing the commands with `PYTHONPATH=.`:
+
+    python benchmarks/run_suite.py --json results-0.1.3.json
+    python benchmarks/run_suite.py --only pagination models --json quick.json
+
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+
+from webexpythonsdk_async import __version__
+
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _benchmarks():
+    """Return the benchmark names (the `bench_<name>.py` scripts)."""
+    return sorted(
+        name[len("bench_") : -len(".py")]
+        for name in os.listdir(BENCHMARK_DIR)
+        if name.startswith("bench_") and name.endswith(".py")
+    )
+
+
+def main(args):
+    """Run the selected benchmarks and write the combined results."""
+    names = args.only or _benchmarks()
+    suite = {
+        "package_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "started": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "benchmarks": {},
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name in names:
+            print("== {} ==".format(name), flush=True)
+            output = os.path.join(directory, name + ".json")
+            script = os.path.join(BENCHMARK_DIR, "bench_{}.py".format(name))
+            subprocess.run([sys.executable, script, "--json", output], check=True)
+            with open(output) as json_file:
+                suite["benchmarks"][name] = json.load(json_file)
+
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump(suite, json_file, indent=2)
+    else:
+        print(json.dumps(suite, indent=2))
+
+
+def parse_args(argv):
+    """Parse the benchmark command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=_benchmarks(), help="Run only these benchmarks.")
+    parser.add_argument("--json", help="Write the merged results to this file.")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    main(parse_args(sys.argv[1:]))
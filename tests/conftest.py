@@ -0,0 +1,23 @@
+import pytest
+
+from webexpythonsdk_async.testing import FakeWebexTransport
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run the async tests on asyncio only."""
+    return "asyncio"
+
+
+@pytest.fixture
+def fake():
+    """A fresh in-process fake Webex API."""
+    return FakeWebexTransport()
+
+
+@pytest.fixture
+def room(fake):
+    """A room holding 250 messages, newest first "message 249"."""
+    room = fake.add("rooms", title="Test Room", type="group")
+    fake.add_many("messages", 250, roomId=room["id"], text="message {i}")
+    return room
@@ -0,0 +1,163 @@
+import asyncio
+import functools
+import time
+
+import pytest
+
+from webexpythonsdk_async import ApiError, AsyncWebexAPI, BatchExecutor, RateLimitError
+
+
+pytestmark = pytest.mark.anyio
+
+
+class _Calls(object):
+    """Calls sleeping for a given time, recording concurrency and cancellations."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.started = []
+        self.cancelled = []
+
+    async def call(self, value, delay=0.0, error=None):
+        self.started.append(value)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(value)
+            raise
+        finally:
+            self.active -= 1
+        if error is not None:
+            raise error
+        return value
+
+    def partial(self, value, delay=0.0, error=None):
+        return functools.partial(self.call, value, delay, error)
+
+
+async def test_results_are_in_the_order_of_the_calls():
+    calls = _Calls()
+    executor = BatchExecutor(concurrency=3)
+    results = await executor.run(calls.partial(i, delay=0.01 * (10 - i)) for i in range(10))
+
+    assert [(result.index, result.value) for result in results] == [(i, i) for i in range(10)]
+    assert all(result.ok for result in results)
+    assert calls.peak == 3
+    assert (executor.total, executor.completed, executor.failed) == (10, 10, 0)
+    assert not executor.running
+
+
+async def test_awaitables_and_callables_can_be_mixed():
+    calls = _Calls()
+    results = await BatchExecutor().run([calls.call(1), calls.partial(2)])
+
+    assert [result.value for result in results] == [1, 2]
+
+
+async def test_a_failing_call_does_not_stop_the_batch(fake):
+    rooms = [fake.add("rooms", title="room {}".format(i))["id"] for i in range(4)]
+    rooms[1] = rooms[3] = "missing"
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake) as api:
+        results = await api.batch([functools.partial(api.rooms.get, room_id) for room_id in rooms], concurrency=2)
+
+    assert [result.ok for result in results] == [True, False, True, False]
+    assert results[0].value.id == rooms[0]
+    assert isinstance(results[1].error, ApiError) and results[1].error.status_code == 404
+    assert not results[1].cancelled
+
+
+async def test_progress_is_reported_for_every_call():
+    calls = _Calls()
+    progress = []
+
+    def on_progress(completed, total, result):
+        progress.append((completed, total, result.index, result.ok))
+        raise ValueError("A failing callback does not stop the batch.")
+
+    executor = BatchExecutor(concurrency=1, on_progress=on_progress)
+    await executor.run([calls.partial(0), calls.partial(1, error=KeyError(1)), calls.partial(2)])
+
+    assert progress == [(1, 3, 0, True), (2, 3, 1, False), (3, 3, 2, True)]
+    assert executor.failed == 1
+
+
+async def test_cancel_stops_the_calls_in_flight_and_pending():
+    calls = _Calls()
+
+    def on_progress(completed, total, result):
+        executor.cancel()
+
+    executor = BatchExecutor(concurrency=2, on_progress=on_progress)
+    results = await executor.run([calls.partial(0), calls.partial(1, delay=10), calls.partial(2), calls.call(3)])
+
+    assert results[0].ok
+    assert [result.cancelled for result in results] == [False, True, True, True]
+    assert calls.started == [0, 1]
+    assert calls.cancelled == [1]
+    assert executor.completed == 1
+
+
+async def test_cancelling_the_awaiting_task_cancels_the_batch(fake):
+    calls = _Calls()
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake) as api:
+        task = asyncio.ensure_future(api.batch([calls.partial(i, delay=10) for i in range(5)], concurrency=2))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert sorted(calls.cancelled) == [0, 1]
+    assert calls.active == 0
+
+
+async def test_a_stream_yields_results_in_completion_order():
+    calls = _Calls()
+    executor = BatchExecutor(concurrency=3)
+    indexes = [
+        result.index async for result in executor.stream(calls.partial(i, delay=0.01 * (3 - i)) for i in range(3))
+    ]
+
+    assert indexes == [2, 1, 0]
+
+
+async def test_a_rate_limit_error_holds_the_rest_of_the_batch(fake):
+    fake.fail_next(1, status_code=429, retry_after=1)
+    async with AsyncWebexAPI(
+        access_token="fake-token", transport=fake, wait_on_rate_limit=False, rate_limit_jitter=0
+    ) as api:
+        start = time.monotonic()
+        results = await api.batch([api.people.me for _ in range(3)], concurrency=1)
+        elapsed = time.monotonic() - start
+
+    assert isinstance(results[0].error, RateLimitError)
+    assert results[1].ok and results[2].ok
+    assert elapsed >= 1
+
+
+async def test_an_executor_runs_one_batch_at_a_time():
+    calls = _Calls()
+    executor = BatchExecutor(concurrency=2)
+    first = asyncio.ensure_future(executor.run([calls.partial(i, delay=0.02) for i in range(4)]))
+    await asyncio.sleep(0)
+    assert executor.running
+
+    with pytest.raises(RuntimeError):
+        await executor.run([calls.call(10)])
+    with pytest.raises(RuntimeError):
+        await anext(executor.stream([calls.partial(11)]))
+
+    results = await first
+    assert [result.value for result in results] == [0, 1, 2, 3]
+    assert (executor.total, executor.completed) == (4, 4)
+    assert calls.started == [0, 1, 2, 3]
+    # The executor can run another batch once the first one is complete
+    assert [result.value for result in await executor.run([calls.partial(12)])] == [12]
+
+
+@pytest.mark.parametrize("kwargs, error", [({"concurrency": 0}, ValueError), ({"on_progress": 1}, TypeError)])
+def test_invalid_executors_are_rejected(kwargs, error):
+    with pytest.raises(error):
+        BatchExecutor(**kwargs)
@@ -0,0 +1,73 @@
+import pytest
+
+from webexpythonsdk_async import ApiError, AsyncWebexAPI
+
+
+pytestmark = pytest.mark.anyio
+
+
+def _room_id(target):
+    return target if isinstance(target, str) else target.get("roomId")
+
+
+async def _broadcast(api, targets, **kwargs):
+    return [result async for result in api.messages.broadcast(targets, **kwargs)]
+
+
+async def test_every_target_gets_the_message(fake):
+    rooms = [fake.add("rooms", title="room {}".format(i))["id"] for i in range(5)]
+    targets = rooms + [{"toPersonEmail": "someone@example.com"}]
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake) as api:
+        results = await _broadcast(api, targets, markdown="**hello**", concurrency=3)
+
+    assert sorted(result.index for result in results) == list(range(6))
+    assert all(result.ok for result in results)
+    assert fake.requests[("POST", "messages")] == 6
+
+    by_index = {result.index: result.value for result in results}
+    assert [by_index[i].roomId for i in range(5)] == rooms
+    assert by_index[5].toPersonEmail == "someone@example.com"
+    for message in fake.collections["messages"].values():
+        assert message["markdown"] == "**hello**"
+
+
+async def test_messages_to_the_same_room_keep_their_order(fake):
+    fake.latency = (0.0, 0.02)
+    first, second = fake.add("rooms", title="first")["id"], fake.add("rooms", title="second")["id"]
+    targets = [first, second, first, {"roomId": first, "parentId": "parent"}, second, first]
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake) as api:
+        results = await _broadcast(api, targets, text="hello", concurrency=4)
+
+    index_of = {result.value.id: result.index for result in results}
+    messages = fake.collections["messages"].values()
+    for room_id in (first, second):
+        sent = [index_of[message["id"]] for message in messages if message["roomId"] == room_id]
+        assert sent == [i for i, target in enumerate(targets) if _room_id(target) == room_id]
+
+
+async def test_a_failed_delivery_does_not_stop_the_broadcast(fake):
+    rooms = [fake.add("rooms", title="room {}".format(i))["id"] for i in range(3)]
+    fake.fail_next(1, status_code=400)
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake) as api:
+        results = await _broadcast(api, rooms, text="hello", concurrency=1)
+
+    assert [result.index for result in results] == [0, 1, 2]
+    assert isinstance(results[0].error, ApiError)
+    assert results[1].ok and results[2].ok
+
+
+@pytest.mark.parametrize(
+    "targets, kwargs",
+    [
+        ([{"roomId": "a", "toPersonId": "b"}], {}),
+        ([{"personId": "a"}], {}),
+        (["a"], {"roomId": "b"}),
+        (["a"], {"files": ["/etc/hosts"]}),
+    ],
+)
+async def test_invalid_broadcasts_are_rejected_before_sending(fake, targets, kwargs):
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake) as api:
+        with pytest.raises(ValueError):
+            await _broadcast(api, targets, text="hello", **kwargs)
+
+    assert fake.request_count == 0
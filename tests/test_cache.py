@@ -0,0 +1,105 @@
+import asyncio
+
+import httpx
+import pytest
+
+from webexpythonsdk_async import AsyncWebexAPI, ResponseCache
+
+
+pytestmark = pytest.mark.anyio
+
+
+class _SlowGets(httpx.AsyncBaseTransport):
+    """Delay GET responses after they have been answered by the fake."""
+
+    def __init__(self, transport, delay):
+        self.transport = transport
+        self.delay = delay
+
+    async def handle_async_request(self, request):
+        response = await self.transport.handle_async_request(request)
+        if request.method == "GET":
+            await asyncio.sleep(self.delay)
+        return response
+
+
+def _api(transport, cache):
+    return AsyncWebexAPI(access_token="fake-token", transport=transport, cache=cache)
+
+
+async def test_fresh_entries_are_served_without_a_request(fake):
+    cache = ResponseCache(endpoints={"rooms": 60})
+    room = fake.add("rooms", title="Cached")
+    async with _api(fake, cache) as api:
+        for _ in range(3):
+            assert (await api.rooms.get(room["id"])).title == "Cached"
+
+    assert fake.requests[("GET", "rooms/" + room["id"])] == 1
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+async def test_uncached_endpoint_families_are_not_stored(fake):
+    cache = ResponseCache(endpoints={"rooms": 60})
+    async with _api(fake, cache) as api:
+        await api.people.me()
+        await api.people.me()
+
+    assert fake.requests[("GET", "people/me")] == 2
+    assert len(cache) == 0
+
+
+async def test_expired_entries_are_revalidated(fake):
+    cache = ResponseCache(endpoints={"rooms": 0})
+    room = fake.add("rooms", title="Cached")
+    async with _api(fake, cache) as api:
+        await api.rooms.get(room["id"])
+        await api.rooms.get(room["id"])
+
+    assert fake.requests[("GET", "rooms/" + room["id"])] == 2
+    assert cache.revalidations == 1
+
+
+async def test_writes_invalidate_the_resource(fake):
+    cache = ResponseCache(endpoints={"rooms": 60})
+    room = fake.add("rooms", title="Before")
+    async with _api(fake, cache) as api:
+        await api.rooms.get(room["id"])
+        await api.rooms.update(room["id"], title="After")
+        assert (await api.rooms.get(room["id"])).title == "After"
+
+        await api.rooms.delete(room["id"])
+        assert len(cache) == 0
+
+
+async def test_get_in_flight_during_a_write_is_not_cached(fake):
+    cache = ResponseCache(endpoints={"rooms": 60})
+    room = fake.add("rooms", title="Before")
+    async with _api(_SlowGets(fake, 0.05), cache) as api:
+        stale = asyncio.ensure_future(api.rooms.get(room["id"]))
+        await asyncio.sleep(0.01)
+        await api.rooms.update(room["id"], title="After")
+
+        # The in-flight GET returns the body it fetched, but doesn't cache it
+        assert (await stale).title == "Before"
+        assert len(cache) == 0
+        assert (await api.rooms.get(room["id"])).title == "After"
+
+
+def test_generation_changes_with_parent_invalidation():
+    cache = ResponseCache(endpoints={"rooms": 60}, max_entries=2)
+    url = "https://webexapis.com/v1/rooms/abc"
+    generation = cache.generation(url)
+
+    cache.invalidate("https://webexapis.com/v1/rooms/other")
+    assert cache.generation(url) == generation
+
+    cache.invalidate("https://webexapis.com/v1/rooms")
+    assert cache.generation(url) != generation
+
+    # Forgotten generations still void older captures
+    generation = cache.generation(url)
+    cache.invalidate(url)
+    for index in range(5):
+        cache.invalidate("https://webexapis.com/v1/people/{}".format(index))
+    cache.store("key", url, {}, 60, generation=generation)
+    assert len(cache) == 0
@@ -0,0 +1,163 @@
+import asyncio
+import json
+import types
+
+import httpx
+import pytest
+
+from webexpythonsdk_async import AsyncWebexAPI, request_headers
+from webexpythonsdk_async.testing import Cassette, CassetteError, RecordingTransport, ReplayTransport
+from webexpythonsdk_async.testing import cassettes
+
+
+pytestmark = pytest.mark.anyio
+
+URL = "https://webexapis.com/v1/rooms"
+
+
+class _Clock(object):
+    """A monotonic clock advanced only by the sleeps it is asked for."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.now += max(0.0, delay)
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replay cassettes on a virtual clock."""
+    clock = _Clock()
+    monkeypatch.setattr(cassettes, "time", clock)
+    monkeypatch.setattr(cassettes, "asyncio", types.SimpleNamespace(sleep=clock.sleep))
+    return clock
+
+
+def _api(transport):
+    return AsyncWebexAPI(access_token="fake-token", transport=transport)
+
+
+def _interaction(offset, elapsed, url=URL, body='{"items": []}'):
+    return {
+        "request": {"method": "GET", "url": url, "headers": []},
+        "response": {
+            "status_code": 200,
+            "headers": [["content-type", "application/json"]],
+            "body": body,
+            "encoding": "utf-8",
+        },
+        "offset": offset,
+        "elapsed": elapsed,
+    }
+
+
+async def _response_times(clock, transport, urls, pause=0.0):
+    start = clock.now
+    times = []
+    async with httpx.AsyncClient(transport=transport) as client:
+        for url in urls:
+            response = await client.get(url)
+            response.raise_for_status()
+            times.append(clock.now - start)
+            await clock.sleep(pause)
+    return times
+
+
+async def test_a_recorded_cassette_replays_without_the_server(fake, room, tmp_path):
+    recorder = RecordingTransport(fake)
+    async with _api(recorder) as api:
+        recorded = [message.text async for message in api.messages.list(roomId=room["id"], max=100)]
+        recorded_room = await api.rooms.get(room["id"])
+    path = str(tmp_path / "cassette.json")
+    recorder.cassette.save(path)
+    assert len(recorder.cassette) == 4
+
+    fake.reset_stats()
+    replay = ReplayTransport(path)
+    async with _api(replay) as api:
+        replayed = [message.text async for message in api.messages.list(roomId=room["id"], max=100)]
+        replayed_room = await api.rooms.get(room["id"])
+
+    assert replayed == recorded
+    assert len(replayed) == 250
+    assert replayed_room.title == recorded_room.title == "Test Room"
+    assert replay.replayed == 4
+    assert replay.remaining == 0
+    assert fake.request_count == 0
+
+
+async def test_access_tokens_and_cookies_are_not_recorded(fake, room, tmp_path):
+    recorder = RecordingTransport(fake)
+    async with _api(recorder) as api:
+        with request_headers({"Cookie": "session=secret-cookie", "timezone": "UTC"}):
+            await api.rooms.get(room["id"])
+    path = tmp_path / "cassette.json"
+    recorder.cassette.save(str(path))
+
+    headers = dict(json.loads(path.read_text())["interactions"][0]["request"]["headers"])
+    assert "timezone" in headers
+    assert not {"authorization", "cookie"} & {name.lower() for name in headers}
+    assert "fake-token" not in path.read_text()
+    assert "secret-cookie" not in path.read_text()
+
+
+async def test_used_up_interactions_raise_unless_repeated(clock):
+    cassette = Cassette([_interaction(0.0, 0.1, body='{"items": [1]}')])
+
+    async with httpx.AsyncClient(transport=ReplayTransport(cassette)) as client:
+        assert (await client.get(URL)).json() == {"items": [1]}
+        with pytest.raises(CassetteError):
+            await client.get(URL)
+        with pytest.raises(CassetteError):
+            await client.get(URL + "?max=1")
+
+    replay = ReplayTransport(cassette, repeat=True)
+    async with httpx.AsyncClient(transport=replay) as client:
+        bodies = [(await client.get(URL)).json() for _ in range(3)]
+    assert bodies == [{"items": [1]}] * 3
+    assert replay.replayed == 3
+
+
+@pytest.mark.parametrize(
+    "timing, expected",
+    [
+        ("none", [0.0, 0.0]),
+        ("compressed", [0.125, 1.125]),
+        ("original", [0.5, 4.5]),
+    ],
+)
+async def test_timing_modes_follow_the_recorded_schedule(clock, timing, expected):
+    cassette = Cassette([_interaction(0.0, 0.5), _interaction(4.0, 0.5, url=URL + "/2")])
+    replay = ReplayTransport(cassette, timing=timing, speed=4)
+
+    times = await _response_times(clock, replay, [URL, URL + "/2"])
+
+    assert times == pytest.approx(expected)
+
+
+async def test_late_and_repeated_requests_only_wait_for_the_response_time(clock):
+    cassette = Cassette([_interaction(0.0, 0.5), _interaction(1.0, 0.5, url=URL + "/2")])
+    replay = ReplayTransport(cassette, timing="original", repeat=True)
+
+    times = await _response_times(clock, replay, [URL, URL + "/2", URL + "/2"], pause=3.0)
+
+    assert times == pytest.approx([0.5, 4.0, 7.5])
+
+
+@pytest.mark.parametrize(
+    "kwargs, error",
+    [
+        ({"timing": "fast"}, ValueError),
+        ({"speed": 0}, ValueError),
+        ({"speed": "2"}, TypeError),
+        ({"repeat": 1}, TypeError),
+    ],
+)
+def test_invalid_replay_options_are_rejected(kwargs, error):
+    with pytest.raises(error):
+        ReplayTransport(Cassette(), **kwargs)
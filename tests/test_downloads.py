@@ -0,0 +1,205 @@
+import asyncio
+import io
+import os
+import re
+
+import httpx
+import pytest
+
+from webexpythonsdk_async import ApiError, AsyncWebexAPI
+from webexpythonsdk_async.downloads import download_file
+
+
+pytestmark = pytest.mark.anyio
+
+
+DATA = bytes(range(256)) * 400
+
+
+class _Wrapper(httpx.AsyncBaseTransport):
+    """Pass requests on to the fake, recording them and their concurrency."""
+
+    def __init__(self, transport, delay=0.0):
+        self.transport = transport
+        self.delay = delay
+        self.requests = []
+        self.active = 0
+        self.peak = 0
+
+    async def handle_async_request(self, request):
+        self.requests.append(request)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            response = await self.transport.handle_async_request(request)
+        finally:
+            self.active -= 1
+        return self.rewrite(response)
+
+    def rewrite(self, response):
+        return response
+
+
+class _UnknownTotal(_Wrapper):
+    """Answer Range requests without the total size of the file."""
+
+    def rewrite(self, response):
+        if "Content-Range" in response.headers:
+            response.headers["Content-Range"] = re.sub(r"/\d+$", "/*", response.headers["Content-Range"])
+        return response
+
+
+class _Truncating(_Wrapper):
+    """Cut the first response body short, without a connection error."""
+
+    def __init__(self, transport, length):
+        super().__init__(transport)
+        self.length = length
+
+    def rewrite(self, response):
+        if self.length is None:
+            return response
+        length, self.length = self.length, None
+        content = response.read()[:length]
+        return httpx.Response(response.status_code, headers=response.headers, content=content)
+
+
+async def _download(transport, url, destination, **kwargs):
+    async with AsyncWebexAPI(access_token="fake-token", transport=transport) as api:
+        result = await download_file(api._session, url, destination, **kwargs)
+        assert api._session.in_flight == 0
+    return result
+
+
+async def test_a_file_is_saved_under_its_name(fake, tmp_path):
+    url = fake.add_content("report.pdf", DATA, content_type="application/pdf")
+    progress = []
+    result = await _download(fake, url, str(tmp_path), on_progress=lambda size, total: progress.append((size, total)))
+
+    assert result.path == os.path.join(str(tmp_path), "report.pdf")
+    assert (tmp_path / "report.pdf").read_bytes() == DATA
+    assert (result.filename, result.content_type, result.size) == ("report.pdf", "application/pdf", len(DATA))
+    assert (result.resumes, result.ranges) == (0, 1)
+    assert progress[-1] == (len(DATA), len(DATA))
+
+
+async def test_an_interrupted_download_is_resumed(fake):
+    fake.chunk_size = 4096
+    fake.interrupt_next(2, after_bytes=30000)
+    url = fake.add_content("file.bin", DATA)
+    wrapper = _Wrapper(fake)
+    output = io.BytesIO()
+    result = await _download(wrapper, url, output, chunk_size=4096)
+
+    assert output.getvalue() == DATA
+    assert result.resumes == 2
+    # Each resume starts after the last whole chunk written
+    ranges = [request.headers.get("Range") for request in wrapper.requests]
+    assert ranges == [None, "bytes=28672-102399", "bytes=57344-102399"]
+
+
+async def test_a_truncated_body_is_resumed(fake):
+    url = fake.add_content("file.bin", DATA)
+    wrapper = _Truncating(fake, length=1000)
+    output = io.BytesIO()
+    result = await _download(wrapper, url, output)
+
+    assert output.getvalue() == DATA
+    assert result.resumes == 1
+    assert wrapper.requests[-1].headers["Range"] == "bytes=1000-102399"
+
+
+async def test_a_download_failing_too_often_is_removed(fake, tmp_path):
+    fake.chunk_size = 4096
+    fake.interrupt_next(3, after_bytes=5000)
+    url = fake.add_content("file.bin", DATA)
+    with pytest.raises(httpx.ReadError):
+        await _download(fake, url, str(tmp_path), max_resumes=2)
+
+    assert os.listdir(str(tmp_path)) == []
+
+
+async def test_ranges_are_fetched_in_parallel(fake, tmp_path):
+    fake.chunk_size = 4096
+    fake.interrupt_next(1, after_bytes=5000)
+    url = fake.add_content("file.bin", DATA)
+    wrapper = _Wrapper(fake, delay=0.01)
+    result = await _download(wrapper, url, str(tmp_path), parallel_ranges=3, range_size=10000)
+
+    assert (tmp_path / "file.bin").read_bytes() == DATA
+    assert result.ranges == 4
+    assert result.resumes == 1
+    # The probe's range is one of the `parallel_ranges`
+    assert wrapper.peak == 3
+
+
+async def test_ranges_are_fetched_in_order_into_a_stream(fake):
+    url = fake.add_content("file.bin", DATA)
+
+    class Stream(io.BytesIO):
+        def seekable(self):
+            return False
+
+    output = Stream()
+    result = await _download(fake, url, output, parallel_ranges=3, range_size=10000)
+
+    assert output.getvalue() == DATA
+    assert result.ranges == 2
+
+
+@pytest.mark.parametrize("size", [999, 1000, 1024, 5000])
+async def test_files_of_unknown_size_are_downloaded_to_the_end(fake, size):
+    url = fake.add_content("file.bin", DATA[:size])
+    output = io.BytesIO()
+    result = await _download(_UnknownTotal(fake), url, output, parallel_ranges=4, range_size=1000)
+
+    assert output.getvalue() == DATA[:size]
+    assert result.size == size
+
+
+async def test_other_hosts_are_not_sent_the_access_token(fake):
+    url = fake.add_content("file.bin", DATA).replace("webexapis.com", "files.example.com")
+    wrapper = _Wrapper(fake)
+    async with AsyncWebexAPI(access_token="fake-token", transport=wrapper) as api:
+        with pytest.raises(ApiError) as error:
+            await download_file(api._session, url, io.BytesIO())
+        assert api._session.in_flight == 0
+
+    # The fake only serves authorized requests
+    assert error.value.status_code == 401
+    assert "Authorization" not in wrapper.requests[0].headers
+
+
+async def test_downloads_from_other_hosts_count_as_in_flight(fake):
+    fake.chunk_size = 4096
+    url = fake.add_content("file.bin", DATA).replace("webexapis.com", "files.example.com")
+
+    class SignedLinks(_Wrapper):
+        # Stand in for a host authorizing its own (e.g. pre-signed) links
+        async def handle_async_request(self, request):
+            request.headers["Authorization"] = "Bearer signed-link"
+            return await super().handle_async_request(request)
+
+    async with AsyncWebexAPI(access_token="fake-token", transport=SignedLinks(fake)) as api:
+        in_flight = []
+        result = await download_file(
+            api._session,
+            url,
+            io.BytesIO(),
+            chunk_size=4096,
+            on_progress=lambda size, total: in_flight.append(api._session.in_flight),
+        )
+        assert api._session.in_flight == 0
+
+    assert result.size == len(DATA)
+    assert set(in_flight) == {1}
+
+
+async def test_missing_files_raise_api_errors(fake, tmp_path):
+    url = fake.add_content("file.bin", DATA).replace("/contents/", "/contents/missing")
+    with pytest.raises(ApiError) as error:
+        await _download(fake, url, str(tmp_path))
+
+    assert error.value.status_code == 404
+    assert os.listdir(str(tmp_path)) == []
@@ -0,0 +1,105 @@
+import pytest
+
+from webexpythonsdk_async import AsyncWebexAPI
+from webexpythonsdk_async.generator_containers import GeneratorContainer, generator_container
+
+
+pytestmark = pytest.mark.anyio
+
+
+TEXTS = ["message {}".format(i) for i in reversed(range(250))]
+
+
+def _api(fake, **kwargs):
+    return AsyncWebexAPI(access_token="fake-token", transport=fake, **kwargs)
+
+
+async def _texts(generator):
+    return [message.text async for message in generator]
+
+
+@pytest.mark.parametrize(
+    "item, requests",
+    [
+        (slice(5), 1),
+        (slice(10, 20), 1),
+        (slice(0, 300), 1),
+        (slice(3, 40, 4), 1),
+        (slice(5, 5), 0),
+        (slice(None, None, 50), 5),
+        (slice(240, None), 5),
+    ],
+)
+async def test_slices_fetch_only_the_pages_they_need(fake, room, item, requests):
+    async with _api(fake, page_prefetch=3) as api:
+        texts = await _texts(api.messages.list(roomId=room["id"])[item])
+
+    assert texts == TEXTS[item]
+    assert fake.requests[("GET", "messages")] == requests
+
+
+async def test_an_explicit_max_is_not_changed_by_slicing(fake, room):
+    async with _api(fake, page_prefetch=0) as api:
+        texts = await _texts(api.messages.list(roomId=room["id"], max=3)[:5])
+
+    assert texts == TEXTS[:5]
+    assert fake.requests[("GET", "messages")] == 2
+
+
+async def test_a_container_can_be_iterated_again(fake, room):
+    async with _api(fake) as api:
+        messages = api.messages.list(roomId=room["id"])
+        first, second = await _texts(messages), await _texts(messages)
+        sliced = messages[:10]
+        assert await _texts(sliced) == TEXTS[:10]
+        assert await _texts(messages[:10]) == TEXTS[:10]
+
+    assert first == second == TEXTS
+    assert fake.requests[("GET", "messages")] == 12
+
+
+@pytest.mark.parametrize(
+    "item, error",
+    [
+        (0, IndexError),
+        ("a", IndexError),
+        (slice(-1, None), ValueError),
+        (slice(None, -1), ValueError),
+        (slice(None, None, 0), ValueError),
+        (slice(None, None, -1), ValueError),
+    ],
+)
+async def test_invalid_items_are_rejected(fake, room, item, error):
+    async with _api(fake) as api:
+        with pytest.raises(error):
+            api.messages.list(roomId=room["id"])[item]
+
+    assert fake.request_count == 0
+
+
+async def test_async_generator_functions_are_containerized():
+    @generator_container
+    async def count(stop, max=10):
+        for i in range(min(stop, max)):
+            yield i
+
+    numbers = count(100)
+    assert isinstance(numbers, GeneratorContainer)
+    assert [i async for i in numbers] == list(range(10))
+    assert [i async for i in numbers[2:6]] == [2, 3, 4, 5]
+    assert repr(numbers) == "<GeneratorContainer count(stop=100, max=10)>"
+    with pytest.raises(TypeError):
+        numbers.pages()
+
+
+def test_coroutine_functions_and_bad_arguments_are_rejected():
+    async def coroutine():
+        pass
+
+    async def generator(a):
+        yield a
+
+    with pytest.raises(TypeError):
+        GeneratorContainer(coroutine)
+    with pytest.raises(TypeError):
+        GeneratorContainer(generator, 1, 2)
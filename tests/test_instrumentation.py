@@ -0,0 +1,157 @@
+import logging
+
+import pytest
+
+from webexpythonsdk_async import ApiError, AsyncWebexAPI, EventHooks, MetricsCollector, RequestEvent, RetryPolicy
+from webexpythonsdk_async.instrumentation import Histogram
+
+
+pytestmark = pytest.mark.anyio
+
+
+def _event(**fields):
+    event = RequestEvent("GET", "https://webexapis.com/v1/rooms", "rooms", 1)
+    for name, value in fields.items():
+        setattr(event, name, value)
+    return event
+
+
+def test_hooks_are_called_in_registration_order():
+    calls = []
+    hooks = EventHooks(
+        {
+            "on_request": lambda event: calls.append(("first", event.attempt)),
+            "on_response": [lambda event: calls.append(("second", event.status_code))],
+        }
+    )
+    hooks.add("on_request", lambda event: calls.append(("third", event.attempt)))
+
+    hooks.emit("on_request", _event())
+    hooks.emit("on_response", _event(status_code=200))
+    hooks.emit("on_retry", _event())
+
+    assert calls == [("first", 1), ("third", 1), ("second", 200)]
+
+
+def test_hooks_are_active_while_any_is_registered():
+    def callback(event):
+        pass
+
+    hooks = EventHooks()
+    assert not hooks
+    hooks.add("on_page", callback)
+    assert hooks
+    hooks.remove("on_page", callback)
+    assert not hooks
+
+
+def test_invalid_hooks_are_rejected():
+    with pytest.raises(ValueError):
+        EventHooks({"on_error": print})
+    with pytest.raises(TypeError):
+        EventHooks({"on_request": "print"})
+    with pytest.raises(TypeError):
+        EventHooks([print])
+
+
+def test_hook_exceptions_are_logged_and_isolated(caplog):
+    def broken(event):
+        raise RuntimeError("broken hook")
+
+    calls = []
+    hooks = EventHooks({"on_response": [broken, calls.append]})
+
+    with caplog.at_level(logging.ERROR, logger="webexpythonsdk_async.instrumentation"):
+        hooks.emit("on_response", _event(status_code=200))
+
+    assert len(calls) == 1
+    assert "on_response" in caplog.text
+    assert "broken hook" in caplog.text
+
+
+async def test_failing_hooks_do_not_fail_requests(fake):
+    def broken(event):
+        raise RuntimeError("broken hook")
+
+    room = fake.add("rooms", title="Hooked")
+    hooks = {name: broken for name in ("on_request", "on_response")}
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake, event_hooks=hooks) as api:
+        assert (await api.rooms.get(room["id"])).title == "Hooked"
+
+
+def test_histogram_buckets_are_inclusive_upper_bounds():
+    histogram = Histogram(buckets=(1.0, 0.1, 0.5))
+    for value in (0.05, 0.1, 0.3, 0.5, 0.7, 2.0):
+        histogram.observe(value)
+
+    assert histogram.buckets == (0.1, 0.5, 1.0)
+    assert histogram.counts == [2, 2, 1, 1]
+    assert histogram.cumulative_counts() == [(0.1, 2), (0.5, 4), (1.0, 5), (float("inf"), 6)]
+    assert histogram.count == 6
+    assert histogram.sum == pytest.approx(3.65)
+
+
+@pytest.mark.parametrize("q, bound", [(0.1, 0.1), (0.5, 0.5), (0.8, 1.0), (0.99, float("inf")), (1, float("inf"))])
+def test_histogram_quantiles_are_bucket_bounds(q, bound):
+    histogram = Histogram(buckets=(0.1, 0.5, 1.0))
+    for value in (0.05, 0.1, 0.3, 0.5, 0.7, 2.0):
+        histogram.observe(value)
+
+    assert histogram.quantile(q) == bound
+
+
+def test_empty_histograms_have_no_quantiles():
+    assert Histogram().quantile(0.5) is None
+
+
+async def test_metrics_are_collected_per_method_and_endpoint(fake):
+    room = fake.add("rooms", title="Measured")
+    fake.add_many("messages", 120, roomId=room["id"], text="message {i}")
+    metrics = MetricsCollector(buckets=(10.0,))
+    async with AsyncWebexAPI(
+        access_token="fake-token",
+        transport=fake,
+        event_hooks=metrics.event_hooks(),
+        retry_policy=RetryPolicy(backoff_factor=0.001, jitter=False),
+    ) as api:
+        await api.rooms.get(room["id"])
+        fake.fail_next(1, status_code=503)
+        await api.rooms.get(room["id"])
+        await api.rooms.create("New room")
+        with pytest.raises(ApiError):
+            await api.rooms.get("missing")
+        assert len([message async for message in api.messages.list(roomId=room["id"])]) == 120
+
+    snapshot = {(stats["method"], stats["endpoint"]): stats for stats in metrics.snapshot()}
+    assert sorted(snapshot) == [("GET", "messages"), ("GET", "rooms/missing"), ("GET", "rooms/{id}"), ("POST", "rooms")]
+
+    rooms = snapshot["GET", "rooms/{id}"]
+    assert rooms["requests"] == {"200": 2, "503": 1}
+    assert rooms["retries"] == {"503": 1}
+    assert rooms["latency"]["count"] == 3
+    assert rooms["latency"]["p99"] == 10.0
+    assert rooms["bytes_received"] > 0
+    assert rooms["pages"] == 0
+
+    assert snapshot["POST", "rooms"]["requests"] == {"200": 1}
+    assert snapshot["POST", "rooms"]["bytes_sent"] > 0
+    assert snapshot["GET", "rooms/missing"]["requests"] == {"404": 1}
+    assert snapshot["GET", "messages"]["requests"] == {"200": 3}
+    assert snapshot["GET", "messages"]["pages"] == 3
+
+
+def test_rate_limits_are_counted_with_their_retry_after():
+    metrics = MetricsCollector()
+    metrics.on_rate_limit(_event(retry_after=2.0))
+    metrics.on_rate_limit(_event(retry_after=None))
+    metrics.on_request(_event(gate_wait=2.5, limiter_wait=0.25, bytes_sent=10))
+
+    stats = metrics.stats("GET", "rooms")
+    assert stats.rate_limits == 2
+    assert stats.retry_after_seconds == 2.0
+    assert stats.gate_wait_seconds == 2.5
+    assert stats.limiter_wait_seconds == 0.25
+    assert stats.bytes_sent == 10
+
+    metrics.reset()
+    assert metrics.snapshot() == []
@@ -0,0 +1,104 @@
+import httpx
+import pytest
+
+from webexpythonsdk_async import AsyncWebexAPI, JSONBackend, get_json_backend, set_json_backend
+from webexpythonsdk_async import json_backends
+from webexpythonsdk_async.json_backends import OrjsonJSONBackend, StdlibJSONBackend
+from webexpythonsdk_async.utils import extract_and_parse_json
+
+
+BACKENDS = [
+    "json",
+    pytest.param("orjson", marks=pytest.mark.skipif(json_backends.orjson is None, reason="orjson is not installed")),
+]
+
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    """Restore the active JSON backend after each test."""
+    backend = get_json_backend()
+    yield
+    set_json_backend(backend)
+
+
+@pytest.mark.skipif(json_backends.orjson is None, reason="orjson is not installed")
+def test_orjson_is_the_default_when_installed():
+    assert isinstance(json_backends._default_backend(), OrjsonJSONBackend)
+
+
+def test_the_standard_library_is_the_fallback(monkeypatch):
+    monkeypatch.setattr(json_backends, "orjson", None)
+
+    assert isinstance(json_backends._default_backend(), StdlibJSONBackend)
+    with pytest.raises(ImportError):
+        set_json_backend("orjson")
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_backends_are_selected_by_name(name):
+    backend = set_json_backend(name)
+
+    assert backend.name == name
+    assert get_json_backend() is backend
+
+
+def test_invalid_backends_are_rejected():
+    with pytest.raises(ValueError):
+        set_json_backend("simplejson")
+    with pytest.raises(TypeError):
+        set_json_backend(StdlibJSONBackend)
+    with pytest.raises(TypeError):
+        JSONBackend()
+
+
+def test_custom_backends_implement_loads_and_dumps():
+    class DecodeOnly(JSONBackend):
+        def loads(self, data):
+            return StdlibJSONBackend().loads(data)
+
+    class Custom(DecodeOnly):
+        name = "custom"
+
+        def dumps(self, obj):
+            return StdlibJSONBackend().dumps(obj)
+
+    with pytest.raises(TypeError):
+        DecodeOnly()
+    assert set_json_backend(Custom()).name == "custom"
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_responses_are_decoded_from_their_bytes(name):
+    set_json_backend(name)
+    # A wrong charset would garble the text if the body were decoded first
+    response = httpx.Response(
+        200,
+        headers={"Content-Type": "application/json; charset=latin-1"},
+        content='{"text": "café ✓", "items": [1, null]}'.encode("utf-8"),
+    )
+
+    assert extract_and_parse_json(response) == {"text": "café ✓", "items": [1, None]}
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_dumps_returns_compact_utf8_bytes(name):
+    backend = set_json_backend(name)
+
+    assert backend.dumps({"roomId": "a", "text": "café"}) == '{"roomId":"a","text":"café"}'.encode("utf-8")
+    assert backend.dumps({}) == b"{}"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("name", BACKENDS)
+async def test_broadcast_bodies_are_spliced_with_every_backend(fake, name):
+    set_json_backend(name)
+    rooms = [fake.add("rooms", title="room {}".format(i))["id"] for i in range(2)]
+    targets = rooms + [{"toPersonEmail": "someone@example.com"}]
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake) as api:
+        results = [result async for result in api.messages.broadcast(targets, text="café", markdown="**café**")]
+
+    assert all(result.ok for result in results)
+    messages = list(fake.collections["messages"].values())
+    assert [message.get("toPersonEmail") for message in messages].count("someone@example.com") == 1
+    assert set(rooms) <= {message["roomId"] for message in messages}
+    assert {(message["text"], message["markdown"]) for message in messages} == {("café", "**café**")}
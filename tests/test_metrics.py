@@ -0,0 +1,31 @@
+import re
+
+import pytest
+
+from webexpythonsdk_async import MetricsCollector, PrometheusExporter, TenantRegistry
+
+
+pytestmark = pytest.mark.anyio
+
+
+def _gauges(text, name):
+    pattern = r"^webex_sdk_{}\{{session=\"(\w+)\"\}} (\S+)$".format(name)
+    return {session: float(value) for session, value in re.findall(pattern, text, re.MULTILINE)}
+
+
+async def test_streamed_responses_count_against_the_pool(fake):
+    fake.chunk_size = 1024
+    url = fake.add_content("file.bin", b"x" * 10000)
+    async with TenantRegistry(lambda tenant_id: "token-" + tenant_id, transport=fake) as tenants:
+        first, second = await tenants.get("a"), await tenants.get("b")
+        exporter = PrometheusExporter(MetricsCollector(), sessions={"a": first, "b": second})
+        response = await second._session.request("GET", url, 200, stream=True)
+        try:
+            text = exporter.render()
+        finally:
+            await response.aclose()
+
+        assert _gauges(text, "session_in_flight_requests") == {"a": 0, "b": 1}
+        # The tenants' shared pool is reported once
+        assert _gauges(text, "pool_active_requests") == {"a": 1}
+        assert _gauges(exporter.render(), "pool_active_requests") == {"a": 0}
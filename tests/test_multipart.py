@@ -0,0 +1,132 @@
+import io
+import os
+
+import httpx
+import pytest
+
+from webexpythonsdk_async import AsyncWebexAPI, MultipartEncoder, RateLimitWarning, UploadFile
+
+
+pytestmark = pytest.mark.anyio
+
+
+DATA = bytes(range(256)) * 1000
+
+
+class _BodyRecorder(httpx.AsyncBaseTransport):
+    """Record the body of every POST request."""
+
+    def __init__(self, transport):
+        self.transport = transport
+        self.bodies = []
+
+    async def handle_async_request(self, request):
+        if request.method == "POST":
+            self.bodies.append((request.headers.get("Content-Length"), await request.aread()))
+        return await self.transport.handle_async_request(request)
+
+
+def _uploaded(fake, message):
+    (url,) = message.files
+    filename, data, _ = fake.contents[url.rsplit("/", 2)[-2]]
+    return filename, data
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / "report.bin"
+    path.write_bytes(DATA)
+    return str(path)
+
+
+async def _encode(encoder):
+    return b"".join([chunk async for chunk in encoder])
+
+
+@pytest.mark.parametrize("kind", ["path", "file", "bytes", "stream"])
+async def test_uploads_are_posted_from_every_source(fake, room, path, kind):
+    async def chunks():
+        for offset in range(0, len(DATA), 10000):
+            yield DATA[offset : offset + 10000]
+
+    with open(path, "rb") as file_object:
+        source = {
+            "path": path,
+            "file": UploadFile(file_object),
+            "bytes": UploadFile(DATA, filename="report.bin"),
+            "stream": UploadFile(chunks(), filename="report.bin"),
+        }[kind]
+        async with AsyncWebexAPI(access_token="fake-token", transport=fake) as api:
+            message = await api.messages.create(roomId=room["id"], text="report", files=[source])
+
+    assert message.text == "report"
+    assert _uploaded(fake, message) == ("report.bin", DATA)
+
+
+async def test_a_rate_limited_upload_is_resent_from_the_start_of_the_file(fake, room, path):
+    fake.fail_next(1, status_code=429, retry_after=0)
+    recorder = _BodyRecorder(fake)
+    with open(path, "rb") as file_object:
+        # Only the part of the file after the current position is sent
+        file_object.seek(1000)
+        upload = UploadFile(file_object)
+        async with AsyncWebexAPI(access_token="fake-token", transport=recorder, rate_limit_jitter=0) as api:
+            with pytest.warns(RateLimitWarning):
+                message = await api.messages.create(roomId=room["id"], files=[upload])
+
+    assert fake.requests[("POST", "messages")] == 2
+    (first_length, first), (second_length, second) = recorder.bodies
+    assert first == second
+    assert int(first_length) == int(second_length) == len(first)
+    assert _uploaded(fake, message) == ("report.bin", DATA[1000:])
+
+
+async def test_progress_is_reported_up_to_the_body_size(fake, room, path):
+    progress = []
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake) as api:
+        await api.messages.create(
+            roomId=room["id"],
+            files=[path],
+            on_progress=lambda sent, total: progress.append((sent, total)),
+        )
+
+    sent, total = progress[-1]
+    assert sent == total > len(DATA)
+    assert [sent for sent, _ in progress] == sorted(sent for sent, _ in progress)
+
+
+@pytest.mark.parametrize("size", [0, 1, 65536, 100001])
+async def test_content_length_matches_the_encoded_body(size):
+    encoder = MultipartEncoder(
+        {"roomId": "room", "attachments": [{"a": 1}], "files": UploadFile(b"x" * size, filename="x.txt")},
+        chunk_size=4096,
+    )
+    body = await _encode(encoder)
+
+    assert encoder.content_length == len(body)
+    assert encoder.headers["Content-Type"] == "multipart/form-data; boundary=" + encoder.boundary
+    # The body can be iterated again, e.g. to resend it
+    assert await _encode(encoder) == body
+
+
+def test_unknown_sizes_have_no_content_length():
+    async def chunks():
+        yield b"data"
+
+    encoder = MultipartEncoder({"files": UploadFile(chunks(), filename="x.txt")})
+    assert encoder.content_length is None
+    assert "Content-Length" not in encoder.headers
+
+
+@pytest.mark.parametrize(
+    "source, kwargs, error",
+    [
+        (DATA, {}, ValueError),
+        (io.BytesIO(DATA), {}, ValueError),
+        (os.path.join(os.sep, "no", "such", "file"), {}, ValueError),
+        (12, {"filename": "x"}, TypeError),
+    ],
+)
+def test_invalid_uploads_are_rejected(source, kwargs, error):
+    with pytest.raises(error):
+        UploadFile(source, **kwargs)
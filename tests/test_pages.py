@@ -0,0 +1,79 @@
+import pytest
+
+from webexpythonsdk_async import AsyncWebexAPI
+from webexpythonsdk_async.models.immutable import Message
+
+
+pytestmark = pytest.mark.anyio
+
+
+TEXTS = ["message {}".format(i) for i in reversed(range(250))]
+
+
+def _api(fake, **kwargs):
+    return AsyncWebexAPI(access_token="fake-token", transport=fake, **kwargs)
+
+
+@pytest.mark.parametrize("max, sizes", [(None, [50] * 5), (100, [100, 100, 50]), (1000, [250])])
+async def test_pages_yield_each_response_as_a_list(fake, room, max, sizes):
+    params = {"roomId": room["id"]} if max is None else {"roomId": room["id"], "max": max}
+    async with _api(fake) as api:
+        pages = [page async for page in api.messages.list(**params).pages()]
+
+    assert [len(page) for page in pages] == sizes
+    assert all(isinstance(message, Message) for page in pages for message in page)
+    assert [message.text for page in pages for message in page] == TEXTS
+    assert fake.requests[("GET", "messages")] == len(sizes)
+
+
+@pytest.mark.parametrize("size, sizes", [(120, [120, 120, 10]), (50, [50] * 5), (7, [7] * 35 + [5]), (500, [250])])
+async def test_batches_regroup_the_pages(fake, room, size, sizes):
+    async with _api(fake) as api:
+        batches = [batch async for batch in api.messages.list(roomId=room["id"]).batches(size)]
+
+    assert [len(batch) for batch in batches] == sizes
+    assert [message.text for batch in batches for message in batch] == TEXTS
+
+
+async def test_pages_and_items_of_one_container_match(fake, room):
+    async with _api(fake, page_prefetch=2) as api:
+        messages = api.messages.list(roomId=room["id"], max=30)
+        items = [message.id async for message in messages]
+        pages = [message.id async for page in messages.pages() for message in page]
+
+    assert items == pages
+
+
+async def test_an_abandoned_batch_iteration_stops_fetching(fake, room):
+    async with _api(fake, page_prefetch=0) as api:
+        batches = api.messages.list(roomId=room["id"], max=10).batches(15)
+        assert len(await anext(batches)) == 15
+        await batches.aclose()
+        assert api._session.in_flight == 0
+
+    assert fake.requests[("GET", "messages")] == 2
+
+
+@pytest.mark.parametrize("size, error", [(0, ValueError), (-1, ValueError), (1.5, TypeError), ("10", TypeError)])
+async def test_invalid_batch_sizes_are_rejected(fake, room, size, error):
+    async with _api(fake) as api:
+        with pytest.raises(error):
+            await anext(api.messages.list(roomId=room["id"]).batches(size))
+
+    assert fake.request_count == 0
+
+
+async def test_direct_messages_are_listed_by_person(fake, room):
+    async with _api(fake) as api:
+        for i in range(120):
+            await api.messages.create(toPersonEmail="someone@example.com", text="direct {}".format(i))
+        await api.messages.create(toPersonEmail="other@example.com", text="elsewhere")
+        fake.add("messages", roomType="direct", personEmail="someone@example.com", text="reply")
+
+        messages = api.messages.list_direct(personEmail="someone@example.com", max=50)
+        texts = [message.text async for message in messages]
+        pages = [len(page) async for page in messages.pages()]
+
+    assert texts == ["reply"] + ["direct {}".format(i) for i in reversed(range(120))]
+    assert pages == [50, 50, 21]
+    assert fake.requests[("GET", "messages/direct")] == 6
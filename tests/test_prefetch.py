@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from webexpythonsdk_async import AsyncWebexAPI
+
+
+pytestmark = pytest.mark.anyio
+
+
+def _producer_tasks():
+    return [task for task in asyncio.all_tasks() if "_prefetch_pages" in task.get_coro().__qualname__]
+
+
+async def test_prefetching_yields_every_page_in_order(fake, room):
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake, page_prefetch=3) as api:
+        texts = [message.text async for message in api.messages.list(roomId=room["id"], max=20)]
+
+    assert texts == ["message {}".format(i) for i in reversed(range(250))]
+    assert fake.requests[("GET", "messages")] == 13
+
+
+async def test_prefetching_stays_bounded_ahead_of_the_consumer(fake, room):
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake, page_prefetch=2) as api:
+        pages = api._session.get_pages("messages", params={"roomId": room["id"], "max": 10})
+        await anext(pages)
+        await asyncio.sleep(0.05)
+        # The page consumed, two buffered and one waiting to be buffered
+        assert fake.requests[("GET", "messages")] == 4
+        await pages.aclose()
+
+
+@pytest.mark.parametrize("iteration", ["items", "pages", "slice"])
+async def test_abandoned_listing_cancels_the_producer(fake, room, iteration):
+    fake.latency = 0.02
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake, page_prefetch=2) as api:
+        listing = api.messages.list(roomId=room["id"], max=10)
+        generator = {"items": aiter(listing), "pages": listing.pages(), "slice": listing[0:100]}[iteration]
+        await anext(generator)
+        await asyncio.sleep(0.03)
+        await generator.aclose()
+
+        assert _producer_tasks() == []
+        assert api._session.in_flight == 0
+        requests = fake.request_count
+        await asyncio.sleep(0.05)
+        assert fake.request_count == requests
+
+
+async def test_errors_of_prefetched_pages_reach_the_consumer(fake, room):
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake, page_prefetch=2) as api:
+        pages = api._session.get_pages("messages", params={"roomId": room["id"], "max": 10})
+        await anext(pages)
+        fake.fail_next(1, status_code=404)
+        with pytest.raises(Exception) as error:
+            async for _ in pages:
+                pass
+
+    assert error.value.status_code == 404
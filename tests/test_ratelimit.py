@@ -0,0 +1,165 @@
+import asyncio
+import types
+
+import pytest
+
+from webexpythonsdk_async import AsyncWebexAPI, RateLimiter, RateLimitWarning
+from webexpythonsdk_async import ratelimit
+from webexpythonsdk_async.ratelimit import TokenBucket
+from webexpythonsdk_async.testing import fake_webex
+
+
+pytestmark = pytest.mark.anyio
+
+
+class _Clock(object):
+    """A monotonic clock advanced only by the sleeps it is asked for."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay):
+        # Always move on, as a real clock would during a (very) short sleep
+        self.now += max(1e-9, delay)
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Run the rate limiter, the rate-limit gate and the fake's windows on a virtual clock."""
+    clock = _Clock()
+    monkeypatch.setattr(ratelimit, "time", clock)
+    monkeypatch.setattr(ratelimit, "asyncio", types.SimpleNamespace(sleep=clock.sleep, Lock=asyncio.Lock))
+    monkeypatch.setattr(ratelimit.random, "uniform", lambda low, high: 0.0)
+    monkeypatch.setattr(fake_webex, "time", clock)
+    return clock
+
+
+async def test_a_bucket_allows_a_burst_then_paces_requests(clock):
+    bucket = TokenBucket(rate=2, capacity=2)
+    start = clock.now
+    times = []
+    for _ in range(5):
+        await bucket.acquire()
+        times.append(clock.now - start)
+
+    assert times == pytest.approx([0.0, 0.0, 0.5, 1.0, 1.5])
+
+
+async def test_waiting_requests_are_served_in_order(clock):
+    bucket = TokenBucket(rate=1, capacity=1)
+    order = []
+
+    async def acquire(i):
+        await bucket.acquire()
+        order.append(i)
+
+    tasks = [asyncio.ensure_future(acquire(i)) for i in range(5)]
+    await asyncio.sleep(0)
+    # The first request takes the bucket's only token
+    assert bucket.queue_depth == 4
+    await asyncio.gather(*tasks)
+
+    assert order == [0, 1, 2, 3, 4]
+    assert bucket.queue_depth == 0
+    assert clock.now == pytest.approx(1004.0)
+
+
+async def test_a_rate_limit_slows_the_bucket_until_it_recovers(clock):
+    bucket = TokenBucket(rate=10, capacity=10, min_rate=2, recovery=0.25)
+
+    bucket.observe_rate_limit(retry_after=1)
+    assert (bucket.rate, bucket.tokens) == (5.0, 0.0)
+    # Never refill more than one burst per Retry-After window
+    bucket.observe_rate_limit(retry_after=5)
+    assert bucket.rate == 2.0
+    bucket.observe_rate_limit(retry_after=1)
+    assert bucket.rate == 2.0
+
+    rates = []
+    for _ in range(4):
+        bucket.observe_success()
+        rates.append(bucket.rate)
+    assert rates == [4.5, 7.0, 9.5, 10.0]
+
+
+def test_families_get_their_own_buckets():
+    limiter = RateLimiter(buckets={"messages": (5, 10), "people": 2})
+
+    assert (limiter.bucket("messages").rate, limiter.bucket("messages").capacity) == (5.0, 10.0)
+    assert limiter.bucket("people").capacity == 2.0
+    assert limiter.bucket("rooms") is None
+
+    limiter = RateLimiter(default=(3, 6), recovery=0.5)
+    rooms = limiter.bucket("rooms")
+    assert limiter.bucket("rooms") is rooms
+    assert limiter.bucket("people") is not rooms
+    assert (rooms.rate, rooms.capacity) == (3.0, 6.0)
+    assert limiter.queue_depths() == {"rooms": 0, "people": 0}
+
+
+@pytest.mark.parametrize(
+    "kwargs, error",
+    [
+        ({"buckets": [("messages", 5)]}, TypeError),
+        ({"default": "5"}, TypeError),
+        ({"recovery": "0.1"}, TypeError),
+        ({"recovery": None}, TypeError),
+        ({"buckets": {"messages": 0}}, ValueError),
+    ],
+)
+def test_invalid_limiters_are_rejected(kwargs, error):
+    with pytest.raises(error):
+        RateLimiter(**kwargs)
+
+
+async def test_the_limiter_keeps_requests_within_the_servers_window(fake, clock):
+    fake.rate_limit = (5, 1)
+    # At most 5 requests in any second: a one-request burst, then 4 per second
+    limiter = RateLimiter(buckets={"people": (4, 1)})
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake, rate_limiter=limiter) as api:
+        start = clock.now
+        requests = asyncio.gather(*(api.people.me() for _ in range(20)))
+        await asyncio.sleep(0)
+        # One request sent, one sleeping for the next token, the rest queued
+        assert limiter.queue_depth == limiter.queue_depths()["people"] == 19
+        await requests
+        assert limiter.queue_depth == 0
+        assert clock.now - start == pytest.approx(4.75)
+        assert fake.request_count == 20
+
+        # Other families are not paced by the people bucket
+        fake.rate_limit = None
+        start = clock.now
+        await asyncio.gather(*(api.rooms.get(fake.add("rooms", title="room")["id"]) for _ in range(10)))
+        assert clock.now == start
+
+
+async def test_unpaced_requests_run_into_the_servers_window(fake, clock):
+    fake.rate_limit = (5, 1)
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake, rate_limit_jitter=0) as api:
+        with pytest.warns(RateLimitWarning):
+            await asyncio.gather(*(api.people.me() for _ in range(20)))
+
+    assert fake.request_count > 20
+
+
+async def test_a_rate_limit_response_slows_the_familys_bucket(fake, clock):
+    limiter = RateLimiter(buckets={"people": (10, 10), "rooms": 10}, recovery=0.1)
+    fake.fail_next(1, status_code=429, retry_after=2)
+    async with AsyncWebexAPI(
+        access_token="fake-token", transport=fake, rate_limiter=limiter, rate_limit_jitter=0
+    ) as api:
+        with pytest.warns(RateLimitWarning):
+            await api.people.me()
+        people = limiter.bucket("people")
+        # 429: halved to 5/s; the retry's success restores 10% of 10/s
+        assert people.rate == 6.0
+        assert limiter.bucket("rooms").rate == 10.0
+
+        for _ in range(4):
+            await api.people.me()
+        assert people.rate == 10.0
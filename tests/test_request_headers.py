@@ -0,0 +1,91 @@
+import asyncio
+
+import httpx
+import pytest
+
+from webexpythonsdk_async import AsyncWebexAPI, request_headers
+
+
+pytestmark = pytest.mark.anyio
+
+
+class _HeaderRecorder(httpx.AsyncBaseTransport):
+    """Record the headers and `max` parameter of every request."""
+
+    def __init__(self, transport):
+        self.transport = transport
+        self.requests = []
+
+    async def handle_async_request(self, request):
+        self.requests.append((request.url.params.get("max"), request.headers))
+        return await self.transport.handle_async_request(request)
+
+    def timezones(self, max):
+        return {headers.get("timezone") for request_max, headers in self.requests if request_max == str(max)}
+
+
+@pytest.fixture
+def recorder(fake):
+    """A recorder in front of a fake holding 30 meetings."""
+    fake.latency = (0.0, 0.01)
+    fake.add_many("meetings", 30, title="meeting {i}")
+    return _HeaderRecorder(fake)
+
+
+async def _titles(listing):
+    return [meeting.title async for meeting in listing]
+
+
+async def test_concurrent_listings_send_only_their_own_headers(recorder):
+    async with AsyncWebexAPI(access_token="fake-token", transport=recorder, page_prefetch=2) as api:
+        berlin, tokyo = await asyncio.gather(
+            _titles(api.meetings.list(max=3, headers={"timezone": "Europe/Berlin"})),
+            _titles(api.meetings.list(max=4, headers={"timezone": "Asia/Tokyo"})),
+        )
+        assert "timezone" not in api._session.headers
+
+    assert len(berlin) == len(tokyo) == 30
+    assert recorder.timezones(3) == {"Europe/Berlin"}
+    assert recorder.timezones(4) == {"Asia/Tokyo"}
+    assert len(recorder.requests) == 10 + 8
+
+
+async def test_scoped_headers_apply_only_to_their_task(recorder):
+    async def list_meetings(api, max, timezone):
+        with request_headers({"timezone": timezone}):
+            return await _titles(api.meetings.list(max=max))
+
+    async with AsyncWebexAPI(access_token="fake-token", transport=recorder, page_prefetch=2) as api:
+        await asyncio.gather(
+            list_meetings(api, 3, "Europe/Berlin"),
+            list_meetings(api, 4, "Asia/Tokyo"),
+            _titles(api.meetings.list(max=5)),
+        )
+        assert "timezone" not in api._session.headers
+
+    assert recorder.timezones(3) == {"Europe/Berlin"}
+    assert recorder.timezones(4) == {"Asia/Tokyo"}
+    assert recorder.timezones(5) == {None}
+
+
+async def test_nested_scopes_merge_and_request_headers_take_precedence(recorder):
+    async with AsyncWebexAPI(access_token="fake-token", transport=recorder) as api:
+        with request_headers({"timezone": "UTC", "x-outer": "outer"}):
+            with request_headers({"timezone": "Asia/Tokyo", "x-inner": "inner"}):
+                await _titles(api.meetings.list(max=10, headers={"x-inner": "request"}))
+                await _titles(api.meetings.list(max=15))
+            await _titles(api.meetings.list(max=20))
+        await _titles(api.meetings.list(max=30))
+
+    sent = {
+        max: (headers.get("timezone"), headers.get("x-outer"), headers.get("x-inner"))
+        for max, headers in recorder.requests
+    }
+    assert sent == {
+        "10": ("Asia/Tokyo", "outer", "request"),
+        "15": ("Asia/Tokyo", "outer", "inner"),
+        "20": ("UTC", "outer", None),
+        "30": (None, None, None),
+    }
+    # The session's own headers are still sent
+    assert {headers["authorization"] for _, headers in recorder.requests} == {"Bearer fake-token"}
@@ -0,0 +1,112 @@
+import asyncio
+import types
+
+import httpx
+import pytest
+
+from webexpythonsdk_async import AsyncWebexAPI, restsession
+from webexpythonsdk_async.restsession import _build_async_client
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_a_streamed_response_is_in_flight_until_closed(fake):
+    fake.chunk_size = 1024
+    url = fake.add_content("file.bin", b"x" * 10000)
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake) as api:
+        session = api._session
+        response = await session.request("GET", url, 200, stream=True)
+        try:
+            assert (session.in_flight, session.pool_active_requests) == (1, 1)
+        finally:
+            async for _ in response.aiter_bytes():
+                pass
+        assert (session.in_flight, session.pool_active_requests) == (0, 0)
+        # Closing it again does not count it twice
+        await response.aclose()
+        assert (session.in_flight, session.pool_active_requests) == (0, 0)
+
+
+async def test_closing_waits_for_requests_in_flight(fake):
+    fake.latency = 0.05
+    api = AsyncWebexAPI(access_token="fake-token", transport=fake)
+    request = asyncio.ensure_future(api.people.me())
+    await asyncio.sleep(0.01)
+    await api.aclose()
+
+    assert request.done()
+    assert (await request).id == fake.me["id"]
+    with pytest.raises(RuntimeError):
+        await api.people.me()
+
+
+async def test_closing_gives_up_on_an_unclosed_stream_after_the_timeout(fake):
+    fake.chunk_size = 1024
+    url = fake.add_content("file.bin", b"x" * 10000)
+    api = AsyncWebexAPI(access_token="fake-token", transport=fake)
+    response = await api._session.request("GET", url, 200, stream=True)
+    await api.aclose(timeout=0.05)
+
+    assert api._session.client.is_closed
+    await response.aclose()
+    assert api._session.in_flight == 0
+
+
+class _Built(object):
+    """An object built by a _Recorder, exposing its arguments as attributes."""
+
+    def __init__(self, kwargs):
+        self.__dict__.update(kwargs)
+
+
+class _Recorder(object):
+    """Stands in for an httpx class, recording the arguments of each instance."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        return _Built(kwargs)
+
+
+@pytest.fixture
+def built(monkeypatch):
+    """Record the clients and transports built by _build_async_client()."""
+    recorders = types.SimpleNamespace(clients=_Recorder(), transports=_Recorder())
+    monkeypatch.setattr(restsession.httpx, "AsyncClient", recorders.clients)
+    monkeypatch.setattr(restsession.httpx, "AsyncHTTPTransport", recorders.transports)
+    return recorders
+
+
+def test_the_client_gets_the_pool_settings(built):
+    _build_async_client(max_connections=7, max_keepalive_connections=3, keepalive_expiry=2.5, http2=True)
+
+    (client,) = built.clients.calls
+    assert client["limits"] == httpx.Limits(max_connections=7, max_keepalive_connections=3, keepalive_expiry=2.5)
+    assert client["http2"] is True
+    assert client["verify"] is True
+    assert client["mounts"] is None
+    assert built.transports.calls == []
+
+
+def test_proxies_are_mounted_per_scheme_with_the_pool_settings(built):
+    proxies = {"http": "http://proxy:3128", "https://webexapis.com": "http://other-proxy:3128"}
+    _build_async_client(max_connections=7, http2=True, proxies=proxies, disable_ssl_verify=True)
+
+    (client,) = built.clients.calls
+    assert sorted(client["mounts"]) == ["http://", "https://webexapis.com"]
+    assert client["verify"] is False
+    for pattern, proxy_url in [("http://", "http://proxy:3128"), ("https://webexapis.com", "http://other-proxy:3128")]:
+        transport = client["mounts"][pattern]
+        assert transport.proxy.url == httpx.URL(proxy_url)
+        assert transport.limits == client["limits"]
+        assert (transport.http2, transport.verify) == (True, False)
+
+
+def test_a_transport_replaces_the_network_settings(built, fake):
+    _build_async_client(max_connections=7, http2=True, proxies={"https": "http://proxy:3128"}, transport=fake)
+
+    assert built.clients.calls == [{"transport": fake}]
+    assert built.transports.calls == []
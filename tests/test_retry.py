@@ -0,0 +1,95 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from webexpythonsdk_async import ApiError, AsyncWebexAPI, RateLimitError, RateLimitWarning, RetryPolicy
+
+
+pytestmark = pytest.mark.anyio
+
+
+def _api(fake, **kwargs):
+    kwargs.setdefault("retry_policy", RetryPolicy(backoff_factor=0.001, jitter=False))
+    return AsyncWebexAPI(access_token="fake-token", transport=fake, rate_limit_jitter=0, **kwargs)
+
+
+class _FailingTransport(httpx.AsyncBaseTransport):
+    """Raise a transport error on the first `failures` requests."""
+
+    def __init__(self, transport, failures):
+        self.transport = transport
+        self.failures = failures
+
+    async def handle_async_request(self, request):
+        if self.failures:
+            self.failures -= 1
+            raise httpx.ConnectError("Injected connection failure.", request=request)
+        return await self.transport.handle_async_request(request)
+
+
+async def test_server_errors_are_retried(fake):
+    fake.fail_next(2, status_code=503)
+    async with _api(fake) as api:
+        me = await api.people.me()
+
+    assert me.id == fake.me["id"]
+    assert fake.requests[("GET", "people/me")] == 3
+    assert api._session.retry_counts["503"] == 2
+
+
+async def test_retries_stop_after_max_attempts(fake):
+    fake.fail_next(3, status_code=502)
+    async with _api(fake, retry_policy=RetryPolicy(max_attempts=2, backoff_factor=0.001)) as api:
+        with pytest.raises(ApiError) as error:
+            await api.people.me()
+
+    assert error.value.status_code == 502
+    assert fake.requests[("GET", "people/me")] == 2
+
+
+async def test_post_requests_are_not_retried_by_default(fake, room):
+    fake.fail_next(1, status_code=503)
+    async with _api(fake) as api:
+        with pytest.raises(ApiError):
+            await api.messages.create(roomId=room["id"], text="hello")
+
+    assert fake.requests[("POST", "messages")] == 1
+
+
+async def test_transport_errors_are_retried(fake):
+    async with _api(_FailingTransport(fake, failures=2)) as api:
+        me = await api.people.me()
+
+    assert me.id == fake.me["id"]
+    assert api._session.retry_counts["ConnectError"] == 2
+
+
+async def test_rate_limit_pauses_every_task_until_retry_after(fake):
+    fake.fail_next(1, status_code=429, retry_after=1)
+    async with _api(fake) as api:
+        start = time.monotonic()
+        with pytest.warns(RateLimitWarning):
+            first = asyncio.ensure_future(api.people.me())
+            await asyncio.sleep(0.05)
+            assert api._session.rate_limit_gate.is_closed
+
+            # A request started while the gate is closed waits for it
+            rooms = [room async for room in api.rooms.list()]
+            assert time.monotonic() - start >= 1
+            assert (await first).id == fake.me["id"]
+
+    assert rooms == []
+    assert fake.requests[("GET", "people/me")] == 2
+    assert fake.requests[("GET", "rooms")] == 1
+
+
+async def test_rate_limit_error_is_raised_without_waiting(fake):
+    fake.fail_next(1, status_code=429, retry_after=7)
+    async with _api(fake, wait_on_rate_limit=False) as api:
+        with pytest.raises(RateLimitError) as error:
+            await api.people.me()
+
+    assert error.value.retry_after == 7
+    assert fake.requests[("GET", "people/me")] == 1
@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+
+from webexpythonsdk_async import ApiError, AsyncWebexAPI
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_identical_concurrent_gets_share_one_request(fake):
+    fake.latency = 0.05
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake, single_flight=True) as api:
+        people = await asyncio.gather(*(api.people.get(fake.me["id"]) for _ in range(10)))
+
+    assert fake.requests[("GET", "people/" + fake.me["id"])] == 1
+    assert {person.id for person in people} == {fake.me["id"]}
+
+
+async def test_different_requests_are_not_coalesced(fake):
+    fake.latency = 0.05
+    room = fake.add("rooms", title="Other")
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake, single_flight=True) as api:
+        await asyncio.gather(api.people.get(fake.me["id"]), api.rooms.get(room["id"]), api.rooms.get(room["id"]))
+
+    assert fake.request_count == 2
+
+
+async def test_coalescing_is_disabled_by_default(fake):
+    fake.latency = 0.05
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake) as api:
+        await asyncio.gather(*(api.people.get(fake.me["id"]) for _ in range(5)))
+
+    assert fake.request_count == 5
+
+
+async def test_an_error_is_raised_to_every_caller(fake):
+    fake.latency = 0.05
+    fake.fail_next(1, status_code=404)
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake, single_flight=True) as api:
+        results = await asyncio.gather(
+            *(api.people.get(fake.me["id"]) for _ in range(5)),
+            return_exceptions=True,
+        )
+        # The failed flight is forgotten; the next call sends a new request
+        await api.people.get(fake.me["id"])
+
+    assert all(isinstance(result, ApiError) for result in results)
+    assert fake.request_count == 2
@@ -0,0 +1,96 @@
+import contextlib
+import json
+import random
+
+import pytest
+
+from webexpythonsdk_async import AsyncWebexAPI, MalformedResponse
+from webexpythonsdk_async.streaming import iter_json_items
+
+
+pytestmark = pytest.mark.anyio
+
+
+DOCUMENTS = [
+    {"items": []},
+    {"items": [1, -2.5, 3e10, 0, 12345678901234567890, -0.0, 1.5e-7]},
+    {"items": [True, False, None, "", 'a"b\\c', "é中\U0001f600", {"nested": [1, {"x": []}]}]},
+    {"notFoundIds": ["a", "b"], "items": [{"id": "1", "text": "café " * 50}], "trailer": {"k": [None]}},
+    {"items": [{"id": str(i), "text": "message {}".format(i), "score": i / 7} for i in range(200)]},
+]
+
+
+async def _chunks(data, sizes):
+    position = 0
+    for size in sizes:
+        yield data[position : position + size]
+        position += size
+    yield data[position:]
+
+
+def _random_sizes(rng, length):
+    sizes = []
+    while sum(sizes) < length:
+        sizes.append(rng.choice([1, 1, 2, 3, 5, 8, 64, 1000]))
+    return sizes
+
+
+async def _decode(data, sizes, key="items"):
+    return [item async for item in iter_json_items(_chunks(data, sizes), key)]
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+@pytest.mark.parametrize("indent", [None, 2])
+async def test_random_chunk_splits_decode_like_json_loads(document, indent):
+    data = json.dumps(document, indent=indent, ensure_ascii=False).encode("utf-8")
+    expected = json.loads(data)["items"]
+    rng = random.Random(len(data))
+
+    assert await _decode(data, [len(data)]) == expected
+    assert await _decode(data, [1] * len(data)) == expected
+    for _ in range(25):
+        assert await _decode(data, _random_sizes(rng, len(data))) == expected
+
+
+async def test_numbers_split_at_every_position():
+    data = b'{"items": [12.5e3, -7, 100]}'
+    for split in range(len(data) + 1):
+        assert await _decode(data, [split]) == [12500.0, -7, 100]
+
+
+async def test_other_key():
+    data = b'{"items": [1], "devices": [{"id": "d"}]}'
+    assert await _decode(data, [4, 4, 4], key="devices") == [{"id": "d"}]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"", b"[1, 2]", b'{"other": [1]}', b'{"items": {"a": 1}}', b'{"items": [1, 2', b'{"items": [1 2]}'],
+)
+async def test_malformed_data_raises(data):
+    with pytest.raises(MalformedResponse):
+        await _decode(data, [3] * len(data))
+
+
+async def test_streamed_listing_matches_buffered_listing(fake, room):
+    fake.chunk_size = 7
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake) as api:
+        buffered = [message.text async for message in api.messages.list(roomId=room["id"])]
+        api._session.stream_items = True
+        streamed = [message.text async for message in api.messages.list(roomId=room["id"])]
+        assert api._session.in_flight == 0
+
+    assert streamed == buffered
+    assert streamed == ["message {}".format(i) for i in reversed(range(250))]
+    assert fake.requests[("GET", "messages")] == 10
+
+
+async def test_abandoned_streamed_listing_closes_its_response(fake, room):
+    fake.chunk_size = 64
+    async with AsyncWebexAPI(access_token="fake-token", transport=fake, stream_items=True) as api:
+        async with contextlib.aclosing(api.messages.list(roomId=room["id"]).new_generator()) as messages:
+            async for _ in messages:
+                break
+        assert api._session.in_flight == 0
+
+    assert fake.requests[("GET", "messages")] == 1
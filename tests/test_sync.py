@@ -0,0 +1,85 @@
+import functools
+import time
+
+import pytest
+
+from webexpythonsdk_async import ApiError, WebexAPI
+
+
+TEXTS = ["message {}".format(i) for i in reversed(range(250))]
+
+
+@pytest.fixture
+def api(fake):
+    """A synchronous API object for the fake."""
+    with WebexAPI(access_token="fake-token", transport=fake) as api:
+        yield api
+
+
+def test_coroutine_methods_return_their_result(fake, api):
+    assert api.people.me().id == fake.me["id"]
+
+
+def test_list_results_can_be_iterated_again(api, room):
+    messages = api.messages.list(roomId=room["id"])
+
+    assert [message.text for message in messages] == TEXTS
+    assert [message.text for message in messages] == TEXTS
+
+
+def test_list_results_support_pages_and_batches(api, room):
+    messages = api.messages.list(roomId=room["id"])
+
+    assert [len(page) for page in messages.pages()] == [50] * 5
+    assert [len(batch) for batch in messages.batches(120)] == [120, 120, 10]
+    assert [message.text for batch in messages.batches(120) for message in batch] == TEXTS
+
+
+def test_list_results_can_be_sliced(fake, api, room):
+    messages = api.messages.list(roomId=room["id"])
+    fake.reset_stats()
+
+    assert [message.text for message in messages[2:5]] == TEXTS[2:5]
+    assert fake.request_count == 1
+    with pytest.raises(IndexError):
+        messages[0]
+
+
+def test_abandoned_iteration_closes_the_listing(fake, room):
+    fake.latency = 0.01
+    with WebexAPI(access_token="fake-token", transport=fake, page_prefetch=2) as api:
+        for message in api.messages.list(roomId=room["id"], max=10):
+            if message.text == TEXTS[15]:
+                break
+        requests = fake.request_count
+        # The prefetching of the listing's pages has been stopped
+        assert api.people.me().id == fake.me["id"]
+
+        assert api._async_api._session.in_flight == 0
+    assert fake.request_count == requests + 1
+    assert requests <= 4
+
+
+def test_batches_of_blocking_calls_run_concurrently(fake, api, room):
+    fake.latency = 0.05
+    calls = [functools.partial(api.rooms.get, room["id"]) for _ in range(10)]
+    calls.insert(3, functools.partial(api.rooms.get, "missing"))
+    progress = []
+
+    start = time.monotonic()
+    results = api.batch(calls, concurrency=11, on_progress=lambda done, total, result: progress.append(done))
+    elapsed = time.monotonic() - start
+
+    assert [result.call for result in results] == calls
+    assert [result.ok for result in results] == [True] * 3 + [False] + [True] * 7
+    assert results[0].value.title == "Test Room"
+    assert isinstance(results[3].error, ApiError)
+    assert progress == list(range(1, 12))
+    assert elapsed < 0.4
+
+
+def test_batch_calls_must_be_callables(api):
+    with pytest.raises(TypeError):
+        api.batch([api.people.me()])
+    with pytest.raises(ValueError):
+        api.batch([api.people.me], concurrency=0)
@@ -0,0 +1,93 @@
+import asyncio
+import contextlib
+
+import pytest
+
+from webexpythonsdk_async import TenantRegistry
+
+
+pytestmark = pytest.mark.anyio
+
+
+def _registry(fake, **kwargs):
+    return TenantRegistry(lambda tenant_id: "token-" + tenant_id, transport=fake, **kwargs)
+
+
+async def test_tenants_share_one_client(fake):
+    async with _registry(fake) as tenants:
+        first, second = await tenants.get("a"), await tenants.get("b")
+        assert first is not second
+        assert first._session.client is second._session.client is tenants.client
+        assert await tenants.get("a") is first
+
+    assert tenants.created == 2
+
+
+async def test_concurrent_first_uses_create_one_api(fake):
+    calls = []
+
+    async def token_for(tenant_id):
+        calls.append(tenant_id)
+        await asyncio.sleep(0.01)
+        return "token-" + tenant_id
+
+    async with TenantRegistry(token_for, transport=fake) as tenants:
+        apis = await asyncio.gather(*(tenants.get("a") for _ in range(10)))
+
+    assert calls == ["a"]
+    assert all(api is apis[0] for api in apis)
+
+
+async def test_least_recently_used_tenants_are_evicted(fake):
+    async with _registry(fake, max_tenants=2) as tenants:
+        await tenants.get("a")
+        await tenants.get("b")
+        await tenants.get("a")
+        await tenants.get("c")
+
+        assert "a" in tenants and "c" in tenants and "b" not in tenants
+        assert len(tenants) == 2
+        assert tenants.evictions == 1
+
+
+async def test_an_evicted_api_keeps_working_while_held(fake):
+    fake.add_many("rooms", 30, title="room {i}")
+    async with _registry(fake, max_tenants=2) as tenants:
+        api = await tenants.get("a")
+        async with contextlib.aclosing(api.rooms.list(max=5).new_generator()) as rooms:
+            titles = [(await anext(rooms)).title]
+
+            # Evict "a" in the middle of its listing
+            await tenants.get("b")
+            await tenants.get("c")
+            assert "a" not in tenants
+
+            titles.extend([room.title async for room in rooms])
+        me = await api.people.me()
+
+        assert titles == ["room {}".format(i) for i in range(30)]
+        assert me.id == fake.me["id"]
+        assert not tenants.client.is_closed
+
+        # A new API object is created for the tenant's next use
+        assert await tenants.get("a") is not api
+        assert tenants.created == 4
+
+
+async def test_invalidate_creates_a_new_api(fake):
+    async with _registry(fake) as tenants:
+        api = await tenants.get("a")
+        await tenants.invalidate("a")
+
+        assert "a" not in tenants
+        assert await tenants.get("a") is not api
+
+
+async def test_closing_the_registry_closes_the_owned_client(fake):
+    tenants = _registry(fake)
+    await tenants.get("a")
+    await tenants.aclose()
+
+    assert tenants.client.is_closed
+    with pytest.raises(RuntimeError):
+        await tenants.get("a")
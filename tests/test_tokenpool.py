@@ -0,0 +1,101 @@
+import asyncio
+import time
+from collections import Counter
+
+import httpx
+import pytest
+
+from webexpythonsdk_async import AsyncWebexAPI, RateLimitWarning
+from webexpythonsdk_async.tokenpool import AsyncTokenPoolSession
+
+
+pytestmark = pytest.mark.anyio
+
+
+TOKENS = ["token-a", "token-b", "token-c"]
+
+
+class _TokenRecorder(httpx.AsyncBaseTransport):
+    """Count the requests sent with each access token."""
+
+    def __init__(self, transport):
+        self.transport = transport
+        self.tokens = Counter()
+
+    async def handle_async_request(self, request):
+        self.tokens[request.headers["Authorization"]] += 1
+        return await self.transport.handle_async_request(request)
+
+
+def _api(transport, tokens=TOKENS):
+    return AsyncWebexAPI(access_token=list(tokens), transport=transport, rate_limit_jitter=0)
+
+
+async def test_a_token_list_creates_a_token_pool_session(fake):
+    async with _api(fake) as api:
+        assert isinstance(api._session, AsyncTokenPoolSession)
+        assert api._session.access_tokens == tuple(TOKENS)
+
+
+async def test_requests_are_spread_over_the_tokens(fake):
+    fake.latency = 0.02
+    recorder = _TokenRecorder(fake)
+    async with _api(recorder) as api:
+        await asyncio.gather(*(api.people.me() for _ in range(30)))
+        stats = api._session.token_stats()
+
+    assert recorder.tokens == Counter({"Bearer " + token: 10 for token in TOKENS})
+    assert [token["requests"] for token in stats] == [10, 10, 10]
+    assert all(token["in_flight"] == 0 for token in stats)
+
+
+async def test_a_rate_limited_token_fails_over_without_waiting(fake):
+    fake.fail_next(1, status_code=429, retry_after=30)
+    recorder = _TokenRecorder(fake)
+    async with _api(recorder) as api:
+        start = time.monotonic()
+        with pytest.warns(RateLimitWarning):
+            me = await api.people.me()
+        # The held token is skipped by the following requests
+        await asyncio.gather(*(api.people.me() for _ in range(4)))
+        elapsed = time.monotonic() - start
+        stats = api._session.token_stats()
+
+    assert me.id == fake.me["id"]
+    assert elapsed < 1
+    assert not api._session.rate_limit_gate.is_closed
+    assert stats[0]["rate_limits"] == 1
+    assert stats[0]["retry_after"] > 0
+    assert recorder.tokens["Bearer token-a"] == 1
+    assert fake.request_count == 6
+
+
+async def test_requests_wait_when_every_token_is_rate_limited(fake):
+    fake.fail_next(2, status_code=429, retry_after=1)
+    async with _api(fake, tokens=TOKENS[:2]) as api:
+        start = time.monotonic()
+        with pytest.warns(RateLimitWarning):
+            me = await api.people.me()
+        elapsed = time.monotonic() - start
+        stats = api._session.token_stats()
+
+    assert me.id == fake.me["id"]
+    assert elapsed >= 1
+    assert [token["rate_limits"] for token in stats] == [1, 1]
+    assert fake.request_count == 3
+
+
+async def test_per_token_rate_limits_are_shared_out(fake):
+    fake.rate_limit = (5, 60)
+    async with _api(fake) as api:
+        start = time.monotonic()
+        await asyncio.gather(*(api.people.me() for _ in range(15)))
+        elapsed = time.monotonic() - start
+
+    assert elapsed < 1
+    assert fake.request_count == 15
+
+
+def test_an_empty_token_list_is_rejected():
+    with pytest.raises(ValueError):
+        AsyncTokenPoolSession([], "https://webexapis.com/v1/")
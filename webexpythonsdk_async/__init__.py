@@ -13,6 +13,9 @@ from ._metadata import (
     __version__,
 )
 from .api import AsyncWebexAPI
+from .batch import BatchExecutor, BatchResult
+from .cache import ResponseCache
+from .downloads import DownloadResult
 from .exceptions import (
     AccessTokenError,
     ApiError,
@@ -23,6 +26,9 @@ from .exceptions import (
     webexpythonsdkException,
     webexpythonsdkWarning,
 )
+from .instrumentation import EventHooks, MetricsCollector, RequestEvent
+from .json_backends import get_json_backend, JSONBackend, set_json_backend
+from .metrics import PROMETHEUS_CONTENT_TYPE, PrometheusExporter
 from .models.dictionary import dict_data_factory
 from .models.immutable import (
     AccessToken,
@@ -51,6 +57,13 @@ from .models.immutable import (
     WebhookEvent,
 )
 from .models.simple import simple_data_factory, SimpleDataModel
+from .multipart import MultipartEncoder, UploadFile
+from .ratelimit import RateLimiter, RateLimitGate, TokenBucket
+from .restsession import request_headers
+from .retry import RetryPolicy
+from .sync import WebexAPI
+from .tenants import TenantRegistry
+from .tokenpool import AsyncTokenPoolSession
 from .utils import WebexDateTime
 
 
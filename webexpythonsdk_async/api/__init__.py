@@ -1,12 +1,26 @@
+import httpx
+
+from webexpythonsdk_async.batch import BatchExecutor
+from webexpythonsdk_async.cache import ResponseCache
 from webexpythonsdk_async.config import (
     DEFAULT_BASE_URL,
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_HTTP2,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_PAGE_PREFETCH,
+    DEFAULT_RATE_LIMIT_JITTER,
     DEFAULT_SINGLE_REQUEST_TIMEOUT,
     DEFAULT_WAIT_ON_RATE_LIMIT,
 )
 from webexpythonsdk_async.environment import WEBEX_ACCESS_TOKEN
 from webexpythonsdk_async.exceptions import AccessTokenError
 from webexpythonsdk_async.models.immutable import immutable_data_factory
+from webexpythonsdk_async.ratelimit import RateLimiter
+from webexpythonsdk_async.retry import RetryPolicy
 from webexpythonsdk_async.restsession import AsyncRestSession
+from webexpythonsdk_async.tokenpool import AsyncTokenPoolSession
 from webexpythonsdk_async.utils import check_type
 from .access_tokens import AccessTokensAPI
 from .admin_audit_events import AdminAuditEventsAPI
@@ -46,7 +60,7 @@ class AsyncWebexAPI(object):
 
     def __init__(
         self,
-        access_token: str = None,
+        access_token: str | list = None,
         base_url=DEFAULT_BASE_URL,
         single_request_timeout=DEFAULT_SINGLE_REQUEST_TIMEOUT,
         wait_on_rate_limit=DEFAULT_WAIT_ON_RATE_LIMIT,
@@ -59,6 +73,20 @@ class AsyncWebexAPI(object):
         be_geo_id=None,
         caller=None,
         disable_ssl_verify=False,
+        max_connections=DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+        http2=DEFAULT_HTTP2,
+        rate_limit_jitter=DEFAULT_RATE_LIMIT_JITTER,
+        rate_limiter=None,
+        retry_policy=None,
+        single_flight=False,
+        cache=None,
+        page_prefetch=DEFAULT_PAGE_PREFETCH,
+        stream_items=False,
+        event_hooks=None,
+        client=None,
+        transport=None,
     ):
         """Create a new WebexAPI object.
 
@@ -79,9 +107,12 @@ class AsyncWebexAPI(object):
         via one of these two methods.
 
         Args:
-            access_token(str): The access token to be used for API
+            access_token(str,list): The access token to be used for API
                 calls to the Webex service.  Defaults to checking for a
-                WEBEX_ACCESS_TOKEN environment variable.
+                WEBEX_ACCESS_TOKEN environment variable.  A list of access
+                tokens creates an AsyncTokenPoolSession, which spreads the
+                requests over the tokens and fails over from tokens that
+                are rate-limited.
             base_url(str): The base URL to be prefixed to the
                 individual API endpoint suffixes.
                 Defaults to webexpythonsdk_async.DEFAULT_BASE_URL.
@@ -112,6 +143,49 @@ class AsyncWebexAPI(object):
             disable_ssl_verify(bool): Optional boolean flag to disable ssl
                 verification. Defaults to False. If set to True, the requests
                 session won't verify ssl certs anymore.
+            max_connections(int): Maximum number of concurrent connections
+                in the session's connection pool. Defaults to
+                webexpythonsdk_async.config.DEFAULT_MAX_CONNECTIONS.
+            max_keepalive_connections(int): Maximum number of idle
+                connections kept alive in the pool. Defaults to
+                webexpythonsdk_async.config.DEFAULT_MAX_KEEPALIVE_CONNECTIONS.
+            keepalive_expiry(int,float): Seconds an idle keep-alive
+                connection is kept open. Defaults to
+                webexpythonsdk_async.config.DEFAULT_KEEPALIVE_EXPIRY.
+            http2(bool): Negotiate HTTP/2 with the Webex cloud. Requires the
+                `h2` package. Defaults to
+                webexpythonsdk_async.config.DEFAULT_HTTP2.
+            rate_limit_jitter(int,float): Maximum random delay (seconds)
+                added when releasing requests held after a rate-limit
+                response. Defaults to
+                webexpythonsdk_async.config.DEFAULT_RATE_LIMIT_JITTER.
+            rate_limiter(RateLimiter): Optional proactive client-side rate
+                limiter with per-endpoint-family token buckets.
+            retry_policy(RetryPolicy): Policy used to retry requests that
+                fail with a transient error. Defaults to RetryPolicy(), which
+                retries GET requests.
+            single_flight(bool): Coalesce identical concurrent GET requests
+                into a single HTTP request shared by all callers. Defaults to
+                False.
+            cache(ResponseCache): Optional cache of GET responses, with
+                per-endpoint TTLs and ETag revalidation.
+            page_prefetch(int): The number of pages list methods fetch ahead
+                of the consumer; 0 disables prefetching. Defaults to
+                webexpythonsdk_async.config.DEFAULT_PAGE_PREFETCH.
+            stream_items(bool): Decode the items of list methods
+                incrementally from the response stream, bounding peak memory
+                by one item instead of a whole page. Defaults to False.
+            event_hooks(dict): Instrumentation callables keyed by event hook
+                name ("on_request", "on_response", "on_retry",
+                "on_rate_limit", "on_page"); e.g.
+                `MetricsCollector().event_hooks()`.
+            client(httpx.AsyncClient): Optional client, and connection pool,
+                shared with other AsyncWebexAPI objects; it is not closed by
+                `aclose()`.  The connection pool, proxy and SSL arguments are
+                ignored when a client is provided.
+            transport(httpx.AsyncBaseTransport): Optional transport requests
+                are sent through instead of the network, e.g. a
+                webexpythonsdk_async.testing.FakeWebexTransport.
 
         Returns:
             WebexAPI: A new WebexAPI object.
@@ -122,7 +196,7 @@ class AsyncWebexAPI(object):
                 access_token argument or an environment variable.
 
         """
-        check_type(access_token, str, optional=True)
+        check_type(access_token, (str, list), optional=True)
         check_type(base_url, str, optional=True)
         check_type(single_request_timeout, int, optional=True)
         check_type(wait_on_rate_limit, bool, optional=True)
@@ -134,6 +208,20 @@ class AsyncWebexAPI(object):
         check_type(be_geo_id, str, optional=True)
         check_type(caller, str, optional=True)
         check_type(disable_ssl_verify, bool, optional=True)
+        check_type(max_connections, int, optional=True)
+        check_type(max_keepalive_connections, int, optional=True)
+        check_type(keepalive_expiry, (int, float), optional=True)
+        check_type(http2, bool, optional=True)
+        check_type(rate_limit_jitter, (int, float))
+        check_type(rate_limiter, RateLimiter, optional=True)
+        check_type(retry_policy, RetryPolicy, optional=True)
+        check_type(single_flight, bool)
+        check_type(cache, ResponseCache, optional=True)
+        check_type(page_prefetch, int)
+        check_type(stream_items, bool)
+        check_type(event_hooks, dict, optional=True)
+        check_type(client, httpx.AsyncClient, optional=True)
+        check_type(transport, httpx.AsyncBaseTransport, optional=True)
 
         access_token = access_token or WEBEX_ACCESS_TOKEN
 
@@ -171,8 +259,7 @@ class AsyncWebexAPI(object):
         # All of the API calls associated with a WebexAPI object will
         # leverage a single RESTful 'session' connecting to the Webex
         # cloud.
-        self._session = AsyncRestSession(
-            access_token=access_token,
+        session_kwargs = dict(
             base_url=base_url,
             single_request_timeout=single_request_timeout,
             wait_on_rate_limit=wait_on_rate_limit,
@@ -180,7 +267,25 @@ class AsyncWebexAPI(object):
             be_geo_id=be_geo_id,
             caller=caller,
             disable_ssl_verify=disable_ssl_verify,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=bool(http2),
+            rate_limit_jitter=rate_limit_jitter,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            single_flight=single_flight,
+            cache=cache,
+            page_prefetch=page_prefetch,
+            stream_items=stream_items,
+            event_hooks=event_hooks,
+            client=client,
+            transport=transport,
         )
+        if isinstance(access_token, list):
+            self._session = AsyncTokenPoolSession(access_tokens=access_token, **session_kwargs)
+        else:
+            self._session = AsyncRestSession(access_token=access_token, **session_kwargs)
 
         # API wrappers
         self.admin_audit_events = AdminAuditEventsAPI(
@@ -233,6 +338,63 @@ class AsyncWebexAPI(object):
         """Automatic rate-limit handling enabled / disabled."""
         return self._session.wait_on_rate_limit
 
+    @property
+    def http2(self):
+        """HTTP/2 negotiation enabled / disabled."""
+        return self._session.http2
+
+    async def batch(self, calls, concurrency=DEFAULT_BATCH_CONCURRENCY, on_progress=None):
+        """Run many API calls with bounded concurrency.
+
+        Calls are paced by the session's rate-limit gate and a failing call
+        does not stop the others; see BatchExecutor.  Cancelling the task
+        awaiting the batch cancels the calls in flight.
+
+        Example:
+            results = await api.batch(
+                [functools.partial(api.messages.delete, message_id) for message_id in message_ids],
+                concurrency=20,
+            )
+
+        Args:
+            calls(iterable): The calls; each one a callable taking no
+                arguments and returning an awaitable, or an awaitable.
+            concurrency(int): Maximum number of calls in flight. Defaults to
+                webexpythonsdk_async.config.DEFAULT_BATCH_CONCURRENCY.
+            on_progress(callable): Called with the number of completed calls,
+                the total number of calls and the BatchResult, each time a
+                call completes.
+
+        Returns:
+            list: A BatchResult for each call, in the order of `calls`.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If concurrency is not positive.
+
+        """
+        executor = BatchExecutor(self._session, concurrency=concurrency, on_progress=on_progress)
+        return await executor.run(calls)
+
+    async def aclose(self, timeout=None):
+        """Close the API session and release its connection pool.
+
+        In-flight requests are allowed to complete before the pool is closed;
+        see AsyncRestSession.aclose().
+
+        Args:
+            timeout(int,float): Maximum number of seconds to wait for
+                in-flight requests to complete. None waits indefinitely.
+
+        """
+        await self._session.aclose(timeout=timeout)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
     # Create a class attribute for the Access Tokens API that can be accessed
     # before WebexAPI object is initialized.
     access_tokens = AccessTokensAPI(
@@ -1,4 +1,4 @@
-from webexpythonsdk_async.generator_containers import generator_container
+from webexpythonsdk_async.generator_containers import generator_container, Listing
 from webexpythonsdk_async.restsession import AsyncRestSession
 from webexpythonsdk_async.utils import check_type, dict_from_items_with_values
 
@@ -31,8 +31,8 @@ class AdminAuditEventsAPI:
         self._session = session
         self._object_factory = object_factory
 
-    # @generator_container
-    async def list(
+    @generator_container
+    def list(
         self,
         orgId: str,
         _from: str,
@@ -101,5 +101,4 @@ class AdminAuditEventsAPI:
         # # Yield AdminAuditEvent objects created from the returned JSON objects
         # for item in items:
         #     yield self._object_factory(OBJECT_TYPE, item)
-        async for item in self._session.get_items(API_ENDPOINT, params=params):
-            yield self._object_factory(OBJECT_TYPE, item)
+        return Listing(self._session, API_ENDPOINT, params, self._object_factory, OBJECT_TYPE)
@@ -1,4 +1,4 @@
-from ..generator_containers import generator_container
+from ..generator_containers import generator_container, Listing
 from ..restsession import AsyncRestSession
 from ..utils import (
     check_type,
@@ -34,8 +34,8 @@ class EventsAPI:
         self._session = session
         self._object_factory = object_factory
 
-    # @generator_container
-    async def list(
+    @generator_container
+    def list(
         self,
         resource=None,
         type=None,
@@ -114,8 +114,7 @@ class EventsAPI:
         # # Yield event objects created from the returned items JSON objects
         # for item in items:
         #     yield self._object_factory(OBJECT_TYPE, item)
-        async for item in self._session.get_items(API_ENDPOINT, params=params):
-            yield self._object_factory(OBJECT_TYPE, item)
+        return Listing(self._session, API_ENDPOINT, params, self._object_factory, OBJECT_TYPE)
 
     async def get(self, eventId):
         """Get the details for an event, by event ID.
@@ -1,4 +1,4 @@
-from ..generator_containers import generator_container
+from ..generator_containers import generator_container, Listing
 from ..restsession import AsyncRestSession
 from ..utils import (
     check_type,
@@ -35,8 +35,8 @@ class LicensesAPI:
         self._session = session
         self._object_factory = object_factory
 
-    # @generator_container
-    async def list(self, orgId=None, **request_parameters):
+    @generator_container
+    def list(self, orgId=None, **request_parameters):
         """List all licenses for a given organization.
 
         If no orgId is specified, the default is the organization of the
@@ -69,8 +69,7 @@ class LicensesAPI:
         # # Yield license objects created from the returned JSON objects
         # for item in items:
         #     yield self._object_factory(OBJECT_TYPE, item)
-        async for item in generator_container(self.get_items, params):
-            yield self._object_factory(OBJECT_TYPE, item)
+        return Listing(self._session, API_ENDPOINT, params, self._object_factory, OBJECT_TYPE)
 
     async def get(self, licenseId):
         """Get the details of a License, by ID.
@@ -1,4 +1,4 @@
-from ..generator_containers import generator_container
+from ..generator_containers import generator_container, Listing
 from ..restsession import AsyncRestSession
 from ..utils import (
     check_type,
@@ -34,8 +34,8 @@ class MeetingRegistrantsAPI:
         self._session = session
         self._object_factory = object_factory
 
-    # @generator_container
-    async def list(
+    @generator_container
+    def list(
         self,
         meetingId,
         max=None,
@@ -115,16 +115,8 @@ class MeetingRegistrantsAPI:
 
         # API request - get items
 
-        # Update headers
-        for k, v in headers.items():
-            self._session.headers[k] = v
-        # items = await self._session.get_items(request_url, params=params)
-        async for item in self._session.get_items(request_url, params=params):
-            yield self._object_factory(OBJECT_TYPE, item)
-
-        # Remove headers
-        for k in headers.keys():
-            del self._session.headers[k]
+        # Headers are scoped to these requests; the session is not modified
+        return Listing(self._session, request_url, params, self._object_factory, OBJECT_TYPE, headers=headers)
 
         # Yield membership objects created from the returned items JSON objects
         # for item in items:
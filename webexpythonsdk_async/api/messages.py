@@ -1,5 +1,18 @@
+import functools
+import os
+
 from webexpythonsdk_async.models.cards import AdaptiveCard
-from ..generator_containers import generator_container
+from ..batch import BatchExecutor
+from ..config import (
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    DEFAULT_DOWNLOAD_MAX_RESUMES,
+    DEFAULT_DOWNLOAD_RANGE_SIZE,
+)
+from ..downloads import download_file
+from ..generator_containers import generator_container, Listing
+from ..json_backends import get_json_backend
+from ..multipart import MultipartEncoder, UploadFile
 from ..restsession import AsyncRestSession
 from ..utils import (
     check_type,
@@ -7,13 +20,54 @@ from ..utils import (
     is_local_file,
     is_web_url,
     make_attachment,
-    open_local_file,
 )
 
 
 API_ENDPOINT = "messages"
 OBJECT_TYPE = "message"
 
+# Message fields identifying the recipient (and thread) of a message
+RECIPIENT_FIELDS = ("roomId", "toPersonId", "toPersonEmail", "parentId")
+
+
+def _serialize_attachments(attachments):
+    """Return a new list of attachments, with cards made into attachments."""
+    if not attachments:
+        return attachments
+
+    serialized = []
+    for attachment in attachments:
+        check_type(attachment, (dict, AdaptiveCard))
+
+        if isinstance(attachment, AdaptiveCard):
+            attachment = make_attachment(attachment)
+        serialized.append(attachment)
+    return serialized
+
+
+def _recipient(target):
+    """Return the recipient fields of a broadcast target.
+
+    Raises:
+        TypeError: If the target is not a str or dict.
+        ValueError: If the target does not name exactly one recipient.
+
+    """
+    if isinstance(target, str):
+        return {"roomId": target}
+
+    check_type(target, dict)
+    unknown = set(target) - set(RECIPIENT_FIELDS)
+    if unknown:
+        raise ValueError("Unknown broadcast target field(s): {}".format(", ".join(sorted(unknown))))
+    if sum(1 for field in RECIPIENT_FIELDS[:3] if target.get(field)) != 1:
+        raise ValueError(
+            "A broadcast target must have exactly one of roomId, toPersonId or toPersonEmail; received: {!r}".format(
+                target
+            )
+        )
+    return {field: value for field, value in target.items() if value is not None}
+
 
 class MessagesAPI:
     """Webex Messages API.
@@ -38,8 +92,8 @@ class MessagesAPI:
         self._session = session
         self._object_factory = object_factory
 
-    # @generator_container
-    async def list(
+    @generator_container
+    def list(
         self,
         roomId,
         parentId=None,
@@ -111,11 +165,10 @@ class MessagesAPI:
         # # Yield message objects created from the returned items JSON objects
         # for item in items:
         #     yield self._object_factory(OBJECT_TYPE, item)
-        async for item in self._session.get_items(API_ENDPOINT, params=params):
-            yield self._object_factory(OBJECT_TYPE, item)
+        return Listing(self._session, API_ENDPOINT, params, self._object_factory, OBJECT_TYPE)
 
     @generator_container
-    async def list_direct(
+    def list_direct(
         self,
         personId=None,
         personEmail=None,
@@ -168,14 +221,7 @@ class MessagesAPI:
         )
 
         # API request - get items
-        items = await self._session.get_items(
-            API_ENDPOINT + "/direct",
-            params=params,
-        )
-
-        # Yield message objects created from the returned items JSON objects
-        for item in items:
-            yield self._object_factory(OBJECT_TYPE, item)
+        return Listing(self._session, API_ENDPOINT + "/direct", params, self._object_factory, OBJECT_TYPE)
 
     async def create(
         self,
@@ -187,6 +233,7 @@ class MessagesAPI:
         markdown=None,
         files=None,
         attachments=None,
+        on_progress=None,
         **request_parameters,
     ):
         """Post a message to a room.
@@ -205,12 +252,18 @@ class MessagesAPI:
                 specified this parameter may be optionally used to provide
                 alternate text for UI clients that do not support rich text.
             markdown(str): The message, in markdown format.
-            files(list): A list of public URL(s) or local path(s) to files to
-                be posted into the room. Only one file is allowed per message.
+            files(list): A list of public URL(s) or local file(s) to be
+                posted into the room. Only one file is allowed per message.
+                A local file may be a path, a binary file object, bytes,
+                an async iterable of bytes or an UploadFile; it is streamed
+                to the Webex cloud without being loaded into memory.
             attachments(list): Content attachments to attach to the message.
                 See the Cards Guide for more information.
             parentId(str): The parent message to reply to. This will
                 start or reply to a thread.
+            on_progress(callable): Called with the number of bytes sent and
+                the total size (None when unknown) as a local file is
+                uploaded.
             **request_parameters: Additional request parameters (provides
                 support for parameters that may be added in the future).
 
@@ -222,7 +275,8 @@ class MessagesAPI:
             ApiError: If the Webex cloud returns an error.
             ValueError: If the files parameter is a list of length > 1, or if
                 the string in the list (the only element in the list) does not
-                contain a valid URL or path to a local file.
+                contain a valid URL or path to a local file, or no file name
+                is known for the file.
 
         """
         check_type(roomId, str, optional=True)
@@ -244,17 +298,10 @@ class MessagesAPI:
                     "only one file may be included with the "
                     "message."
                 )
-            check_type(files[0], str)
         else:
             files = None
 
-        # Process and serialize attachments
-        if attachments:
-            for item, attachment in enumerate(attachments):
-                check_type(attachment, (dict, AdaptiveCard))
-
-                if isinstance(attachment, AdaptiveCard):
-                    attachments[item] = make_attachment(attachment)
+        attachments = _serialize_attachments(attachments)
 
         post_data = dict_from_items_with_values(
             request_parameters,
@@ -269,26 +316,123 @@ class MessagesAPI:
         )
 
         # API request
-        if not files or is_web_url(files[0]):
+        if not files or (isinstance(files[0], str) and is_web_url(files[0])):
             # Standard JSON post
             json_data = await self._session.post(API_ENDPOINT, json=post_data)
 
-        elif is_local_file(files[0]):
-            # Multipart MIME post
-            try:
-                post_data["files"] = open_local_file(files[0])
-                # multipart_data = MultipartEncoder(post_data)
-                # headers = {"Content-type": multipart_data.content_type}
-                json_data = await self._session.post(API_ENDPOINT, data=post_data)
-            finally:
-                post_data["files"].file_object.close()
-
         else:
-            raise ValueError("The `files` parameter does not contain a vaild URL or path to a local file.")
+            if isinstance(files[0], str) and not is_local_file(files[0]):
+                raise ValueError("The `files` parameter does not contain a vaild URL or path to a local file.")
+
+            # Streaming multipart MIME post
+            upload = files[0] if isinstance(files[0], UploadFile) else UploadFile(files[0])
+            post_data["files"] = upload
+            multipart_data = MultipartEncoder(post_data, on_progress=on_progress)
+            json_data = await self._session.post(
+                API_ENDPOINT,
+                content=multipart_data,
+                headers=multipart_data.headers,
+            )
 
         # Return a message object created from the response JSON data
         return self._object_factory(OBJECT_TYPE, json_data)
 
+    async def broadcast(
+        self,
+        targets,
+        text=None,
+        markdown=None,
+        files=None,
+        attachments=None,
+        concurrency=DEFAULT_BATCH_CONCURRENCY,
+        **request_parameters,
+    ):
+        """Post the same message to many rooms and people.
+
+        The message body, including any AdaptiveCard attachments, is
+        validated and serialized once; only the recipient fields differ
+        between the requests.  The messages are sent with bounded
+        concurrency, paced by the session's rate-limit gate, and the
+        messages for the same recipient are sent in the order of `targets`.
+
+        Example:
+            async for result in api.messages.broadcast(room_ids, markdown=announcement):
+                if not result.ok:
+                    logger.warning("Not delivered to %s: %s", room_ids[result.index], result.error)
+
+        Args:
+            targets(iterable): The recipients; each one a room ID (str) or a
+                dict with exactly one of `roomId`, `toPersonId` or
+                `toPersonEmail`, and optionally a `parentId`.
+            text(str): The message, in plain text.
+            markdown(str): The message, in markdown format.
+            files(list): A list with one public URL of a file to be posted
+                with the message.  Local files are not supported.
+            attachments(list): Content attachments to attach to the message.
+            concurrency(int): Maximum number of messages in flight. Defaults
+                to webexpythonsdk_async.config.DEFAULT_BATCH_CONCURRENCY.
+            **request_parameters: Additional request parameters (provides
+                support for parameters that may be added in the future).
+
+        Yields:
+            BatchResult: The delivery result for each target, in completion
+            order; `index` is the position of the target in `targets` and
+            `value` the created Message.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If a target is invalid, `files` holds more than one
+                item or a local file, or a recipient field is passed as a
+                request parameter.
+
+        """
+        check_type(text, str, optional=True)
+        check_type(markdown, str, optional=True)
+        check_type(files, list, optional=True)
+        check_type(attachments, list, optional=True)
+
+        if files:
+            if len(files) > 1 or not isinstance(files[0], str) or not is_web_url(files[0]):
+                raise ValueError("The `files` parameter of a broadcast must be a list with one public URL.")
+        else:
+            files = None
+        if set(request_parameters) & set(RECIPIENT_FIELDS):
+            raise ValueError("The recipients of a broadcast must be passed as its targets.")
+
+        recipients = [_recipient(target) for target in targets]
+
+        # Serialize the shared fields once, as a JSON object body
+        json_backend = get_json_backend()
+        body = json_backend.dumps(
+            dict_from_items_with_values(
+                request_parameters,
+                text=text,
+                markdown=markdown,
+                files=files,
+                attachments=_serialize_attachments(attachments),
+            )
+        )
+
+        calls = []
+        for recipient in recipients:
+            # Splice the recipient fields into the shared body
+            content = json_backend.dumps(recipient)
+            if body != b"{}":
+                content = content[:-1] + b"," + body[1:]
+            calls.append(functools.partial(self._post_serialized, content))
+
+        keys = [
+            next(recipient[field] for field in RECIPIENT_FIELDS[:3] if field in recipient) for recipient in recipients
+        ]
+        executor = BatchExecutor(self._session, concurrency=concurrency)
+        async for result in executor.stream(calls, keys=keys):
+            yield result
+
+    async def _post_serialized(self, content):
+        """Post a message from its serialized JSON body."""
+        json_data = await self._session.post(API_ENDPOINT, content=content)
+        return self._object_factory(OBJECT_TYPE, json_data)
+
     async def get(self, messageId):
         """Get the details of a message, by ID.
 
@@ -312,6 +456,59 @@ class MessagesAPI:
         # Return a message object created from the response JSON data
         return self._object_factory(OBJECT_TYPE, json_data)
 
+    async def download(
+        self,
+        url,
+        destination=os.curdir,
+        chunk_size=DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        max_resumes=DEFAULT_DOWNLOAD_MAX_RESUMES,
+        parallel_ranges=1,
+        range_size=DEFAULT_DOWNLOAD_RANGE_SIZE,
+        on_progress=None,
+    ):
+        """Download a file posted with a message.
+
+        The file is streamed in chunks through the session's connection
+        pool, resumed with HTTP Range requests after a failure and, for
+        large files, optionally fetched in parallel byte ranges.
+
+        Args:
+            url(str): The file URL (one of the message's `files`).
+            destination(str,file): A directory (the file is saved under the
+                name given by the Webex cloud), a file path, or a binary file
+                object. Defaults to the current directory.
+            chunk_size(int): The size of the chunks read and written.
+            max_resumes(int): Maximum number of times the download (or each
+                byte range) is resumed with a Range request after a failure.
+            parallel_ranges(int): Maximum number of byte ranges downloaded
+                concurrently.
+            range_size(int): Files up to this size are downloaded in a
+                single range.
+            on_progress(callable): Called with the number of bytes written
+                and the total size (None when unknown).
+
+        Returns:
+            DownloadResult: The file name, size, duration and throughput of
+            the download.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ApiError: If the Webex cloud returns an error.
+
+        """
+        check_type(url, str)
+
+        return await download_file(
+            self._session,
+            url,
+            destination=destination,
+            chunk_size=chunk_size,
+            max_resumes=max_resumes,
+            parallel_ranges=parallel_ranges,
+            range_size=range_size,
+            on_progress=on_progress,
+        )
+
     async def delete(self, messageId):
         """Delete a message.
 
@@ -1,4 +1,4 @@
-from webexpythonsdk_async.generator_containers import generator_container
+from webexpythonsdk_async.generator_containers import generator_container, Listing
 from webexpythonsdk_async.restsession import AsyncRestSession
 from webexpythonsdk_async.utils import check_type
 
@@ -33,8 +33,8 @@ class OrganizationsAPI(object):
         self._session = session
         self._object_factory = object_factory
 
-    # @generator_container
-    async def list(self, **request_parameters):
+    @generator_container
+    def list(self, **request_parameters):
         """List Organizations.
 
         Args:
@@ -56,8 +56,7 @@ class OrganizationsAPI(object):
         # # Yield organization objects created from the returned JSON objects
         # for item in items:
         #     yield self._object_factory(OBJECT_TYPE, item)
-        async for item in self._session.get_items(API_ENDPOINT, params=request_parameters):
-            yield self._object_factory(OBJECT_TYPE, item)
+        return Listing(self._session, API_ENDPOINT, request_parameters, self._object_factory, OBJECT_TYPE)
 
     async def get(self, orgId):
         """Get the details of an Organization, by ID.
@@ -1,4 +1,12 @@
-from webexpythonsdk_async.generator_containers import generator_container
+import os
+
+from webexpythonsdk_async.config import (
+    DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    DEFAULT_DOWNLOAD_MAX_RESUMES,
+    DEFAULT_DOWNLOAD_RANGE_SIZE,
+)
+from webexpythonsdk_async.downloads import download_file
+from webexpythonsdk_async.generator_containers import generator_container, Listing
 
 from webexpythonsdk_async.utils import check_type, dict_from_items_with_values
 
@@ -31,8 +39,8 @@ class RecordingsAPI:
         self._session = session
         self._object_factory = object_factory
 
-    # @generator_container
-    async def list(
+    @generator_container
+    def list(
         self,
         max=None,
         _from=None,
@@ -127,8 +135,7 @@ class RecordingsAPI:
 
         # for item in items:
         #     yield self._object_factory(OBJECT_TYPE, item)
-        async for item in self._session.get_items(API_ENDPOINT, params=params):
-            yield self._object_factory(OBJECT_TYPE, item)
+        return Listing(self._session, API_ENDPOINT, params, self._object_factory, OBJECT_TYPE)
 
     async def get(self, recordingId, siteUrl=None, hostEmail=None):
         """Get the details of a recording, by ID.
@@ -158,6 +165,81 @@ class RecordingsAPI:
 
         return self._object_factory(OBJECT_TYPE, json_data)
 
+    async def download(
+        self,
+        recordingId,
+        destination=os.curdir,
+        chunk_size=DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        max_resumes=DEFAULT_DOWNLOAD_MAX_RESUMES,
+        parallel_ranges=1,
+        range_size=DEFAULT_DOWNLOAD_RANGE_SIZE,
+        on_progress=None,
+        link="recordingDownloadLink",
+        siteUrl=None,
+        hostEmail=None,
+    ):
+        """Download a recording, by ID.
+
+        The recording's temporary direct download link is fetched through the
+        session's connection pool (without the access token, which the link
+        does not need), streamed in chunks, resumed with HTTP Range requests
+        after a failure and, for large recordings, optionally fetched in
+        parallel byte ranges.
+
+        Args:
+            recordingId(str): The ID of the recording to be downloaded.
+            destination(str,file): A directory (the file is saved under the
+                name given by the Webex cloud), a file path, or a binary file
+                object. Defaults to the current directory.
+            chunk_size(int): The size of the chunks read and written.
+            max_resumes(int): Maximum number of times the download (or each
+                byte range) is resumed with a Range request after a failure.
+            parallel_ranges(int): Maximum number of byte ranges downloaded
+                concurrently.
+            range_size(int): Files up to this size are downloaded in a
+                single range.
+            on_progress(callable): Called with the number of bytes written
+                and the total size (None when unknown).
+            link(str): The temporary direct download link to download:
+                "recordingDownloadLink", "audioDownloadLink" or
+                "transcriptDownloadLink".
+            siteUrl(str): URL of the Webex site which the API gets
+                recordings from.
+            hostEmail(str): Email address of meeting host.
+
+        Returns:
+            DownloadResult: The file name, size, duration and throughput of
+            the download.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If the recording has no such download link.
+            ApiError: If the Webex cloud returns an error.
+
+        """
+        check_type(recordingId, str)
+        check_type(link, str)
+        check_type(siteUrl, str, optional=True)
+        check_type(hostEmail, str, optional=True)
+
+        params = dict_from_items_with_values(siteUrl=siteUrl, hostEmail=hostEmail)
+
+        json_data = await self._session.get(API_ENDPOINT + "/" + recordingId, params=params)
+        url = (json_data.get("temporaryDirectDownloadLinks") or {}).get(link)
+        if not url:
+            raise ValueError("Recording {} has no {} to download.".format(recordingId, link))
+
+        return await download_file(
+            self._session,
+            url,
+            destination=destination,
+            chunk_size=chunk_size,
+            max_resumes=max_resumes,
+            parallel_ranges=parallel_ranges,
+            range_size=range_size,
+            on_progress=on_progress,
+        )
+
     async def delete(self, recordingId, siteUrl=None, hostEmail=None):
         """Delete a recording.
 
@@ -1,4 +1,4 @@
-from ..generator_containers import generator_container
+from ..generator_containers import generator_container, Listing
 from ..restsession import AsyncRestSession
 from ..utils import (
     check_type,
@@ -33,8 +33,8 @@ class RolesAPI:
         self._session = session
         self._object_factory = object_factory
 
-    # @generator_container
-    async def list(self, **request_parameters):
+    @generator_container
+    def list(self, **request_parameters):
         """List all roles.
 
         Args:
@@ -56,8 +56,7 @@ class RolesAPI:
         # # Yield role objects created from the returned JSON objects
         # for item in items:
         #     yield self._object_factory(OBJECT_TYPE, item)
-        async for item in self._session.get_items(API_ENDPOINT, params=request_parameters):
-            yield self._object_factory(OBJECT_TYPE, item)
+        return Listing(self._session, API_ENDPOINT, request_parameters, self._object_factory, OBJECT_TYPE)
 
     async def get(self, roleId):
         """Get the details of a Role, by ID.
@@ -1,4 +1,4 @@
-from ..generator_containers import generator_container
+from ..generator_containers import generator_container, Listing
 from ..restsession import AsyncRestSession
 from ..utils import (
     check_type,
@@ -34,8 +34,8 @@ class TeamsAPI:
         self._session = session
         self._object_factory = object_factory
 
-    # @generator_container
-    async def list(self, max=100, **request_parameters):
+    @generator_container
+    def list(self, max=100, **request_parameters):
         """List teams to which the authenticated user belongs.
 
         This method supports Webex's implementation of RFC5988 Web
@@ -76,8 +76,7 @@ class TeamsAPI:
         # # Yield team objects created from the returned items JSON objects
         # for item in items:
         #     yield self._object_factory(OBJECT_TYPE, item)
-        async for item in self._session.get_items(API_ENDPOINT, params=params):
-            yield self._object_factory(OBJECT_TYPE, item)
+        return Listing(self._session, API_ENDPOINT, params, self._object_factory, OBJECT_TYPE)
 
     async def create(self, name, **request_parameters):
         """Create a team.
@@ -0,0 +1,265 @@
+import asyncio
+import contextlib
+import inspect
+import logging
+
+from .config import DEFAULT_BATCH_CONCURRENCY
+from .exceptions import RateLimitError
+from .utils import check_type
+
+
+logger = logging.getLogger(__name__)
+
+
+class BatchResult(object):
+    """The outcome of one call of a batch.
+
+    Attributes:
+        index(int): The position of the call in the batch.
+        call: The call, as passed to the executor.
+        value: The value returned by the call.
+        error(Exception): The exception raised by the call; a
+            CancelledError for calls the batch was cancelled before
+            completing.
+
+    """
+
+    __slots__ = ("index", "call", "value", "error", "done")
+
+    def __init__(self, index, call):
+        self.index = index
+        self.call = call
+        self.value = None
+        self.error = None
+        self.done = False
+
+    @property
+    def ok(self):
+        """Whether the call completed without an error."""
+        return self.done and self.error is None
+
+    @property
+    def cancelled(self):
+        """Whether the batch was cancelled before the call completed."""
+        return isinstance(self.error, asyncio.CancelledError)
+
+    def __repr__(self):
+        if self.ok:
+            return "BatchResult(index={}, value={!r})".format(self.index, self.value)
+        return "BatchResult(index={}, error={!r})".format(self.index, self.error)
+
+
+class BatchExecutor(object):
+    """Run many API calls with bounded concurrency.
+
+    At most `concurrency` calls are in flight at any time.  Calls are only
+    started while the session's rate-limit gate is open, and a call failing
+    with a RateLimitError (when the session does not wait on rate limits)
+    closes the gate for its `Retry-After` period, pausing the rest of the
+    batch instead of letting it run into the same limit.
+
+    A failing call does not stop the batch: every call gets a BatchResult
+    holding its value or its error.  An executor runs one batch at a time.
+
+    Example:
+        executor = BatchExecutor(api, concurrency=20)
+        results = await executor.run(
+            functools.partial(api.memberships.create, roomId=room_id, personEmail=email)
+            for email in emails
+        )
+        failed = [result for result in results if not result.ok]
+
+    """
+
+    def __init__(self, session=None, concurrency=DEFAULT_BATCH_CONCURRENCY, on_progress=None):
+        """Initialize a new BatchExecutor.
+
+        Args:
+            session(AsyncRestSession,AsyncWebexAPI): The session (or API
+                object) whose rate-limit gate paces the batch.  Optional;
+                without a session the batch is only bounded by concurrency.
+            concurrency(int): Maximum number of calls in flight.
+            on_progress(callable): Called with the number of completed calls,
+                the total number of calls and the BatchResult, each time a
+                call completes.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If concurrency is not positive.
+
+        """
+        check_type(concurrency, int)
+        if concurrency <= 0:
+            raise ValueError("concurrency must be a positive integer")
+        if on_progress is not None and not callable(on_progress):
+            raise TypeError("on_progress must be callable; received: {!r}".format(on_progress))
+
+        # Accept an AsyncWebexAPI object in place of its session
+        session = getattr(session, "_session", session)
+        self._gate = getattr(session, "rate_limit_gate", None)
+        self._concurrency = concurrency
+        self._on_progress = on_progress
+        self._workers = []
+        self._running = False
+        self._cancelled = False
+        self.total = 0
+        self.completed = 0
+        self.failed = 0
+
+    @property
+    def concurrency(self):
+        """Maximum number of calls in flight."""
+        return self._concurrency
+
+    @property
+    def running(self):
+        """Whether a batch is being run."""
+        return self._running
+
+    def cancel(self):
+        """Cancel the running batch.
+
+        Calls in flight are cancelled and no further calls are started;
+        `run()` returns (and `stream()` ends) with the calls that did not
+        complete marked as cancelled.
+
+        """
+        self._cancelled = True
+        for worker in self._workers:
+            worker.cancel()
+
+    async def run(self, calls, keys=None):
+        """Run a batch of calls.
+
+        Args:
+            calls(iterable): The calls; each one a callable taking no
+                arguments and returning an awaitable (e.g. a
+                `functools.partial` of an API method), or an awaitable.
+            keys(iterable): Optional key of each call; calls with equal keys
+                are run one after the other, in order.
+
+        Returns:
+            list: A BatchResult for each call, in the order of `calls`.
+
+        Raises:
+            RuntimeError: If the executor is already running a batch.
+
+        """
+        results = [BatchResult(index, call) for index, call in enumerate(calls)]
+        async with contextlib.aclosing(self._execute(results, keys)) as execution:
+            async for _ in execution:
+                pass
+        return results
+
+    async def stream(self, calls, keys=None):
+        """Run a batch of calls, yielding the results as the calls complete.
+
+        Closing the generator early cancels the rest of the batch.
+
+        Args:
+            calls(iterable): The calls, as for `run()`.
+            keys(iterable): Optional key of each call; calls with equal keys
+                are run one after the other, in order.
+
+        Yields:
+            BatchResult: The result of each call, in completion order; the
+            calls that were cancelled are yielded last.
+
+        Raises:
+            RuntimeError: If the executor is already running a batch.
+
+        """
+        results = [BatchResult(index, call) for index, call in enumerate(calls)]
+        async with contextlib.aclosing(self._execute(results, keys)) as execution:
+            async for result in execution:
+                yield result
+
+    async def _execute(self, results, keys):
+        # The counters, workers and cancellation flag belong to one batch
+        if self._running:
+            for result in results:
+                if inspect.iscoroutine(result.call):
+                    result.call.close()
+            raise RuntimeError("The executor is already running a batch; use one executor per concurrent batch.")
+
+        self._running = True
+        self.total = len(results)
+        self.completed = 0
+        self.failed = 0
+        self._cancelled = False
+
+        try:
+            if keys is None:
+                groups = [[result] for result in results]
+            else:
+                grouped = {}
+                for result, key in zip(results, keys, strict=True):
+                    grouped.setdefault(key, []).append(result)
+                groups = list(grouped.values())
+
+            pending = iter(groups)
+            done = asyncio.Queue()
+            self._workers = [
+                asyncio.ensure_future(self._worker(pending, done)) for _ in range(min(self._concurrency, len(groups)))
+            ]
+            remaining = len(self._workers)
+            for worker in self._workers:
+                worker.add_done_callback(lambda _: done.put_nowait(None))
+
+            try:
+                while remaining:
+                    result = await done.get()
+                    if result is None:
+                        remaining -= 1
+                    else:
+                        yield result
+            finally:
+                for worker in self._workers:
+                    worker.cancel()
+                if self._workers:
+                    await asyncio.gather(*self._workers, return_exceptions=True)
+                self._workers = []
+                unfinished = [result for result in results if not result.done]
+                for result in unfinished:
+                    result.error = asyncio.CancelledError()
+                    # Close awaitables that were never started
+                    if inspect.iscoroutine(result.call):
+                        result.call.close()
+
+            for result in unfinished:
+                yield result
+        finally:
+            self._running = False
+
+    async def _worker(self, pending, done):
+        for group in pending:
+            for result in group:
+                if self._cancelled:
+                    return
+                if self._gate is not None:
+                    await self._gate.wait()
+
+                try:
+                    call = result.call
+                    result.value = await (call if inspect.isawaitable(call) else call())
+                except RateLimitError as error:
+                    if self._gate is not None:
+                        self._gate.hold(error.retry_after)
+                    result.error = error
+                except Exception as error:
+                    result.error = error
+                result.done = True
+
+                self.completed += 1
+                if result.error is not None:
+                    self.failed += 1
+                self._report(result)
+                done.put_nowait(result)
+
+    def _report(self, result):
+        if self._on_progress is None:
+            return
+        try:
+            self._on_progress(self.completed, self.total, result)
+        except Exception:
+            logger.exception("Batch progress callback %r failed.", self._on_progress)
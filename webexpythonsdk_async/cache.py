@@ -0,0 +1,208 @@
+import logging
+import time
+from collections import OrderedDict
+
+from .config import DEFAULT_CACHE_MAX_ENTRIES
+from .utils import check_type
+
+
+logger = logging.getLogger(__name__)
+
+
+class CacheEntry(object):
+    """A cached GET response body and its validators."""
+
+    __slots__ = ("url", "json_data", "etag", "last_modified", "expires")
+
+    def __init__(self, url, json_data, etag, last_modified, expires):
+        self.url = url
+        self.json_data = json_data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires = expires
+
+    @property
+    def is_fresh(self):
+        """Whether the entry may be used without revalidation."""
+        return time.monotonic() < self.expires
+
+    @property
+    def can_revalidate(self):
+        """Whether the entry carries an ETag or Last-Modified validator."""
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self):
+        """Return the headers for a conditional request revalidating it."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache(object):
+    """LRU cache of parsed GET responses with per-endpoint TTLs.
+
+    Only endpoint families (the first path segment after the base URL, e.g.
+    `rooms`, `people`) with a configured TTL are cached.  Fresh entries are
+    returned without a request.  Expired entries carrying an `ETag` or
+    `Last-Modified` validator are revalidated with a conditional request, so
+    an unchanged resource costs a bodiless 304 response instead of a full
+    download.
+
+    PUT and DELETE requests sent through the session invalidate the cached
+    entries of the resource URL they write to.
+
+    Cached JSON objects are shared by every caller and must be treated as
+    read-only.
+
+    Example:
+        cache = ResponseCache(
+            endpoints={"rooms": 300, "people": 300, "licenses": 3600, "roles": 3600},
+        )
+        api = AsyncWebexAPI(access_token=token, cache=cache)
+
+    """
+
+    def __init__(self, endpoints=None, ttl=None, max_entries=DEFAULT_CACHE_MAX_ENTRIES):
+        """Initialize a new, empty ResponseCache.
+
+        Args:
+            endpoints(dict): Maps endpoint families to the TTL (seconds) of
+                their cached responses.  A TTL of 0 revalidates every use.
+            ttl(int,float): TTL (seconds) for endpoint families not listed in
+                `endpoints`; None (the default) does not cache them.
+            max_entries(int): Maximum number of cached responses; the least
+                recently used entries are evicted first.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If max_entries is not positive.
+
+        """
+        check_type(endpoints, dict, optional=True)
+        check_type(ttl, (int, float), optional=True)
+        check_type(max_entries, int)
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer")
+
+        self._endpoints = dict(endpoints or {})
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries = OrderedDict()
+
+        # Invalidation generation of recently written URLs; forgotten
+        # generations are folded into a floor applying to every URL
+        self._generation = 0
+        self._generations = OrderedDict()
+        self._generation_floor = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def max_entries(self):
+        """The maximum number of cached responses."""
+        return self._max_entries
+
+    @property
+    def hit_ratio(self):
+        """Share of lookups answered from the cache (including 304s)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def ttl_for(self, family):
+        """Return the TTL (seconds) of an endpoint family; None if uncached."""
+        return self._endpoints.get(family, self._ttl)
+
+    def get(self, key):
+        """Return the entry stored under `key`, or None.
+
+        The entry is returned even when it has expired, so that it can be
+        revalidated.
+
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def generation(self, url):
+        """Return the invalidation generation of `url`.
+
+        The generation changes whenever `url`, or a resource above it, is
+        invalidated.  Capture it before sending a GET and pass it to
+        `store()`, so that a response fetched while the resource was being
+        written to is not cached.
+
+        Args:
+            url(str): The normalized absolute resource URL.
+
+        Returns:
+            int: The generation.
+
+        """
+        generation = self._generation_floor
+        while True:
+            generation = max(generation, self._generations.get(url, 0))
+            url, separator, _ = url.rpartition("/")
+            if not separator:
+                return generation
+
+    def store(self, key, url, json_data, ttl, etag=None, last_modified=None, generation=None):
+        """Store a parsed response under `key`, evicting LRU entries.
+
+        The response is not stored when `url` has been invalidated since
+        `generation` (see `generation()`) was captured.
+
+        """
+        if generation is not None and self.generation(url) != generation:
+            logger.debug("Not caching the response for %s, invalidated while it was fetched.", url)
+            return
+        self._entries[key] = CacheEntry(url, json_data, etag, last_modified, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def refresh(self, key, ttl):
+        """Extend the lifetime of a revalidated entry."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.expires = time.monotonic() + ttl
+
+    def invalidate(self, url):
+        """Drop every entry for `url` and the resources beneath it.
+
+        Args:
+            url(str): The absolute resource URL that was written to.
+
+        Returns:
+            int: The number of entries dropped.
+
+        """
+        url = url.split("?", 1)[0].rstrip("/")
+
+        self._generation += 1
+        self._generations[url] = self._generation
+        self._generations.move_to_end(url)
+        while len(self._generations) > self._max_entries:
+            _, generation = self._generations.popitem(last=False)
+            self._generation_floor = max(self._generation_floor, generation)
+
+        stale = [key for key, entry in self._entries.items() if entry.url == url or entry.url.startswith(url + "/")]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            logger.debug("Invalidated %d cached response(s) for %s.", len(stale), url)
+        return len(stale)
+
+    def clear(self):
+        """Drop every cached entry."""
+        self._entries.clear()
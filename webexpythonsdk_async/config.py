@@ -4,6 +4,42 @@ DEFAULT_SINGLE_REQUEST_TIMEOUT = 60
 
 DEFAULT_WAIT_ON_RATE_LIMIT = True
 
+DEFAULT_RATE_LIMIT_JITTER = 1.0
+
+DEFAULT_RETRY_MAX_ATTEMPTS = 3
+
+DEFAULT_RETRY_BACKOFF_FACTOR = 0.5
+
+DEFAULT_RETRY_MAX_BACKOFF = 30.0
+
+DEFAULT_RETRY_METHODS = ("GET", "HEAD", "OPTIONS")
+
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+
+DEFAULT_PAGE_PREFETCH = 0
+
+DEFAULT_MAX_CONNECTIONS = 100
+
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
+DEFAULT_HTTP2 = False
+
+DEFAULT_MAX_TENANTS = 256
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+DEFAULT_BATCH_CONCURRENCY = 10
+
+DEFAULT_UPLOAD_CHUNK_SIZE = 64 * 1024
+
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+DEFAULT_DOWNLOAD_MAX_RESUMES = 3
+
+DEFAULT_DOWNLOAD_RANGE_SIZE = 16 * 1024 * 1024
+
 ACCESS_TOKEN_ENVIRONMENT_VARIABLE = "WEBEX_ACCESS_TOKEN"
 
 LEGACY_ACCESS_TOKEN_ENVIRONMENT_VARIABLES = [
@@ -0,0 +1,355 @@
+import asyncio
+import logging
+import math
+import os
+import re
+import time
+import urllib.parse
+
+import httpx
+
+from .config import DEFAULT_DOWNLOAD_CHUNK_SIZE, DEFAULT_DOWNLOAD_MAX_RESUMES, DEFAULT_DOWNLOAD_RANGE_SIZE
+from .exceptions import ApiError
+from .utils import check_type
+
+
+logger = logging.getLogger(__name__)
+
+
+_FILENAME = re.compile(r"""filename\*?=(?:UTF-8'')?"?([^";]+)"?""", re.IGNORECASE)
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+
+class DownloadResult(object):
+    """The outcome of a completed download.
+
+    Attributes:
+        url(str): The downloaded URL.
+        path(str): The path the file was written to; None when it was
+            written to a file object.
+        filename(str): The file name given by the server (or the URL).
+        content_type(str): The content type of the file.
+        size(int): The number of bytes written.
+        seconds(float): The duration of the download.
+        resumes(int): The number of times the download was resumed after a
+            failure.
+        ranges(int): The number of byte ranges the file was downloaded in.
+
+    """
+
+    __slots__ = ("url", "path", "filename", "content_type", "size", "seconds", "resumes", "ranges")
+
+    def __init__(self, url, path, filename, content_type, size, seconds, resumes, ranges):
+        self.url = url
+        self.path = path
+        self.filename = filename
+        self.content_type = content_type
+        self.size = size
+        self.seconds = seconds
+        self.resumes = resumes
+        self.ranges = ranges
+
+    @property
+    def throughput(self):
+        """The average download throughput, in bytes per second."""
+        return self.size / self.seconds if self.seconds else 0.0
+
+    def __repr__(self):
+        return "DownloadResult(filename={!r}, size={}, seconds={:.3f}, throughput={:.0f} B/s)".format(
+            self.filename,
+            self.size,
+            self.seconds,
+            self.throughput,
+        )
+
+
+class _IncompleteBodyError(Exception):
+    """A response body ended before the expected number of bytes."""
+
+
+def _filename(response, url):
+    match = _FILENAME.search(response.headers.get("Content-Disposition", ""))
+    if match:
+        name = urllib.parse.unquote(match.group(1))
+    else:
+        name = urllib.parse.unquote(urllib.parse.urlparse(url).path.rstrip("/").rsplit("/", 1)[-1])
+    # Never let the server choose a directory
+    return os.path.basename(name.replace("\\", "/")) or "download"
+
+
+def _write_at(file_object, offset, data):
+    if file_object.tell() != offset:
+        file_object.seek(offset)
+    file_object.write(data)
+
+
+class _Download(object):
+    """The state of one download."""
+
+    def __init__(self, session, url, chunk_size, max_resumes, on_progress):
+        self.session = session
+        self.url = session.abs_url(url)
+        self.chunk_size = chunk_size
+        self.max_resumes = max_resumes
+        self.on_progress = on_progress
+        self.file_object = None
+        self.origin = 0
+        self.sequential = True
+        self.total = None
+        self.size = 0
+        self.resumes = 0
+        self._lock = asyncio.Lock()
+
+        base_url = urllib.parse.urlparse(str(session.base_url))
+        parsed_url = urllib.parse.urlparse(self.url)
+        # Only the Webex API itself is sent the access token; other hosts
+        # (e.g. temporary recording links) are fetched through the pool alone
+        self.authorized = (parsed_url.scheme, parsed_url.netloc) == (base_url.scheme, base_url.netloc)
+
+    async def open(self, headers):
+        """Send a GET request and return the streamed response."""
+        if self.authorized:
+            return await self.session.request("GET", self.url, (200, 206), stream=True, headers=headers)
+
+        # Counted as in flight on the session, like its own requests
+        session = self.session
+        session._begin_request()
+        try:
+            client = session.client
+            request = client.build_request("GET", self.url, headers=headers, timeout=session.single_request_timeout)
+            response = await session._send(request, stream=True)
+        except BaseException:
+            session._end_request()
+            raise
+        session._end_request_on_close(response)
+        if response.status_code not in (200, 206):
+            await response.aread()
+            await response.aclose()
+            raise ApiError(response)
+        return response
+
+    async def write(self, offset, data):
+        async with self._lock:
+            if self.sequential:
+                await asyncio.to_thread(self.file_object.write, data)
+            else:
+                await asyncio.to_thread(_write_at, self.file_object, self.origin + offset, data)
+            self.size += len(data)
+        if self.on_progress is not None:
+            try:
+                self.on_progress(self.size, self.total)
+            except Exception:
+                logger.exception("Download progress callback %r failed.", self.on_progress)
+
+    async def fetch(self, start, end, response=None):
+        """Write bytes `start` to `end` (inclusive; None for the end of the
+        file), resuming with Range requests after failures."""
+        position = start
+        attempts = 0
+        while True:
+            try:
+                if response is None:
+                    range_end = "" if end is None else end
+                    try:
+                        response = await self.open({"Range": "bytes={}-{}".format(position, range_end)})
+                    except ApiError as error:
+                        # A file of unknown size ended before `position`
+                        if end is None and error.status_code == 416:
+                            return
+                        raise
+                try:
+                    # A server ignoring the Range header sends the whole file
+                    skip = position if response.status_code == 200 else 0
+                    async for chunk in response.aiter_bytes(self.chunk_size):
+                        if skip:
+                            if len(chunk) <= skip:
+                                skip -= len(chunk)
+                                continue
+                            chunk, skip = chunk[skip:], 0
+                        if end is not None and position + len(chunk) > end + 1:
+                            chunk = chunk[: end + 1 - position]
+                        await self.write(position, chunk)
+                        position += len(chunk)
+                        if end is not None and position > end:
+                            break
+                finally:
+                    await response.aclose()
+                    response = None
+
+                if end is None or position > end:
+                    return
+                raise _IncompleteBodyError("Received {} of {} bytes.".format(position - start, end + 1 - start))
+
+            except (httpx.TransportError, _IncompleteBodyError) as error:
+                attempts += 1
+                if attempts > self.max_resumes:
+                    raise
+                self.resumes += 1
+                logger.warning("Download of %s interrupted at byte %s (%s); resuming.", self.url, position, error)
+
+
+async def download_file(
+    session,
+    url,
+    destination=os.curdir,
+    chunk_size=DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    max_resumes=DEFAULT_DOWNLOAD_MAX_RESUMES,
+    parallel_ranges=1,
+    range_size=DEFAULT_DOWNLOAD_RANGE_SIZE,
+    on_progress=None,
+):
+    """Download a file, streaming it to a path or file object in chunks.
+
+    The file is fetched through the session's connection pool; requests to
+    the Webex API are authorized, retried and rate limited by the session.
+    An interrupted transfer is resumed from the last byte written with an
+    HTTP Range request.  With `parallel_ranges` > 1, a file larger than
+    `range_size` is fetched in that many byte ranges concurrently (when the
+    server supports Range requests), into a seekable destination.
+
+    Args:
+        session(AsyncRestSession): The session to download with.
+        url(str): The URL of the file.
+        destination(str,file): A directory (the file is saved under the name
+            given by the server), a file path, or a binary file object.
+            Defaults to the current directory.
+        chunk_size(int): The size of the chunks read and written.
+        max_resumes(int): Maximum number of times each byte range is resumed
+            after a failure.
+        parallel_ranges(int): Maximum number of byte ranges downloaded
+            concurrently.
+        range_size(int): Files up to this size are downloaded in a single
+            range.
+        on_progress(callable): Called with the number of bytes written and
+            the total size (None when unknown) as the file is written.
+
+    Returns:
+        DownloadResult: The file name, size, duration, throughput and resume
+        count of the download.
+
+    Raises:
+        TypeError: If the parameter types are incorrect.
+        ValueError: If a numeric parameter is not positive.
+        ApiError: If the server returns an error.
+        httpx.TransportError: If the download fails more than `max_resumes`
+            times.
+
+    """
+    check_type(url, str)
+    check_type(chunk_size, int)
+    check_type(max_resumes, int)
+    check_type(parallel_ranges, int)
+    check_type(range_size, int)
+    if min(chunk_size, parallel_ranges, range_size) <= 0 or max_resumes < 0:
+        raise ValueError("chunk_size, parallel_ranges and range_size must be positive, and max_resumes not negative")
+    if on_progress is not None and not callable(on_progress):
+        raise TypeError("on_progress must be callable; received: {!r}".format(on_progress))
+
+    start_time = time.monotonic()
+    state = _Download(session, url, chunk_size, max_resumes, on_progress)
+
+    # Probe the first range; the response tells whether ranges are supported
+    headers = {"Range": "bytes=0-{}".format(range_size - 1)} if parallel_ranges > 1 else {}
+    response = await state.open(headers)
+
+    ranges = []
+    content_range = _CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+    if response.status_code == 206 and content_range:
+        first_end = int(content_range.group(2))
+        if content_range.group(3) == "*":
+            # The total size is unknown; fetch the rest of the file to its end
+            ranges = [(first_end + 1, None)]
+        else:
+            state.total = int(content_range.group(3))
+            remaining = state.total - first_end - 1
+            if remaining > 0:
+                part = math.ceil(remaining / parallel_ranges)
+                ranges = [
+                    (offset, min(offset + part, state.total) - 1) for offset in range(first_end + 1, state.total, part)
+                ]
+    else:
+        first_end = None
+        if "Content-Length" in response.headers and "Content-Encoding" not in response.headers:
+            state.total = int(response.headers["Content-Length"])
+    if state.total is not None and first_end is None:
+        first_end = state.total - 1 if state.total else None
+
+    filename = _filename(response, state.url)
+    content_type = response.headers.get("Content-Type")
+
+    path = None
+    try:
+        if isinstance(destination, str):
+            path = os.path.join(destination, filename) if os.path.isdir(destination) else destination
+            state.file_object = await asyncio.to_thread(open, path, "wb")
+        else:
+            if not hasattr(destination, "write"):
+                raise TypeError(
+                    "destination must be a path or a binary file object; received: {!r}".format(destination)
+                )
+            state.file_object = destination
+    except BaseException:
+        await response.aclose()
+        raise
+
+    seekable = path is not None or (hasattr(destination, "seekable") and destination.seekable())
+    if ranges and seekable:
+        state.sequential = False
+        if path is None:
+            state.origin = await asyncio.to_thread(destination.tell)
+    elif ranges:
+        # Without random access, fetch the rest of the file after the probe
+        ranges = [(ranges[0][0], ranges[-1][1])]
+
+    try:
+        if state.sequential:
+            await state.fetch(0, first_end, response)
+            for start, end in ranges:
+                await state.fetch(start, end)
+        else:
+            semaphore = asyncio.Semaphore(parallel_ranges)
+
+            async def fetch_range(start, end, response=None):
+                try:
+                    async with semaphore:
+                        await state.fetch(start, end, response)
+                finally:
+                    # Release the probe response of a range cancelled early
+                    if response is not None:
+                        await response.aclose()
+
+            # The probe's range counts against `parallel_ranges` too
+            tasks = [asyncio.ensure_future(fetch_range(0, first_end, response))]
+            tasks.extend(asyncio.ensure_future(fetch_range(start, end)) for start, end in ranges)
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                # Stop the other ranges when one of them fails
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+    except BaseException:
+        if path is not None:
+            await asyncio.to_thread(state.file_object.close)
+            await asyncio.to_thread(os.remove, path)
+        raise
+    else:
+        if path is not None:
+            await asyncio.to_thread(state.file_object.close)
+        else:
+            await asyncio.to_thread(destination.flush)
+
+    seconds = time.monotonic() - start_time
+    result = DownloadResult(
+        url=state.url,
+        path=path,
+        filename=filename,
+        content_type=content_type,
+        size=state.size,
+        seconds=seconds,
+        resumes=state.resumes,
+        ranges=1 + len(ranges),
+    )
+    logger.debug("Downloaded %s: %r", state.url, result)
+    return result
@@ -38,6 +38,7 @@ class ApiError(webexpythonsdkException):
         self.status = self.response.reason_phrase
         self.description = RESPONSE_CODES.get(self.status_code)
         self.detail = None
+        self.details = None
 
         if "application/json" in self.response.headers.get("Content-Type", "").lower():
             try:
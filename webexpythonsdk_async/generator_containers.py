@@ -1,14 +1,66 @@
+import contextlib
 import functools
 import inspect
-from itertools import islice
-import sys
+
+from .restsession import _no_page_prefetch
+
+
+# Marks the end of a sliced generator
+_END = object()
+
+
+class Listing(object):
+    """A paginated API listing: its request, and the objects of its items.
+
+    List methods wrapped by `generator_container` return a Listing rather
+    than yielding objects themselves, so that their container can iterate
+    over the results either item by item or page by page.
+
+    """
+
+    def __init__(self, session, url, params, object_factory, object_type, **kwargs):
+        """Init a new Listing.
+
+        Args:
+            session(AsyncRestSession): The session the pages are fetched with.
+            url(str): The URL of the API endpoint.
+            params(dict): The parameters of the first request.
+            object_factory(callable): The factory building the data objects.
+            object_type(str): The type of the listed data objects.
+            **kwargs: Passed on to the session's get_items() and
+                get_item_pages() (e.g. `headers`).
+
+        """
+        self.session = session
+        self.url = url
+        self.params = params
+        self.object_factory = object_factory
+        self.object_type = object_type
+        self.kwargs = kwargs
+
+    async def items(self):
+        """Yield the object built from each listed item."""
+        items = self.session.get_items(self.url, params=self.params, **self.kwargs)
+        async with contextlib.aclosing(items):
+            async for item in items:
+                yield self.object_factory(self.object_type, item)
+
+    async def pages(self):
+        """Yield a list of the objects built from each page's items."""
+        object_factory, object_type = self.object_factory, self.object_type
+        pages = self.session.get_item_pages(self.url, params=self.params, **self.kwargs)
+        async with contextlib.aclosing(pages):
+            async for items in pages:
+                yield [object_factory(object_type, item) for item in items]
 
 
 class GeneratorContainer:
-    """Store a generator function call, making it for safe reuse.
+    """Store an async generator function call, making it safe for reuse.
 
-    Return a fresh generator every time __iter__() is called on the container
-    object.
+    Return a fresh async generator every time __aiter__() is called on the
+    container object.  The wrapped function may also be a (plain) function
+    returning a Listing, whose items are then iterated over; such
+    containers support page iteration as well.
 
     """
 
@@ -16,29 +68,26 @@ class GeneratorContainer:
         """Init a new GeneratorContainer.
 
         Args:
-            generator_function(func): The generator function.
+            generator_function(func): The async generator function, or a
+                function returning a Listing.
             *args: The arguments passed to the generator function.
             **kwargs: The keyword arguments passed to the generator function.
 
         """
-        # if not inspect.isgeneratorfunction(generator_function):
-        #     raise TypeError("generator_function must be a generator function.")
-        if not inspect.isasyncgenfunction(generator_function):
-            raise TypeError("generator_function must be an async generator function.")
+        if not callable(generator_function) or inspect.iscoroutinefunction(generator_function):
+            raise TypeError("generator_function must be an async generator function or return a Listing.")
 
         self.generator_function = generator_function
 
-        # if sys.version_info[0] < 3:
-        #     raise TypeError("Python 2 is not supported.")
-        #     # self.arguments = inspect.getcallargs(self.generator_function, *args, **kwargs)
-        # else:
-        signature = inspect.signature(self.generator_function)
+        self._signature = inspect.signature(self.generator_function)
         try:
-            bound_arguments = signature.bind(*args, **kwargs)
-            bound_arguments.apply_defaults()
-            self.arguments = bound_arguments.arguments
+            bound_arguments = self._signature.bind(*args, **kwargs)
         except TypeError as e:
             raise TypeError(f"Error binding arguments to {generator_function.__name__}: {e}")
+        # Arguments passed by the caller, as opposed to defaults
+        self._explicit = frozenset(bound_arguments.arguments)
+        bound_arguments.apply_defaults()
+        self.arguments = bound_arguments.arguments
 
     def __repr__(self):
         """A string representation of this object."""
@@ -51,22 +100,99 @@ class GeneratorContainer:
         """A human-readable string representation of this object."""
         return self.__repr__()
 
-    async def new_generator(self):
-        """Create a new generator object."""
-        return await self.generator_function(**self.arguments)
+    def _call(self, arguments):
+        bound_arguments = inspect.BoundArguments(self._signature, arguments)
+        return self.generator_function(*bound_arguments.args, **bound_arguments.kwargs)
+
+    def _iterate(self, arguments):
+        result = self._call(arguments)
+        if isinstance(result, Listing):
+            return result.items()
+        if not hasattr(result, "__aiter__"):
+            raise TypeError(
+                "{} did not return an async iterable or a Listing.".format(self.generator_function.__name__)
+            )
+        return result
+
+    def new_generator(self):
+        """Create a new async generator object."""
+        return self._iterate(self.arguments)
 
     def __aiter__(self):
-        """Return a fresh iterator."""
+        """Return a fresh async iterator."""
         return self.new_generator()
-    
-    async def __anext__(self):
-        return await self.new_generator()
+
+    def pages(self):
+        """Iterate over the results one page (HTTP response) at a time.
+
+        Each page's objects are built at once and yielded as a list, avoiding
+        the per-item overhead of iterating over the container when whole
+        batches are processed.  Pages are fetched (and prefetched) as by
+        the session's get_item_pages(); the `stream_items` mode does not
+        apply.
+
+        Example:
+            async for messages in api.messages.list(roomId=room_id, max=1000).pages():
+                await archive.write_many(messages)
+
+        Returns:
+            async_generator: An async generator yielding a list of objects
+            for each page.
+
+        Raises:
+            TypeError: If the wrapped function does not return a Listing.
+
+        """
+        listing = self._call(self.arguments)
+        if not isinstance(listing, Listing):
+            raise TypeError("{} does not support page iteration.".format(self.generator_function.__name__))
+        return listing.pages()
+
+    async def batches(self, size):
+        """Iterate over the results in lists of `size` objects.
+
+        Pages are regrouped into batches of exactly `size` objects (the last
+        batch may be smaller); see pages().  Consider passing `max=size`, so
+        that each batch is fetched in a single request.
+
+        Args:
+            size(int): The number of objects in each batch.
+
+        Yields:
+            list: The objects of each batch.
+
+        Raises:
+            TypeError: If size is not an int, or the wrapped function does
+                not return a Listing.
+            ValueError: If size is not positive.
+
+        """
+        if not isinstance(size, int):
+            raise TypeError("size must be an int; received: {!r}".format(size))
+        if size <= 0:
+            raise ValueError("size must be a positive integer")
+
+        pages = self.pages()
+        try:
+            batch = []
+            async for page in pages:
+                if not batch and len(page) == size:
+                    yield page
+                    continue
+                batch.extend(page)
+                while len(batch) >= size:
+                    yield batch[:size]
+                    batch = batch[size:]
+            if batch:
+                yield batch
+        finally:
+            await pages.aclose()
 
     def __getitem__(self, item):
         """Slice a generator container.
 
         This is a convenience feature that, with a minor optimization, is
-        essentially syntactic sugar for:
+        essentially syntactic sugar for an async version of:
 
         `itertools.islice(GeneratorContainer, start, stop, step)`
 
@@ -74,36 +200,72 @@ class GeneratorContainer:
         slicing by setting the `max` parameter to the stop-value of the slice.
         If the sliced sequence can be returned in a single response, it will
         be. Otherwise automatic pagination will take care of returning enough
-        pages for the data to be sliced.  If `max=` was already specified as a
-        parameter to the generator function wrapped by the GeneratorContainer,
-        this optimization will not change the value.
+        pages for the data to be sliced.  If `max=` was explicitly passed to
+        the generator function wrapped by the GeneratorContainer, this
+        optimization will not change the value.
+
+        The underlying generator, and with it any response stream or
+        prefetched page, is closed as soon as the slice is complete; no
+        further pages are requested.
 
         Args:
             item(slice): A slice object specifying the start, stop and step.
 
         Returns:
-            itertools.islice: An itertools.islice object slicing the
-                GeneratorContainer's wrapped generator function.
+            async_generator: An async generator yielding the items of the
+            slice.
+
+        Raises:
+            IndexError: If item is not a slice.
+            ValueError: If the slice has negative values or a step of zero.
 
         """
-        if isinstance(item, slice):
-            arguments = self.arguments.copy()
-            arguments.setdefault("max", item.stop)
-            return islice(
-                self.generator_function(**arguments),
-                item.start,
-                item.stop,
-                item.step,
-            )
-        else:
+        if not isinstance(item, slice):
             raise IndexError("GeneratorContainers support slicing only. Indexing is not supported.")
 
+        start = 0 if item.start is None else item.start
+        step = 1 if item.step is None else item.step
+        if start < 0 or step <= 0 or (item.stop is not None and item.stop < 0):
+            raise ValueError(
+                "GeneratorContainer slices must have non-negative start and stop values and a positive step."
+            )
+
+        arguments = self.arguments.copy()
+        single_page = bool(item.stop) and "max" in self._signature.parameters and "max" not in self._explicit
+        if single_page:
+            arguments["max"] = item.stop
+
+        return self._slice(arguments, start, item.stop, step, single_page)
+
+    async def _slice(self, arguments, start, stop, step, single_page):
+        if stop is not None and stop <= start:
+            return
+
+        generator = self._iterate(arguments)
+        try:
+            index = 0
+            while stop is None or index < stop:
+                if index == 0 and single_page:
+                    # The slice fits in the first page; don't fetch ahead
+                    with _no_page_prefetch():
+                        value = await anext(generator, _END)
+                else:
+                    value = await anext(generator, _END)
+                if value is _END:
+                    break
+                if index >= start and (index - start) % step == 0:
+                    yield value
+                index += 1
+        finally:
+            await generator.aclose()
+
 
 def generator_container(generator_function):
-    """Function Decorator: Containerize calls to a generator function.
+    """Function Decorator: Containerize calls to an async generator function.
 
     Args:
-        generator_function(func): The generator function being containerized.
+        generator_function(func): The async generator function being
+            containerized.
 
     Returns:
         func: A wrapper function that containerizes the calls to the generator
@@ -112,7 +274,7 @@ def generator_container(generator_function):
     """
 
     @functools.wraps(generator_function)
-    async def generator_container_wrapper(*args, **kwargs):
+    def generator_container_wrapper(*args, **kwargs):
         """Store a generator call in a container and return the container.
 
         Args:
@@ -0,0 +1,381 @@
+import bisect
+import logging
+from collections import Counter
+
+from .config import DEFAULT_LATENCY_BUCKETS
+from .utils import check_type
+
+
+logger = logging.getLogger(__name__)
+
+
+EVENT_HOOKS = ("on_request", "on_response", "on_retry", "on_rate_limit", "on_page")
+
+
+class RequestEvent(object):
+    """Describes one attempt of a request sent through an AsyncRestSession.
+
+    A new event is created for every attempt and passed to the session's
+    event hooks as the attempt progresses; attributes that do not apply yet
+    (or at all) are None.
+
+    Attributes:
+        method(str): The request method ("GET", "POST", ...).
+        url(str): The absolute request URL.
+        endpoint(str): The endpoint template, with resource IDs collapsed
+            (e.g. "rooms/{id}"); use it to label metrics.
+        attempt(int): The attempt number, starting at 1.  Rate-limited
+            attempts are repeated with the same number.
+        gate_wait(float): Seconds the attempt was held by the session's
+            rate-limit gate (Retry-After sleeps).
+        limiter_wait(float): Seconds the attempt waited for the client-side
+            rate limiter.
+        bytes_sent(int): Size of the request body.
+        status_code(int): The response status code.
+        bytes_received(int): Size of the response body; for streamed
+            responses, the bytes downloaded so far (usually 0).
+        response_time(float): Seconds from sending the request until the
+            response was received.
+        total_time(float): Seconds since the first attempt of the request
+            started, including waits and earlier attempts.
+        error(Exception): The error that triggered a retry or a rate-limit
+            hold.
+        reason(str): Why the attempt is retried (status code or transport
+            exception name).
+        retry_delay(float): Seconds waited before the retry.
+        retry_after(float): The Retry-After seconds of a rate-limit response.
+
+    """
+
+    __slots__ = (
+        "method",
+        "url",
+        "endpoint",
+        "attempt",
+        "gate_wait",
+        "limiter_wait",
+        "bytes_sent",
+        "status_code",
+        "bytes_received",
+        "response_time",
+        "total_time",
+        "error",
+        "reason",
+        "retry_delay",
+        "retry_after",
+    )
+
+    def __init__(self, method, url, endpoint, attempt, gate_wait=0.0, limiter_wait=0.0, bytes_sent=0):
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint
+        self.attempt = attempt
+        self.gate_wait = gate_wait
+        self.limiter_wait = limiter_wait
+        self.bytes_sent = bytes_sent
+        self.status_code = None
+        self.bytes_received = None
+        self.response_time = None
+        self.total_time = None
+        self.error = None
+        self.reason = None
+        self.retry_delay = None
+        self.retry_after = None
+
+    def __repr__(self):
+        return "<RequestEvent {} {} attempt={} status={}>".format(
+            self.method,
+            self.endpoint,
+            self.attempt,
+            self.status_code,
+        )
+
+
+class PageEvent(object):
+    """Describes a page of a paginated listing that has been fetched.
+
+    Attributes:
+        url(str): The absolute URL of the page.
+        endpoint(str): The endpoint template of the listing.
+        page(int): The page number within the listing, starting at 1.
+
+    """
+
+    __slots__ = ("url", "endpoint", "page")
+
+    def __init__(self, url, endpoint, page):
+        self.url = url
+        self.endpoint = endpoint
+        self.page = page
+
+    def __repr__(self):
+        return "<PageEvent {} page={}>".format(self.endpoint, self.page)
+
+
+class EventHooks(object):
+    """The event hooks registered with a session.
+
+    Hooks are plain (synchronous) callables receiving a RequestEvent:
+
+        on_request: Before each attempt is sent.
+        on_response: When a response has been received, whatever its status.
+        on_retry: Before waiting to retry a failed attempt.
+        on_rate_limit: When a rate-limit (429) response has been received.
+
+    or, for paginated listings, a PageEvent:
+
+        on_page: When a page of a listing has been fetched.
+
+    Hooks run inline in the request path and should be fast; exceptions
+    raised by a hook are logged and otherwise ignored.
+
+    """
+
+    def __init__(self, hooks=None):
+        """Initialize the event hooks.
+
+        Args:
+            hooks(dict): Maps hook names to a callable or a list of
+                callables.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If a hook name is unknown.
+
+        """
+        check_type(hooks, dict, optional=True)
+
+        self._hooks = {name: [] for name in EVENT_HOOKS}
+        self._active = False
+        for name, callbacks in (hooks or {}).items():
+            if callable(callbacks):
+                callbacks = [callbacks]
+            for callback in callbacks:
+                self.add(name, callback)
+
+    def __bool__(self):
+        """Whether any hook is registered."""
+        return self._active
+
+    def add(self, name, callback):
+        """Register a callable for an event hook.
+
+        Args:
+            name(str): The hook name (see EVENT_HOOKS).
+            callback(callable): Called with a RequestEvent (or PageEvent).
+
+        Raises:
+            ValueError: If the hook name is unknown.
+            TypeError: If callback is not callable.
+
+        """
+        if name not in self._hooks:
+            raise ValueError("Unknown event hook {!r}; expected one of: {}.".format(name, ", ".join(EVENT_HOOKS)))
+        if not callable(callback):
+            raise TypeError("Event hook callbacks must be callable; received: {!r}".format(callback))
+        self._hooks[name].append(callback)
+        self._active = True
+
+    def remove(self, name, callback):
+        """Unregister a callable from an event hook."""
+        self._hooks[name].remove(callback)
+        self._active = any(self._hooks.values())
+
+    def emit(self, name, event):
+        """Call the hooks registered for `name` with an event."""
+        for callback in self._hooks[name]:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("The %s event hook %r raised an exception.", name, callback)
+
+
+class Histogram(object):
+    """A cumulative histogram of observed values (e.g. latencies)."""
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        # One count per bucket, plus the +Inf bucket
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        """Record an observed value."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self):
+        """Return (upper bound, cumulative count) pairs, ending with +Inf."""
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts, strict=True):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, q):
+        """Estimate a quantile (0 < q <= 1) from the bucket counts.
+
+        Returns the upper bound of the bucket containing the quantile, or
+        None when nothing has been observed.
+
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, total in self.cumulative_counts():
+            if total >= rank:
+                return bound
+
+
+class EndpointStats(object):
+    """Request counters and latency histogram of one endpoint."""
+
+    __slots__ = (
+        "requests",
+        "latency",
+        "bytes_sent",
+        "bytes_received",
+        "retries",
+        "rate_limits",
+        "retry_after_seconds",
+        "gate_wait_seconds",
+        "limiter_wait_seconds",
+        "pages",
+    )
+
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        self.requests = Counter()
+        self.latency = Histogram(buckets)
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.retries = Counter()
+        self.rate_limits = 0
+        self.retry_after_seconds = 0.0
+        self.gate_wait_seconds = 0.0
+        self.limiter_wait_seconds = 0.0
+        self.pages = 0
+
+
+class MetricsCollector(object):
+    """In-process collector of per-endpoint request metrics.
+
+    Registers itself as a session's event hooks and keeps, per request
+    method and endpoint template, the responses by status code, a response
+    latency histogram, bytes sent and received, retries by reason,
+    rate-limit counts and the number of listing pages fetched.
+
+    Example:
+        metrics = MetricsCollector()
+        api = AsyncWebexAPI(access_token=token, event_hooks=metrics.event_hooks())
+        ...
+        for (method, endpoint), stats in metrics.endpoints.items():
+            print(method, endpoint, stats.latency.quantile(0.99))
+
+    """
+
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        """Initialize a new, empty MetricsCollector.
+
+        Args:
+            buckets(tuple): Upper bounds (seconds) of the latency histogram
+                buckets.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+
+        """
+        check_type(buckets, (tuple, list))
+
+        self._buckets = tuple(buckets)
+        self.endpoints = {}
+
+    @property
+    def buckets(self):
+        """Upper bounds (seconds) of the latency histogram buckets."""
+        return self._buckets
+
+    def event_hooks(self):
+        """Return the event hooks dictionary to register with a session."""
+        return {
+            "on_request": self.on_request,
+            "on_response": self.on_response,
+            "on_retry": self.on_retry,
+            "on_rate_limit": self.on_rate_limit,
+            "on_page": self.on_page,
+        }
+
+    def stats(self, method, endpoint):
+        """Return the EndpointStats of a method and endpoint template."""
+        key = (method, endpoint)
+        stats = self.endpoints.get(key)
+        if stats is None:
+            stats = self.endpoints[key] = EndpointStats(self._buckets)
+        return stats
+
+    def on_request(self, event):
+        """Record a request attempt and the time it waited to be sent."""
+        stats = self.stats(event.method, event.endpoint)
+        stats.bytes_sent += event.bytes_sent
+        stats.gate_wait_seconds += event.gate_wait
+        stats.limiter_wait_seconds += event.limiter_wait
+
+    def on_response(self, event):
+        """Record a response's status, latency and size."""
+        stats = self.stats(event.method, event.endpoint)
+        stats.requests[event.status_code] += 1
+        stats.latency.observe(event.response_time)
+        stats.bytes_received += event.bytes_received or 0
+
+    def on_retry(self, event):
+        """Record a retry and its reason."""
+        self.stats(event.method, event.endpoint).retries[event.reason] += 1
+
+    def on_rate_limit(self, event):
+        """Record a rate-limit response and its Retry-After."""
+        stats = self.stats(event.method, event.endpoint)
+        stats.rate_limits += 1
+        stats.retry_after_seconds += event.retry_after or 0.0
+
+    def on_page(self, event):
+        """Record a fetched listing page."""
+        self.stats("GET", event.endpoint).pages += 1
+
+    def reset(self):
+        """Discard everything collected so far."""
+        self.endpoints = {}
+
+    def snapshot(self):
+        """Return the collected metrics as plain, JSON-serializable data.
+
+        Returns:
+            list: One dict per method and endpoint.
+
+        """
+        return [
+            {
+                "method": method,
+                "endpoint": endpoint,
+                "requests": {str(status): count for status, count in stats.requests.items()},
+                "latency": {
+                    "count": stats.latency.count,
+                    "sum": stats.latency.sum,
+                    "p50": stats.latency.quantile(0.5),
+                    "p90": stats.latency.quantile(0.9),
+                    "p99": stats.latency.quantile(0.99),
+                },
+                "bytes_sent": stats.bytes_sent,
+                "bytes_received": stats.bytes_received,
+                "retries": dict(stats.retries),
+                "rate_limits": stats.rate_limits,
+                "retry_after_seconds": stats.retry_after_seconds,
+                "gate_wait_seconds": stats.gate_wait_seconds,
+                "limiter_wait_seconds": stats.limiter_wait_seconds,
+                "pages": stats.pages,
+            }
+            for (method, endpoint), stats in sorted(self.endpoints.items())
+        ]
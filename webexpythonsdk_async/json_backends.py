@@ -0,0 +1,124 @@
+import abc
+import json
+import logging
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class JSONBackend(abc.ABC):
+    """Base class for the JSON encoders/decoders used by the package.
+
+    Backends decode response bodies straight from bytes into plain Python
+    dicts and lists, and encode request bodies to UTF-8 bytes.
+
+    """
+
+    name = None
+
+    @abc.abstractmethod
+    def loads(self, data):
+        """Decode a JSON document from bytes or str."""
+
+    @abc.abstractmethod
+    def dumps(self, obj):
+        """Encode an object as a compact UTF-8 JSON document (bytes)."""
+
+    def __repr__(self):
+        return "<{}>".format(self.__class__.__name__)
+
+
+class StdlibJSONBackend(JSONBackend):
+    """JSON backend using the Python standard library `json` module."""
+
+    name = "json"
+
+    def loads(self, data):
+        """Decode a JSON document from bytes or str."""
+        return json.loads(data)
+
+    def dumps(self, obj):
+        """Encode an object as a compact UTF-8 JSON document (bytes)."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class OrjsonJSONBackend(JSONBackend):
+    """JSON backend using the optional, faster `orjson` package."""
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("The 'orjson' JSON backend requires the orjson package (`pip install orjson`).")
+
+    def loads(self, data):
+        """Decode a JSON document from bytes or str."""
+        return orjson.loads(data)
+
+    def dumps(self, obj):
+        """Encode an object as a compact UTF-8 JSON document (bytes)."""
+        return orjson.dumps(obj)
+
+
+JSON_BACKENDS = {
+    StdlibJSONBackend.name: StdlibJSONBackend,
+    OrjsonJSONBackend.name: OrjsonJSONBackend,
+}
+
+
+def _default_backend():
+    """Return the fastest installed JSON backend."""
+    if orjson is not None:
+        return OrjsonJSONBackend()
+    return StdlibJSONBackend()
+
+
+_backend = _default_backend()
+
+
+def get_json_backend():
+    """Return the JSON backend used to decode responses and encode requests.
+
+    Returns:
+        JSONBackend: The active backend; `orjson` when it is installed,
+        otherwise the standard library `json` module.
+
+    """
+    return _backend
+
+
+def set_json_backend(backend):
+    """Select the JSON backend used by the package.
+
+    Args:
+        backend(str,JSONBackend): A backend name ("json" or "orjson") or a
+            JSONBackend instance.
+
+    Returns:
+        JSONBackend: The newly active backend.
+
+    Raises:
+        TypeError: If backend is not a str or JSONBackend.
+        ValueError: If the backend name is unknown.
+        ImportError: If the backend's package is not installed.
+
+    """
+    global _backend
+
+    if isinstance(backend, str):
+        if backend not in JSON_BACKENDS:
+            raise ValueError(
+                "Unknown JSON backend {!r}; expected one of: {}.".format(backend, ", ".join(sorted(JSON_BACKENDS)))
+            )
+        backend = JSON_BACKENDS[backend]()
+    elif not isinstance(backend, JSONBackend):
+        raise TypeError("'backend' must be a backend name or JSONBackend instance; received: {!r}".format(backend))
+
+    logger.debug("Using the %r JSON backend.", backend.name)
+    _backend = backend
+    return backend
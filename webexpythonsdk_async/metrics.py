@@ -0,0 +1,284 @@
+import math
+
+from .instrumentation import MetricsCollector
+from .restsession import AsyncRestSession
+from .utils import check_type
+
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value):
+    """Escape a Prometheus label value."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value):
+    """Format a sample value in the Prometheus text format."""
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class _MetricFamily(object):
+    """The HELP/TYPE header and samples of one metric."""
+
+    def __init__(self, name, metric_type, documentation):
+        self.name = name
+        self.metric_type = metric_type
+        self.documentation = documentation
+        self.samples = []
+
+    def add(self, labels, value, suffix=""):
+        self.samples.append((self.name + suffix, labels, value))
+
+    def render(self, lines):
+        if not self.samples:
+            return
+        lines.append("# HELP {} {}".format(self.name, self.documentation))
+        lines.append("# TYPE {} {}".format(self.name, self.metric_type))
+        for name, labels, value in self.samples:
+            if labels:
+                label_text = ",".join('{}="{}"'.format(key, _escape(label)) for key, label in labels)
+                lines.append("{}{{{}}} {}".format(name, label_text, _format_value(value)))
+            else:
+                lines.append("{} {}".format(name, _format_value(value)))
+
+
+class PrometheusExporter(object):
+    """Render the SDK's metrics in the Prometheus text exposition format.
+
+    Combines the per-endpoint request metrics of a MetricsCollector with
+    point-in-time gauges read from sessions (in-flight requests,
+    connection-pool saturation, rate-limiter queue depth, rate-limit gate
+    state) and their response caches.  Pool saturation counts only the
+    requests using a pool connection, against the limit of the (possibly
+    shared) client's pool; a pool shared by several sessions is reported
+    once, under the first session's label.  Serve the output of `render()`
+    from your own metrics endpoint, with the PROMETHEUS_CONTENT_TYPE content
+    type.
+
+    Example:
+        metrics = MetricsCollector()
+        api = AsyncWebexAPI(access_token=token, event_hooks=metrics.event_hooks())
+        exporter = PrometheusExporter(metrics, sessions={"bot": api})
+
+        async def handle_metrics(request):
+            return web.Response(
+                text=exporter.render(),
+                headers={"Content-Type": PROMETHEUS_CONTENT_TYPE},
+            )
+
+    """
+
+    def __init__(self, collector=None, sessions=None, namespace="webex_sdk"):
+        """Initialize a new PrometheusExporter.
+
+        Args:
+            collector(MetricsCollector): The collector registered as the
+                sessions' event hooks.
+            sessions(dict): Maps a session label to the AsyncRestSession (or
+                AsyncWebexAPI) to report gauges for.
+            namespace(str): Prefix of the exported metric names.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+
+        """
+        check_type(collector, MetricsCollector, optional=True)
+        check_type(sessions, dict, optional=True)
+        check_type(namespace, str)
+
+        self._collector = collector
+        self._namespace = namespace
+        self._sessions = {}
+        for name, session in (sessions or {}).items():
+            self.add_session(name, session)
+
+    @property
+    def collector(self):
+        """The MetricsCollector whose request metrics are exported."""
+        return self._collector
+
+    def add_session(self, name, session):
+        """Report the gauges of a session (or AsyncWebexAPI) under a label.
+
+        Args:
+            name(str): The value of the `session` label.
+            session(AsyncRestSession,AsyncWebexAPI): The session to report.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+
+        """
+        check_type(name, str)
+        session = getattr(session, "_session", session)
+        check_type(session, AsyncRestSession)
+        self._sessions[name] = session
+
+    def remove_session(self, name):
+        """Stop reporting the gauges of a session."""
+        self._sessions.pop(name, None)
+
+    def _family(self, families, name, metric_type, documentation):
+        family = _MetricFamily(self._namespace + "_" + name, metric_type, documentation)
+        families.append(family)
+        return family
+
+    def _collect_requests(self, families):
+        requests = self._family(families, "requests_total", "counter", "Responses received, by status code.")
+        duration = self._family(
+            families,
+            "request_duration_seconds",
+            "histogram",
+            "Seconds from sending a request until its response was received.",
+        )
+        sent = self._family(families, "request_bytes_total", "counter", "Request body bytes sent.")
+        received = self._family(families, "response_bytes_total", "counter", "Response body bytes received.")
+        retries = self._family(families, "retries_total", "counter", "Requests retried, by reason.")
+        rate_limited = self._family(families, "rate_limited_total", "counter", "Rate-limit (429) responses received.")
+        retry_after = self._family(
+            families,
+            "rate_limit_retry_after_seconds_total",
+            "counter",
+            "Retry-After seconds announced by rate-limit responses.",
+        )
+        gate_wait = self._family(
+            families,
+            "rate_limit_wait_seconds_total",
+            "counter",
+            "Seconds requests slept waiting for a Retry-After to expire.",
+        )
+        limiter_wait = self._family(
+            families,
+            "rate_limiter_wait_seconds_total",
+            "counter",
+            "Seconds requests waited for the client-side rate limiter.",
+        )
+        pages = self._family(families, "pages_fetched_total", "counter", "Pages of paginated listings fetched.")
+
+        for (method, endpoint), stats in sorted(list(self._collector.endpoints.items())):
+            labels = (("method", method), ("endpoint", endpoint))
+            for status, count in sorted(stats.requests.items()):
+                requests.add(labels + (("status", status),), count)
+            if stats.latency.count:
+                for bound, count in stats.latency.cumulative_counts():
+                    duration.add(labels + (("le", _format_value(float(bound))),), count, "_bucket")
+                duration.add(labels, stats.latency.sum, "_sum")
+                duration.add(labels, stats.latency.count, "_count")
+            if stats.requests:
+                sent.add(labels, stats.bytes_sent)
+                received.add(labels, stats.bytes_received)
+            for reason, count in sorted(stats.retries.items()):
+                retries.add(labels + (("reason", reason),), count)
+            if stats.rate_limits:
+                rate_limited.add(labels, stats.rate_limits)
+                retry_after.add(labels, stats.retry_after_seconds)
+            if stats.gate_wait_seconds:
+                gate_wait.add(labels, stats.gate_wait_seconds)
+            if stats.limiter_wait_seconds:
+                limiter_wait.add(labels, stats.limiter_wait_seconds)
+            if stats.pages:
+                pages.add((("endpoint", endpoint),), stats.pages)
+
+    def _collect_sessions(self, families):
+        in_flight = self._family(
+            families,
+            "session_in_flight_requests",
+            "gauge",
+            "Requests in flight on the session, including those waiting for a rate limit or a retry.",
+        )
+        pool_active = self._family(
+            families,
+            "pool_active_requests",
+            "gauge",
+            "Requests using a connection of the session's connection pool.",
+        )
+        max_connections = self._family(
+            families,
+            "pool_max_connections",
+            "gauge",
+            "Maximum number of connections in the session's connection pool.",
+        )
+        saturation = self._family(
+            families,
+            "pool_saturation_ratio",
+            "gauge",
+            "Requests using a pool connection divided by the pool's maximum number of connections.",
+        )
+        queue_depth = self._family(
+            families,
+            "rate_limiter_queue_depth",
+            "gauge",
+            "Requests waiting for the client-side rate limiter.",
+        )
+        gate_closed = self._family(
+            families,
+            "rate_limit_gate_closed",
+            "gauge",
+            "1 while the session holds requests after a rate-limit response.",
+        )
+        retries = self._family(families, "session_retries_total", "counter", "Requests retried, by reason.")
+
+        cache_hits = self._family(families, "cache_hits_total", "counter", "GETs answered from the response cache.")
+        cache_misses = self._family(families, "cache_misses_total", "counter", "GETs not answered from the cache.")
+        cache_revalidations = self._family(
+            families,
+            "cache_revalidations_total",
+            "counter",
+            "Cached responses revalidated with a conditional request.",
+        )
+        cache_evictions = self._family(families, "cache_evictions_total", "counter", "Cached responses evicted.")
+        cache_entries = self._family(families, "cache_entries", "gauge", "Responses in the cache.")
+        cache_hit_ratio = self._family(families, "cache_hit_ratio", "gauge", "Share of cache lookups that hit.")
+
+        pools = {}
+        caches = {}
+        for name, session in sorted(self._sessions.items()):
+            labels = (("session", name),)
+            in_flight.add(labels, session.in_flight)
+            # A pool shared by several sessions (e.g. tenants) is reported once
+            pools.setdefault(id(session.client), (name, session))
+            if session.rate_limiter is not None:
+                queue_depth.add(labels, session.rate_limiter.queue_depth)
+            gate_closed.add(labels, int(session.rate_limit_gate.is_closed))
+            for reason, count in sorted(session.retry_counts.items()):
+                retries.add(labels + (("reason", reason),), count)
+            if session.cache is not None:
+                # A cache shared by several sessions is reported once
+                caches.setdefault(id(session.cache), (name, session.cache))
+
+        for name, session in pools.values():
+            labels = (("session", name),)
+            pool_active.add(labels, session.pool_active_requests)
+            if session.pool_max_connections:
+                max_connections.add(labels, session.pool_max_connections)
+                saturation.add(labels, session.pool_active_requests / session.pool_max_connections)
+
+        for name, cache in caches.values():
+            labels = (("session", name),)
+            cache_hits.add(labels, cache.hits)
+            cache_misses.add(labels, cache.misses)
+            cache_revalidations.add(labels, cache.revalidations)
+            cache_evictions.add(labels, cache.evictions)
+            cache_entries.add(labels, len(cache))
+            cache_hit_ratio.add(labels, cache.hit_ratio)
+
+    def render(self):
+        """Return the current metrics in the Prometheus text format.
+
+        Returns:
+            str: The metrics exposition, ending with a newline.
+
+        """
+        families = []
+        if self._collector is not None:
+            self._collect_requests(families)
+        self._collect_sessions(families)
+
+        lines = []
+        for family in families:
+            family.render(lines)
+        return "\n".join(lines) + "\n"
@@ -119,7 +119,7 @@ class ImmutableData:
 
     @property
     def json_data(self):
-        """A copy of the data object's JSON data (OrderedDict)."""
+        """A copy of the data object's JSON data (dict)."""
         # TODO: When we move to Python v3+ only; use MappingProxyType.
         return self._json_data.copy()
 
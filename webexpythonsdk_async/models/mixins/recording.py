@@ -68,6 +68,12 @@ class RecordingBasicPropertiesMixin(object):
         """The download link for recording."""
         return self._json_data.get("downloadUrl")
 
+    @property
+    def temporaryDirectDownloadLinks(self):
+        """Temporary direct download links of the recording, audio and
+        transcript files, with their expiration time."""
+        return self._json_data.get("temporaryDirectDownloadLinks")
+
     @property
     def playbackUrl(self):
         """The playback link for recording."""
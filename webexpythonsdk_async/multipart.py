@@ -0,0 +1,230 @@
+import asyncio
+import logging
+import mimetypes
+import os
+import secrets
+
+from .config import DEFAULT_UPLOAD_CHUNK_SIZE
+from .json_backends import get_json_backend
+from .utils import check_type, is_local_file
+
+
+logger = logging.getLogger(__name__)
+
+
+# Headers preceding each part of a multipart/form-data body
+_FILE_PART_HEADER = '--{}\r\nContent-Disposition: form-data; name="{}"; filename="{}"\r\nContent-Type: {}\r\n\r\n'
+_FIELD_PART_HEADER = '--{}\r\nContent-Disposition: form-data; name="{}"\r\n\r\n'
+
+
+class UploadFile(object):
+    """A file to be uploaded, read in chunks without blocking the event loop.
+
+    The source may be:
+
+      * the path of a local file, opened and read in a worker thread;
+      * a binary file object, read in a worker thread (seekable file objects
+        are rewound to their initial position when the upload is resent);
+      * bytes, bytearray or memoryview data;
+      * an async iterable of bytes, which can only be sent once.
+
+    """
+
+    def __init__(self, source, filename=None, content_type=None):
+        """Initialize a new UploadFile.
+
+        Args:
+            source: The file contents; see the class description.
+            filename(str): The file name sent to the Webex cloud. Defaults to
+                the base name of the path or file object; required for other
+                sources.
+            content_type(str): The content type of the file. Defaults to the
+                type guessed from the file name.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If a path is not a local file, or no file name is
+                given for a source without one.
+
+        """
+        check_type(filename, str, optional=True)
+        check_type(content_type, str, optional=True)
+
+        self._source = source
+        self._start = None
+        if isinstance(source, str):
+            if not is_local_file(source):
+                raise ValueError("{!r} is not a path to a local file.".format(source))
+            self._kind = "path"
+            filename = filename or os.path.basename(source)
+            self.size = os.path.getsize(source)
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            self._kind = "data"
+            self._source = memoryview(source).cast("B")
+            self.size = self._source.nbytes
+        elif hasattr(source, "read"):
+            self._kind = "file"
+            name = getattr(source, "name", None)
+            if not filename and isinstance(name, str):
+                filename = os.path.basename(name)
+            self.size = None
+            if source.seekable():
+                self._start = source.tell()
+                self.size = source.seek(0, os.SEEK_END) - self._start
+                source.seek(self._start)
+        elif hasattr(source, "__aiter__"):
+            self._kind = "stream"
+            self.size = None
+        else:
+            raise TypeError(
+                "An upload must be a path, file object, bytes or async iterable of bytes; received: {!r}".format(source)
+            )
+
+        if not filename:
+            raise ValueError("A file name is required to upload {!r}.".format(source))
+        self.filename = filename
+        self.content_type = content_type or mimetypes.guess_type(filename)[0] or "text/plain"
+
+    async def chunks(self, chunk_size=DEFAULT_UPLOAD_CHUNK_SIZE):
+        """Yield the file contents in chunks of up to `chunk_size` bytes."""
+        if self._kind == "data":
+            for offset in range(0, self.size, chunk_size):
+                yield bytes(self._source[offset : offset + chunk_size])
+
+        elif self._kind == "stream":
+            async for chunk in self._source:
+                yield bytes(chunk)
+
+        elif self._kind == "file":
+            if self._start is not None:
+                await asyncio.to_thread(self._source.seek, self._start)
+            async for chunk in _read_chunks(self._source, chunk_size):
+                yield chunk
+
+        else:
+            file_object = await asyncio.to_thread(open, self._source, "rb")
+            try:
+                async for chunk in _read_chunks(file_object, chunk_size):
+                    yield chunk
+            finally:
+                await asyncio.to_thread(file_object.close)
+
+    def __repr__(self):
+        return "UploadFile(filename={!r}, content_type={!r}, size={!r})".format(
+            self.filename,
+            self.content_type,
+            self.size,
+        )
+
+
+async def _read_chunks(file_object, chunk_size):
+    while True:
+        chunk = await asyncio.to_thread(file_object.read, chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+class MultipartEncoder(object):
+    """Streaming multipart/form-data request body.
+
+    An async iterable of bytes, passed to httpx as the request `content`:
+    the form fields are encoded up front and the files are streamed in
+    chunks as the request is sent, so they are never loaded into memory.
+    The body can be iterated again (e.g. when a rate-limited request is
+    resent) unless it streams from an async iterator.
+
+    Example:
+        encoder = MultipartEncoder({"roomId": room_id, "files": UploadFile(path)})
+        await session.post("messages", content=encoder, headers=encoder.headers)
+
+    """
+
+    def __init__(self, fields, boundary=None, chunk_size=DEFAULT_UPLOAD_CHUNK_SIZE, on_progress=None):
+        """Initialize a new MultipartEncoder.
+
+        Args:
+            fields(dict): The form fields; UploadFile values are sent as
+                files, str values as text and other values as JSON.
+            boundary(str): The multipart boundary. Defaults to a random one.
+            chunk_size(int): The size of the file chunks read and sent.
+            on_progress(callable): Called with the number of bytes sent and
+                the total body size (None when unknown) as the body is sent.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+
+        """
+        check_type(fields, dict)
+        check_type(boundary, str, optional=True)
+        check_type(chunk_size, int)
+        if on_progress is not None and not callable(on_progress):
+            raise TypeError("on_progress must be callable; received: {!r}".format(on_progress))
+
+        self.boundary = boundary or secrets.token_hex(16)
+        self._chunk_size = chunk_size
+        self._on_progress = on_progress
+
+        # The encoded part headers (and field values) preceding each file
+        self._parts = []
+        json_backend = get_json_backend()
+        for name, value in fields.items():
+            if isinstance(value, UploadFile):
+                header = _FILE_PART_HEADER.format(self.boundary, name, value.filename, value.content_type)
+                self._parts.append((header.encode("utf-8"), value))
+            else:
+                data = value.encode("utf-8") if isinstance(value, str) else json_backend.dumps(value)
+                header = _FIELD_PART_HEADER.format(self.boundary, name)
+                self._parts.append((header.encode("utf-8") + data, None))
+        self._trailer = "--{}--\r\n".format(self.boundary).encode("utf-8")
+
+    @property
+    def content_type(self):
+        """The Content-Type of the body, including the boundary."""
+        return "multipart/form-data; boundary={}".format(self.boundary)
+
+    @property
+    def content_length(self):
+        """The size of the body in bytes; None when a file size is unknown."""
+        length = len(self._trailer)
+        for header, upload in self._parts:
+            length += len(header) + 2
+            if upload is not None:
+                if upload.size is None:
+                    return None
+                length += upload.size
+        return length
+
+    @property
+    def headers(self):
+        """The request headers describing the body."""
+        headers = {"Content-Type": self.content_type}
+        content_length = self.content_length
+        if content_length is not None:
+            headers["Content-Length"] = str(content_length)
+        return headers
+
+    async def __aiter__(self):
+        total = self.content_length
+        sent = 0
+        for header, upload in self._parts:
+            yield header
+            sent += len(header)
+            if upload is not None:
+                async for chunk in upload.chunks(self._chunk_size):
+                    yield chunk
+                    sent += len(chunk)
+                    self._report(sent, total)
+            yield b"\r\n"
+            sent += 2
+        yield self._trailer
+        sent += len(self._trailer)
+        self._report(sent, total)
+
+    def _report(self, sent, total):
+        if self._on_progress is None:
+            return
+        try:
+            self._on_progress(sent, total)
+        except Exception:
+            logger.exception("Upload progress callback %r failed.", self._on_progress)
@@ -0,0 +1,313 @@
+import asyncio
+import logging
+import random
+import time
+
+from .config import DEFAULT_RATE_LIMIT_JITTER
+from .utils import check_type
+
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitGate(object):
+    """Session-wide gate that holds requests back after a rate-limit response.
+
+    When any request on a session receives a 429 response, the gate is closed
+    until the `Retry-After` deadline has passed.  Every request sent through
+    the session waits at the gate, so a single rate-limit response pauses all
+    of the tasks sharing the access token instead of letting them keep firing
+    requests into the same limit.
+
+    Waiting tasks are released with a random jitter, spreading the first
+    requests after the deadline instead of sending them in one burst.
+
+    """
+
+    def __init__(self, jitter=DEFAULT_RATE_LIMIT_JITTER):
+        """Initialize a new, open RateLimitGate.
+
+        Args:
+            jitter(int,float): Maximum number of seconds of random delay
+                added when releasing each waiting request.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If jitter is negative.
+
+        """
+        check_type(jitter, (int, float))
+        if jitter < 0:
+            raise ValueError("jitter must not be negative")
+
+        self._jitter = jitter
+        self._deadline = 0.0
+
+    @property
+    def jitter(self):
+        """Maximum random delay (seconds) added when releasing a request."""
+        return self._jitter
+
+    @property
+    def is_closed(self):
+        """Whether requests are currently being held at the gate."""
+        return self._deadline > time.monotonic()
+
+    @property
+    def retry_after(self):
+        """Seconds remaining until the gate opens; 0 when the gate is open."""
+        return max(0.0, self._deadline - time.monotonic())
+
+    def hold(self, retry_after):
+        """Close the gate for `retry_after` seconds.
+
+        An already closed gate is only ever extended, never shortened.
+
+        Args:
+            retry_after(int,float): Seconds to hold requests at the gate.
+
+        """
+        deadline = time.monotonic() + retry_after
+        if deadline > self._deadline:
+            logger.debug("Rate-limit gate closed for %s seconds.", retry_after)
+            self._deadline = deadline
+
+    async def wait(self):
+        """Wait until the gate is open.
+
+        Returns:
+            float: The number of seconds spent waiting at the gate.
+
+        """
+        waited = 0.0
+        while True:
+            remaining = self._deadline - time.monotonic()
+            if remaining <= 0:
+                return waited
+
+            delay = remaining + random.uniform(0, self._jitter)
+            await asyncio.sleep(delay)
+            waited += delay
+
+
+class TokenBucket(object):
+    """Token bucket pacing the requests sent to one endpoint family.
+
+    The bucket holds up to `capacity` tokens and is refilled at `rate` tokens
+    per second.  Each request consumes one token; when the bucket is empty,
+    requests queue (in FIFO order) until a token becomes available.
+
+    The bucket adapts to rate-limit responses: a 429 empties the bucket and
+    halves its refill rate (never below `min_rate`), and each successful
+    request then restores a small fraction of the configured rate until it
+    is back at its original value.
+
+    """
+
+    def __init__(self, rate, capacity=None, min_rate=None, recovery=0.05):
+        """Initialize a new, full TokenBucket.
+
+        Args:
+            rate(int,float): Refill rate in tokens (requests) per second.
+            capacity(int,float): Maximum burst size. Defaults to `rate`
+                (one second worth of requests), and at least one token.
+            min_rate(int,float): Lowest refill rate the bucket will adapt
+                down to. Defaults to 10% of `rate`.
+            recovery(int,float): Fraction of the configured rate restored
+                after each successful request while the bucket is slowed.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If rate or capacity are not positive.
+
+        """
+        check_type(rate, (int, float))
+        check_type(capacity, (int, float), optional=True)
+        check_type(min_rate, (int, float), optional=True)
+        check_type(recovery, (int, float))
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity is not None and capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self._max_rate = float(rate)
+        self._rate = float(rate)
+        self._min_rate = float(min_rate) if min_rate else self._max_rate / 10
+        self._capacity = float(capacity) if capacity else max(1.0, self._max_rate)
+        self._recovery = recovery
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._waiters = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate(self):
+        """The current refill rate (tokens per second)."""
+        return self._rate
+
+    @property
+    def capacity(self):
+        """The maximum number of tokens held by the bucket."""
+        return self._capacity
+
+    @property
+    def tokens(self):
+        """The number of tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    @property
+    def queue_depth(self):
+        """The number of requests waiting for a token."""
+        return self._waiters
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Wait for, and consume, one token.
+
+        Returns:
+            float: The number of seconds spent waiting for the token.
+
+        """
+        start = time.monotonic()
+        self._waiters += 1
+        try:
+            async with self._lock:
+                while True:
+                    self._refill()
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return time.monotonic() - start
+                    await asyncio.sleep((1 - self._tokens) / self._rate)
+        finally:
+            self._waiters -= 1
+
+    def observe_rate_limit(self, retry_after):
+        """Slow the bucket down after a rate-limit response.
+
+        Args:
+            retry_after(int,float): The `Retry-After` value (seconds) received
+                from Webex.
+
+        """
+        self._refill()
+        self._tokens = 0.0
+        # Never refill faster than one burst per Retry-After window
+        self._rate = max(self._min_rate, min(self._rate / 2, self._capacity / max(retry_after, 1)))
+        logger.debug("Token bucket rate reduced to %.2f requests/second.", self._rate)
+
+    def observe_success(self):
+        """Restore part of the configured rate after a successful request."""
+        if self._rate < self._max_rate:
+            self._rate = min(self._max_rate, self._rate + self._max_rate * self._recovery)
+
+
+class RateLimiter(object):
+    """Proactive client-side rate limiter with per-endpoint-family buckets.
+
+    Requests are grouped into endpoint families by the first path segment
+    of their URL, relative to the session's base URL (`messages`,
+    `memberships`, `people`, ...).  Each family has its own TokenBucket, so a
+    burst of message posts does not delay people lookups.
+
+    Example:
+        limiter = RateLimiter(
+            buckets={"messages": (5, 10), "memberships": 10},
+            default=20,
+        )
+        api = AsyncWebexAPI(access_token=token, rate_limiter=limiter)
+
+    """
+
+    def __init__(self, buckets=None, default=None, recovery=0.05):
+        """Initialize a new RateLimiter.
+
+        Args:
+            buckets(dict): Maps endpoint family names to a rate (requests per
+                second) or to a (rate, capacity) tuple.
+            default(int,float,tuple): Rate, or (rate, capacity) tuple, for
+                families that are not listed in `buckets`. None (the default)
+                leaves unlisted families unlimited.
+            recovery(int,float): Fraction of the configured rate restored
+                after each successful request while a bucket is slowed.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+
+        """
+        check_type(buckets, dict, optional=True)
+        check_type(default, (int, float, tuple), optional=True)
+        check_type(recovery, (int, float))
+
+        self._recovery = recovery
+        self._default = default
+        self._buckets = {}
+        for family, spec in (buckets or {}).items():
+            self._buckets[family] = self._new_bucket(spec)
+
+    def _new_bucket(self, spec):
+        if isinstance(spec, tuple):
+            rate, capacity = spec
+        else:
+            rate, capacity = spec, None
+        return TokenBucket(rate, capacity, recovery=self._recovery)
+
+    def bucket(self, family):
+        """Return the TokenBucket for an endpoint family, or None.
+
+        Args:
+            family(str): The endpoint family (e.g. "messages").
+
+        Returns:
+            TokenBucket: The family's bucket; None if the family is unlimited.
+
+        """
+        bucket = self._buckets.get(family)
+        if bucket is None and self._default is not None:
+            bucket = self._buckets[family] = self._new_bucket(self._default)
+        return bucket
+
+    @property
+    def queue_depth(self):
+        """The total number of requests waiting across all buckets."""
+        return sum(bucket.queue_depth for bucket in self._buckets.values())
+
+    def queue_depths(self):
+        """Return the number of requests waiting, by endpoint family.
+
+        Returns:
+            dict: Maps endpoint family names to their queue depth.
+
+        """
+        return {family: bucket.queue_depth for family, bucket in self._buckets.items()}
+
+    async def acquire(self, family):
+        """Wait until a request to `family` may be sent.
+
+        Args:
+            family(str): The endpoint family (e.g. "messages").
+
+        Returns:
+            float: The number of seconds spent waiting.
+
+        """
+        bucket = self.bucket(family)
+        if bucket is None:
+            return 0.0
+        return await bucket.acquire()
+
+    def observe_rate_limit(self, family, retry_after):
+        """Adapt the family's bucket to a rate-limit response."""
+        bucket = self.bucket(family)
+        if bucket is not None:
+            bucket.observe_rate_limit(retry_after)
+
+    def observe_success(self, family):
+        """Let the family's bucket recover after a successful request."""
+        bucket = self.bucket(family)
+        if bucket is not None:
+            bucket.observe_success()
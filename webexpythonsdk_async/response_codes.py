@@ -1,6 +1,7 @@
 RESPONSE_CODES = {
     200: "Successful request with body content.",
     204: "Successful request without body content.",
+    304: "The resource has not been modified since it was last retrieved.",
     400: "The request was invalid or cannot be otherwise served.",
     401: "Authentication credentials were missing or incorrect.",
     403: "The request is understood, but it has been refused or access is not allowed.",
@@ -29,6 +30,10 @@ RESPONSE_CODES = {
     503: "Server is overloaded with requests. Try again later.",
 }
 
+NOT_MODIFIED_RESPONSE_CODE = 304
+
 RATE_LIMIT_RESPONSE_CODE = 429
 
+RETRYABLE_RESPONSE_CODES = (423, 500, 502, 503, 504)
+
 EXPECTED_RESPONSE_CODE = {"GET": 200, "POST": 200, "PUT": 200, "DELETE": 204}
@@ -1,3 +1,6 @@
+import contextlib
+import contextvars
+import functools
 import json
 import logging
 import platform
@@ -6,17 +9,37 @@ import time
 import urllib
 import urllib.parse
 import warnings
+import weakref
+from collections import Counter
 
 import httpx
 import asyncio
 
 from ._metadata import __title__, __version__
-from .config import DEFAULT_SINGLE_REQUEST_TIMEOUT, DEFAULT_WAIT_ON_RATE_LIMIT
-from .exceptions import MalformedResponse, RateLimitError, RateLimitWarning
-from .response_codes import EXPECTED_RESPONSE_CODE
+from .cache import ResponseCache
+from .config import (
+    DEFAULT_HTTP2,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_PAGE_PREFETCH,
+    DEFAULT_RATE_LIMIT_JITTER,
+    DEFAULT_SINGLE_REQUEST_TIMEOUT,
+    DEFAULT_WAIT_ON_RATE_LIMIT,
+)
+from .exceptions import ApiError, MalformedResponse, RateLimitError, RateLimitWarning
+from .instrumentation import EventHooks, PageEvent, RequestEvent
+from .json_backends import get_json_backend
+from .ratelimit import RateLimitGate, RateLimiter
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
+from .streaming import iter_json_items
+from .response_codes import EXPECTED_RESPONSE_CODE, NOT_MODIFIED_RESPONSE_CODE
 from .utils import (
     check_response_code,
     check_type,
+    endpoint_family,
+    endpoint_template,
     extract_and_parse_json,
     validate_base_url,
 )
@@ -25,6 +48,67 @@ from .utils import (
 logger = logging.getLogger(__name__)
 
 
+# Headers added to every request sent from the current context
+_scoped_headers = contextvars.ContextVar("webexpythonsdk_async_scoped_headers", default=None)
+
+# Whether paginated requests started from the current context skip prefetching
+_prefetch_disabled = contextvars.ContextVar("webexpythonsdk_async_prefetch_disabled", default=False)
+
+
+class _PoolUsage(object):
+    """The requests using the connection pool of one httpx.AsyncClient."""
+
+    __slots__ = ("max_connections", "active")
+
+    def __init__(self, max_connections=None):
+        self.max_connections = max_connections
+        self.active = 0
+
+    def release(self):
+        self.active -= 1
+
+
+# The pool usage of each client, shared by every session using the client
+_pool_usage = weakref.WeakKeyDictionary()
+
+
+@contextlib.contextmanager
+def _no_page_prefetch():
+    """Context manager disabling page prefetching for listings started within it."""
+    token = _prefetch_disabled.set(True)
+    try:
+        yield
+    finally:
+        _prefetch_disabled.reset(token)
+
+
+@contextlib.contextmanager
+def request_headers(headers):
+    """Context manager adding headers to the requests sent within it.
+
+    The headers apply to every request sent from the current task (and the
+    tasks it creates) while the context is active, on any session, without
+    modifying the session headers shared with other tasks.  Nested scopes
+    are merged, with inner values taking precedence; headers passed
+    directly to a request take precedence over scoped headers.
+
+    Example:
+        with request_headers({"timezone": "Europe/Berlin"}):
+            async for meeting in api.meetings.list():
+                ...
+
+    Args:
+        headers(dict): The headers to add.
+
+    """
+    check_type(headers, dict)
+    token = _scoped_headers.set({**(_scoped_headers.get() or {}), **headers})
+    try:
+        yield
+    finally:
+        _scoped_headers.reset(token)
+
+
 # Helper Functions
 def _fix_next_url(next_url: str, params: dict):
     """Remove max=null parameter from URL.
@@ -73,6 +157,36 @@ def _fix_next_url(next_url: str, params: dict):
     return urllib.parse.urlunparse(parsed_url)
 
 
+class _ClosingStream(httpx.AsyncByteStream):
+    """Response body stream calling `on_close` once, when it is closed."""
+
+    def __init__(self, stream, on_close):
+        self._stream = stream
+        self._on_close = on_close
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            on_close, self._on_close = self._on_close, None
+            if on_close is not None:
+                on_close()
+
+
+def _is_expected_response_code(status_code, erc):
+    """Whether a status code matches an expected response code (or codes)."""
+    return status_code in erc if isinstance(erc, tuple) else status_code == erc
+
+
+def _cache_url(abs_url):
+    """Normalize an absolute URL for ResponseCache entry matching."""
+    return abs_url.split("?", 1)[0].rstrip("/")
+
+
 def user_agent(be_geo_id=None, caller=None):
     """Build a User-Agent HTTP header string."""
 
@@ -139,6 +253,78 @@ def user_agent(be_geo_id=None, caller=None):
     return user_agent_string
 
 
+def _build_async_client(
+    max_connections=DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+    http2=DEFAULT_HTTP2,
+    proxies=None,
+    disable_ssl_verify=False,
+    transport=None,
+):
+    """Build the pooled httpx.AsyncClient used by an AsyncRestSession.
+
+    Args:
+        max_connections(int): Maximum number of concurrent connections in the
+            pool; None for no limit.
+        max_keepalive_connections(int): Maximum number of idle connections
+            kept alive in the pool; None for no limit.
+        keepalive_expiry(float): Seconds an idle keep-alive connection is
+            kept open; None to keep idle connections open indefinitely.
+        http2(bool): Negotiate HTTP/2 with the server when possible.
+            Requires the `h2` package (`pip install httpx[http2]`).
+        proxies(dict): requests-style proxies dictionary mapping a scheme
+            ("http", "https") or URL pattern to a proxy URL.
+        disable_ssl_verify(bool): Disable SSL certificate verification.
+        transport(httpx.AsyncBaseTransport): Send the requests through this
+            transport instead of the network (e.g. a FakeWebexTransport);
+            the other arguments are then ignored.
+
+    Returns:
+        httpx.AsyncClient: A new client with the requested pool settings.
+
+    Raises:
+        ImportError: If `http2` is requested and the `h2` package is not
+            installed.
+
+    """
+    if transport is not None:
+        client = httpx.AsyncClient(transport=transport)
+        _pool_usage[client] = _PoolUsage()
+        return client
+
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    verify = not disable_ssl_verify
+
+    mounts = None
+    if proxies:
+        # Map requests-style {"https": "http://proxy:3128"} entries to httpx
+        # mount patterns, sharing the pool settings with every proxy route.
+        mounts = {}
+        for pattern, proxy_url in proxies.items():
+            if "://" not in pattern:
+                pattern = pattern + "://"
+            mounts[pattern] = httpx.AsyncHTTPTransport(
+                proxy=httpx.Proxy(proxy_url),
+                limits=limits,
+                http2=http2,
+                verify=verify,
+            )
+
+    client = httpx.AsyncClient(
+        limits=limits,
+        http2=http2,
+        verify=verify,
+        mounts=mounts,
+    )
+    _pool_usage[client] = _PoolUsage(max_connections)
+    return client
+
+
 class RestSession(object):
     """RESTful HTTP session class for making calls to the Webex APIs."""
 
@@ -533,8 +719,22 @@ class AsyncRestSession(object):
         be_geo_id=None,
         caller=None,
         disable_ssl_verify=False,
+        max_connections=DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+        http2=DEFAULT_HTTP2,
+        rate_limit_jitter=DEFAULT_RATE_LIMIT_JITTER,
+        rate_limiter=None,
+        retry_policy=None,
+        single_flight=False,
+        cache=None,
+        page_prefetch=DEFAULT_PAGE_PREFETCH,
+        stream_items=False,
+        event_hooks=None,
+        client=None,
+        transport=None,
     ):
-        """Initialize a new RestSession object.
+        """Initialize a new AsyncRestSession object.
 
         Args:
             access_token(str): The Webex access token to be used
@@ -556,9 +756,50 @@ class AsyncRestSession(object):
             disable_ssl_verify(bool): Optional boolean flag to disable ssl
                 verification. Defaults to False. If set to true, the httpx
                 client won't verify ssl certs anymore.
+            max_connections(int): Maximum number of concurrent connections
+                in the session's connection pool. None for no limit.
+            max_keepalive_connections(int): Maximum number of idle
+                connections kept alive in the pool. None for no limit.
+            keepalive_expiry(int,float): Seconds an idle keep-alive
+                connection is kept open before it is closed.
+            http2(bool): Negotiate HTTP/2 with the Webex cloud, multiplexing
+                concurrent requests over fewer connections. Requires the
+                `h2` package (`pip install webexpythonsdk_async[http2]`).
+            rate_limit_jitter(int,float): Maximum random delay (seconds)
+                added when releasing requests held after a rate-limit
+                response.
+            rate_limiter(RateLimiter): Optional proactive client-side rate
+                limiter pacing requests per endpoint family.
+            retry_policy(RetryPolicy): Policy used to retry requests that
+                fail with a transient error (5xx, 423 or a transport error).
+                Defaults to RetryPolicy(), which retries GET requests.
+            single_flight(bool): Coalesce identical concurrent GET requests
+                (same URL, parameters and access token) into a single HTTP
+                request whose parsed result is shared by all callers.
+            cache(ResponseCache): Optional cache of GET responses for the
+                endpoint families it is configured for.
+            page_prefetch(int): The number of pages paginated listings
+                fetch ahead of the consumer; 0 disables prefetching.
+            stream_items(bool): Decode paginated `items` incrementally from
+                the response stream, bounding peak memory by one item instead
+                of a whole page.
+            event_hooks(dict): Instrumentation callables, keyed by event hook
+                name ("on_request", "on_response", "on_retry",
+                "on_rate_limit" and "on_page"); see EventHooks.
+            client(httpx.AsyncClient): Optional client, and connection pool,
+                shared with other sessions (e.g. one per tenant).  The
+                session sends its own headers, including Authorization, with
+                every request and does not close a shared client; the
+                connection pool, proxy and SSL arguments are ignored.
+            transport(httpx.AsyncBaseTransport): Optional transport the
+                session's own client sends its requests through instead of
+                the network, e.g. a FakeWebexTransport for offline tests and
+                benchmarks.
 
         Raises:
             TypeError: If the parameter types are incorrect.
+            ValueError: If the connection pool limits or page_prefetch are
+                out of range, or an event hook name is unknown.
 
         """
         check_type(access_token, str)
@@ -567,6 +808,27 @@ class AsyncRestSession(object):
         check_type(wait_on_rate_limit, bool)
         check_type(proxies, dict, optional=True)
         check_type(disable_ssl_verify, bool, optional=True)
+        check_type(max_connections, int, optional=True)
+        check_type(max_keepalive_connections, int, optional=True)
+        check_type(keepalive_expiry, (int, float), optional=True)
+        check_type(http2, bool)
+        check_type(rate_limit_jitter, (int, float))
+        check_type(rate_limiter, RateLimiter, optional=True)
+        check_type(retry_policy, RetryPolicy, optional=True)
+        check_type(single_flight, bool)
+        check_type(cache, ResponseCache, optional=True)
+        check_type(page_prefetch, int)
+        check_type(stream_items, bool)
+        check_type(event_hooks, dict, optional=True)
+        check_type(client, httpx.AsyncClient, optional=True)
+        check_type(transport, httpx.AsyncBaseTransport, optional=True)
+        if page_prefetch < 0:
+            raise ValueError("page_prefetch must not be negative")
+
+        if max_connections is not None and max_connections <= 0:
+            raise ValueError("max_connections must be a positive integer")
+        if max_keepalive_connections is not None and max_keepalive_connections < 0:
+            raise ValueError("max_keepalive_connections must not be negative")
 
         super().__init__()
 
@@ -576,17 +838,57 @@ class AsyncRestSession(object):
         self._single_request_timeout = single_request_timeout
         self._wait_on_rate_limit = wait_on_rate_limit
 
-        # Initialize a new session
-        # self._req_session = requests.session()
-        self._req_session = httpx.AsyncClient()
+        self._max_connections = max_connections
+        self._max_keepalive_connections = max_keepalive_connections
+        self._keepalive_expiry = keepalive_expiry
+        self._http2 = http2
+
+        # Initialize a new pooled client, unless a shared one is provided
+        self._owns_client = client is None
+        if client is None:
+            client = _build_async_client(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+                http2=http2,
+                proxies=proxies,
+                disable_ssl_verify=disable_ssl_verify,
+                transport=transport,
+            )
+        self._req_session = client
+        # The connection limit of clients the package did not build is unknown
+        self._pool = _pool_usage.setdefault(client, _PoolUsage())
 
-        # Disable ssl cert verification if chosen by user
-        if disable_ssl_verify:
-            self._req_session.verify = False
-            # self._req_session.verify = False
+        # Session headers are sent with each request rather than set on the
+        # client, which may be shared with sessions using other tokens
+        self._headers = httpx.Headers()
 
-        if proxies is not None:
-            self._req_session.proxies.update(proxies)
+        # Lifecycle state; aclose() waits for in-flight requests to drain
+        self._closed = False
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+        # A rate-limit response pauses every request sent on this session
+        self._rate_limit_gate = RateLimitGate(jitter=rate_limit_jitter)
+        self._rate_limiter = rate_limiter
+
+        # Transient failures are retried according to the retry policy
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._retry_counts = Counter()
+
+        # Identical concurrent GETs share one request when enabled
+        self._single_flight = SingleFlight() if single_flight else None
+
+        # Optional GET response cache, invalidated by PUT and DELETE requests
+        self._cache = cache
+
+        # Pages fetched ahead of the consumer by get_pages()
+        self._page_prefetch = page_prefetch
+        self._stream_items = stream_items
+
+        # Instrumentation callbacks; no events are built when there are none
+        self._event_hooks = EventHooks(event_hooks)
 
         # Update the HTTP headers for the session
         self.update_headers(
@@ -627,7 +929,8 @@ class AsyncRestSession(object):
         This setting enables or disables automatic rate-limit handling.  When
         enabled, rate-limited requests will be automatically be retried after
         waiting `Retry-After` seconds (provided by Webex in the
-        rate-limit response header).
+        rate-limit response header).  While waiting, every other request sent
+        on this session is held back until the `Retry-After` deadline.
 
         """
         return self._wait_on_rate_limit
@@ -638,10 +941,180 @@ class AsyncRestSession(object):
         check_type(value, bool)
         self._wait_on_rate_limit = value
 
+    @property
+    def rate_limit_gate(self):
+        """The RateLimitGate shared by all requests sent on this session."""
+        return self._rate_limit_gate
+
+    @property
+    def rate_limiter(self):
+        """The proactive RateLimiter used by this session, if any."""
+        return self._rate_limiter
+
+    @property
+    def retry_policy(self):
+        """The RetryPolicy applied to requests sent on this session."""
+        return self._retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, value):
+        """Set the RetryPolicy applied to requests sent on this session."""
+        check_type(value, RetryPolicy)
+        self._retry_policy = value
+
+    @property
+    def retry_counts(self):
+        """Retries made by this session, counted by reason.
+
+        Returns:
+            collections.Counter: Maps the retried response code (e.g. "503")
+            or exception name (e.g. "ConnectError") to the number of retries.
+
+        """
+        return self._retry_counts.copy()
+
+    @property
+    def single_flight(self):
+        """The SingleFlight group coalescing GET requests; None if disabled."""
+        return self._single_flight
+
+    @property
+    def cache(self):
+        """The ResponseCache used for GET requests; None if disabled."""
+        return self._cache
+
+    @property
+    def page_prefetch(self):
+        """The number of pages paginated listings fetch ahead."""
+        return self._page_prefetch
+
+    @page_prefetch.setter
+    def page_prefetch(self, value):
+        """Set the number of pages paginated listings fetch ahead."""
+        check_type(value, int)
+        if value < 0:
+            raise ValueError("page_prefetch must not be negative")
+        self._page_prefetch = value
+
+    @property
+    def stream_items(self):
+        """Whether paginated `items` are decoded from the response stream."""
+        return self._stream_items
+
+    @stream_items.setter
+    def stream_items(self, value):
+        """Enable or disable incremental decoding of paginated `items`."""
+        check_type(value, bool)
+        self._stream_items = value
+
+    @property
+    def event_hooks(self):
+        """The session's EventHooks; use `event_hooks.add()` to register more."""
+        return self._event_hooks
+
+    @property
+    def max_connections(self):
+        """Maximum number of concurrent connections in the pool."""
+        return self._max_connections
+
+    @property
+    def max_keepalive_connections(self):
+        """Maximum number of idle keep-alive connections in the pool."""
+        return self._max_keepalive_connections
+
+    @property
+    def keepalive_expiry(self):
+        """Seconds an idle keep-alive connection is kept open."""
+        return self._keepalive_expiry
+
+    @property
+    def http2(self):
+        """Whether HTTP/2 is negotiated with the Webex cloud."""
+        return self._http2
+
+    @property
+    def closed(self):
+        """Whether this session has been closed."""
+        return self._closed
+
+    @property
+    def in_flight(self):
+        """The number of requests currently in flight on this session.
+
+        Includes requests waiting for the rate-limit gate, the rate limiter
+        or a retry, and streamed responses that have not been closed.
+
+        """
+        return self._in_flight
+
+    @property
+    def pool_active_requests(self):
+        """The number of requests using a connection of the client's pool.
+
+        Counts the requests being sent, and streamed responses being read,
+        through the session's client by every session sharing it.
+
+        """
+        return self._pool.active
+
+    @property
+    def pool_max_connections(self):
+        """The connection limit of the client's pool; None if unknown."""
+        return self._pool.max_connections
+
+    async def aclose(self, timeout=None):
+        """Close the session and release its connection pool.
+
+        New requests are refused as soon as this method is called.  Requests
+        that are already in flight are allowed to complete before the
+        underlying connection pool is closed.
+
+        Args:
+            timeout(int,float): Maximum number of seconds to wait for
+                in-flight requests to complete. None (the default) waits
+                indefinitely.  When the timeout expires the pool is closed
+                anyway and any outstanding requests fail.
+
+        """
+        check_type(timeout, (int, float), optional=True)
+
+        if self._closed or self._req_session.is_closed:
+            self._closed = True
+            return
+
+        self._closed = True
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Closing session with %d request(s) still in flight.",
+                self._in_flight,
+            )
+        finally:
+            # A shared client is closed by its owner
+            if self._owns_client:
+                await self._req_session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    @property
+    def client(self):
+        """The httpx.AsyncClient (and connection pool) used by the session."""
+        return self._req_session
+
+    @property
+    def owns_client(self):
+        """Whether the session created, and closes, its client."""
+        return self._owns_client
+
     @property
     def headers(self):
         """The HTTP headers used for requests in this session."""
-        return self._req_session.headers.copy()
+        return self._headers.copy()
 
     def update_headers(self, headers):
         """Update the HTTP headers used for requests in this session.
@@ -651,12 +1124,16 @@ class AsyncRestSession(object):
         new key-value pairs and/or updating the values of existing keys. The
         session headers are not replaced by the provided dictionary.
 
+        The session headers are shared by every task using the session; use
+        the `headers` request argument or `request_headers()` for headers
+        that only apply to some requests.
+
         Args:
              headers(dict): Updates to the current session headers.
 
         """
         check_type(headers, dict)
-        self._req_session.headers.update(headers)
+        self._headers.update(headers)
 
     def abs_url(self, url):
         """Given a relative or absolute URL; return an absolute URL.
@@ -676,13 +1153,14 @@ class AsyncRestSession(object):
             # url is already an absolute URL; return as is
             return url
 
-    async def request(self, method, url, erc, **kwargs):
+    async def request(self, method, url, erc, stream=False, **kwargs):
         """Abstract base method for making requests to the Webex APIs.
 
         This base method:
             * Expands the API endpoint URL to an absolute URL
             * Makes the actual HTTP request to the API endpoint
             * Provides support for Webex rate-limiting
+            * Retries transient failures according to the retry policy
             * Inspects response codes and raises exceptions as appropriate
 
         Args:
@@ -690,39 +1168,239 @@ class AsyncRestSession(object):
             url(str): The URL of the API endpoint to be called.
             erc(int): The expected response code that should be returned by the
                 Webex API endpoint to indicate success.
-            **kwargs: Passed on to the requests package.
+            stream(bool): Return the response as soon as its headers have
+                been received, without reading the body.  The caller must
+                read or close (`await response.aclose()`) the response,
+                which counts as in flight (and holds up `aclose()`) until
+                then.
+            **kwargs:
+                headers(dict): Headers added to this request only, on top
+                    of the session headers and any `request_headers()`
+                    scope.
+                others: Passed on to the httpx package.
 
         Raises:
             ApiError: If anything other than the expected response code is
                 returned by the Webex API endpoint.
+            RuntimeError: If the session has been closed.
+
+        """
+        self._begin_request()
+        try:
+            # Apply request-scoped headers without touching the session headers
+            scoped_headers = _scoped_headers.get()
+            if scoped_headers:
+                kwargs["headers"] = {**scoped_headers, **(kwargs.get("headers") or {})}
+
+            # Encode JSON bodies once, with the package's JSON backend
+            if kwargs.get("json") is not None:
+                kwargs["content"] = get_json_backend().dumps(kwargs.pop("json"))
+            else:
+                kwargs.pop("json", None)
+
+            response = await self._request(method, url, erc, stream, **kwargs)
+        except BaseException:
+            self._end_request()
+            raise
+
+        if stream:
+            # A streamed response is in flight until its body is closed
+            self._end_request_on_close(response)
+        else:
+            self._end_request()
+        return response
+
+    def _begin_request(self):
+        """Count a request as in flight.
+
+        Raises:
+            RuntimeError: If the session has been closed.
 
         """
+        if self._closed:
+            raise RuntimeError("Cannot send a request, as the session has been closed.")
+        self._in_flight += 1
+        self._idle.clear()
+
+    def _end_request(self):
+        """Count an in-flight request as completed."""
+        self._in_flight -= 1
+        if not self._in_flight:
+            self._idle.set()
+
+    def _end_request_on_close(self, response):
+        """Complete an in-flight request once its streamed response is closed."""
+        if response.is_closed:
+            self._end_request()
+        else:
+            response.stream = _ClosingStream(response.stream, self._end_request)
+
+    async def _request(self, method, url, erc, stream, **kwargs):
+        """Send a request, retrying as needed; see `request`."""
         # Ensure the url is an absolute URL
         abs_url = self.abs_url(url)
+        family = endpoint_family(abs_url, self.base_url)
 
         # Update request kwargs with session defaults
         kwargs.setdefault("timeout", self.single_request_timeout)
+        if kwargs.get("headers"):
+            headers = self._headers.copy()
+            headers.update(kwargs["headers"])
+            kwargs["headers"] = headers
+        else:
+            kwargs["headers"] = self._headers
+
+        retry_policy = self._retry_policy
+        hooks = self._event_hooks
+        endpoint = None
+        attempt = 0
+        start = time.monotonic()
 
         while True:
+            # Hold the request while the session is rate-limited
+            identity, gate_wait = await self._acquire_identity()
+
+            attempt += 1
+            event = None
+
             # Make the HTTP request to the API endpoint
-            response = await self._req_session.request(method, abs_url, **kwargs)
+            try:
+                try:
+                    # Pace the request through the endpoint family's token bucket
+                    limiter_wait = 0.0
+                    if self._rate_limiter is not None:
+                        limiter_wait = await self._rate_limiter.acquire(family)
+
+                    http_request = self._req_session.build_request(method, abs_url, **kwargs)
+                    if identity is not None:
+                        http_request.headers["Authorization"] = identity.authorization
+                    if hooks:
+                        endpoint = endpoint or endpoint_template(abs_url, self.base_url)
+                        event = RequestEvent(
+                            method,
+                            abs_url,
+                            endpoint,
+                            attempt,
+                            gate_wait=gate_wait,
+                            limiter_wait=limiter_wait,
+                            bytes_sent=int(http_request.headers.get("Content-Length", 0)),
+                        )
+                        hooks.emit("on_request", event)
+                    sent = time.monotonic()
+                    response = await self._send(http_request, stream)
+                    if stream and not _is_expected_response_code(response.status_code, erc):
+                        # Error details are parsed from the (small) error body
+                        await response.aread()
+                finally:
+                    self._release_identity(identity)
+            except retry_policy.exceptions as e:
+                delay = retry_policy.get_retry_delay(method, attempt, time.monotonic() - start, e)
+                if delay is None:
+                    raise
+                await self._retry_after_delay(method, abs_url, attempt, delay, type(e).__name__, event, e)
+                continue
+
+            if event is not None:
+                received = time.monotonic()
+                event.status_code = response.status_code
+                event.bytes_received = response.num_bytes_downloaded if stream else len(response.content)
+                event.response_time = received - sent
+                event.total_time = received - start
+                hooks.emit("on_response", event)
 
             try:
                 # Check the response code for error conditions
                 check_response_code(response, erc)
             except RateLimitError as e:
+                # Rate-limited attempts don't count against the retry policy
+                attempt -= 1
+
+                if self._rate_limiter is not None:
+                    self._rate_limiter.observe_rate_limit(family, e.retry_after)
+
+                if event is not None:
+                    event.error = e
+                    event.retry_after = e.retry_after
+                    hooks.emit("on_rate_limit", event)
+
                 # Catch rate-limit errors
-                # Wait and retry if automatic rate-limit handling is enabled
+                # Close the session's gate and retry once it opens if
+                # automatic rate-limit handling is enabled
                 if self.wait_on_rate_limit:
                     warnings.warn(RateLimitWarning(response), stacklevel=1)
-                    await asyncio.sleep(e.retry_after)
+                    self._hold_identity(identity, e.retry_after)
                     continue
                 else:
                     # Re-raise the RateLimitError
                     raise
+            except ApiError as e:
+                delay = retry_policy.get_retry_delay(method, attempt, time.monotonic() - start, e)
+                if delay is None:
+                    raise
+                await self._retry_after_delay(method, abs_url, attempt, delay, str(e.status_code), event, e)
+                continue
             else:
+                if self._rate_limiter is not None:
+                    self._rate_limiter.observe_success(family)
                 return response
 
+    async def _send(self, http_request, stream=False):
+        """Send a request through the client, counting its use of the pool."""
+        pool = self._pool
+        pool.active += 1
+        try:
+            response = await self._req_session.send(http_request, stream=stream)
+        except BaseException:
+            pool.release()
+            raise
+        if stream and not response.is_closed:
+            # The connection is held until the streamed body is closed
+            response.stream = _ClosingStream(response.stream, pool.release)
+        else:
+            pool.release()
+        return response
+
+    async def _acquire_identity(self):
+        """Wait until a request may be sent.
+
+        Returns:
+            tuple: The identity to authorize the request with (None for the
+            session's own access token) and the seconds waited.
+
+        """
+        return None, await self._rate_limit_gate.wait()
+
+    def _release_identity(self, identity):
+        """Release the identity of an attempt once its response arrived."""
+
+    def _hold_identity(self, identity, retry_after):
+        """Hold requests sent with an identity for `retry_after` seconds."""
+        self._rate_limit_gate.hold(retry_after)
+
+    async def _retry_after_delay(self, method, url, attempt, delay, reason, event=None, error=None):
+        """Count a retry and wait `delay` seconds before it is sent."""
+        self._retry_counts[reason] += 1
+        if event is not None:
+            event.error = error
+            event.reason = reason
+            event.retry_delay = delay
+            self._event_hooks.emit("on_retry", event)
+        logger.info(
+            "Retrying %s %s in %.2f seconds (attempt %d failed: %s).",
+            method,
+            url,
+            delay,
+            attempt,
+            reason,
+        )
+        await asyncio.sleep(delay)
+
+    def _page_fetched(self, response, page):
+        """Emit the on_page event for a fetched listing page."""
+        if self._event_hooks:
+            url = str(response.url)
+            self._event_hooks.emit("on_page", PageEvent(url, endpoint_template(url, self.base_url), page))
+
     async def get(self, url, params=None, **kwargs):
         """Sends a GET request.
 
@@ -733,6 +1411,10 @@ class AsyncRestSession(object):
                 erc(int): The expected (success) response code for the request.
                 others: Passed on to the requests package.
 
+        When single-flight coalescing or the response cache are enabled,
+        callers may receive the same parsed JSON object, which must therefore
+        be treated as read-only.
+
         Raises:
             ApiError: If anything other than the expected response code is
                 returned by the Webex API endpoint.
@@ -744,19 +1426,100 @@ class AsyncRestSession(object):
         # Expected response code
         erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["GET"])
 
+        # Requests with per-call httpx arguments are never shared
+        if kwargs or (self._single_flight is None and self._cache is None):
+            return await self._get(url, params, erc, **kwargs)
+
+        key = self._request_key("GET", url, params, erc)
+        fetch = self._get
+
+        if self._cache is not None:
+            ttl = self._cache.ttl_for(endpoint_family(self.abs_url(url), self.base_url))
+            if ttl is not None:
+                entry = self._cache.get(key)
+                if entry is not None and entry.is_fresh:
+                    self._cache.hits += 1
+                    return entry.json_data
+                fetch = functools.partial(self._get_and_cache, key, ttl)
+
+        if self._single_flight is not None:
+            return await self._single_flight.do(key, fetch, url, params, erc)
+        return await fetch(url, params, erc)
+
+    async def _get(self, url, params, erc, **kwargs):
         response = await self.request("GET", url, erc, params=params, **kwargs)
         return extract_and_parse_json(response)
 
-    async def get_pages(self, url, params=None, **kwargs):
+    async def _get_and_cache(self, key, ttl, url, params, erc):
+        """GET a cacheable resource, revalidating an expired cache entry."""
+        cache_url = _cache_url(self.abs_url(url))
+        # A PUT or DELETE completing while the GET is in flight voids its body
+        generation = self._cache.generation(cache_url)
+
+        entry = self._cache.get(key)
+        if entry is not None and entry.is_fresh:
+            self._cache.hits += 1
+            return entry.json_data
+
+        if entry is not None and entry.can_revalidate:
+            response = await self.request(
+                "GET",
+                url,
+                (erc, NOT_MODIFIED_RESPONSE_CODE),
+                params=params,
+                headers=entry.conditional_headers(),
+            )
+            if response.status_code == NOT_MODIFIED_RESPONSE_CODE:
+                self._cache.hits += 1
+                self._cache.revalidations += 1
+                self._cache.refresh(key, ttl)
+                return entry.json_data
+        else:
+            response = await self.request("GET", url, erc, params=params)
+
+        self._cache.misses += 1
+        json_data = extract_and_parse_json(response)
+        self._cache.store(
+            key,
+            cache_url,
+            json_data,
+            ttl,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            generation=generation,
+        )
+        return json_data
+
+    def _request_key(self, method, url, params, erc):
+        """Return a hashable key identifying an authenticated request."""
+        return (
+            method,
+            self.abs_url(url),
+            tuple(sorted((str(k), str(v)) for k, v in (params or {}).items())),
+            erc,
+            self.access_token,
+            tuple(sorted((_scoped_headers.get() or {}).items())),
+        )
+
+    async def get_pages(self, url, params=None, prefetch=None, **kwargs):
         """Return a generator that GETs and yields pages of data.
 
         Provides native support for RFC5988 Web Linking.
 
+        With prefetching enabled, the following pages are requested in the
+        background while the current page is being consumed, overlapping
+        network time with processing time.  At most `prefetch` pages are
+        buffered ahead of the consumer.
+
         Args:
             url(str): The URL of the API endpoint.
             params(dict): The parameters for the HTTP GET request.
+            prefetch(int): The number of pages to fetch ahead of the
+                consumer; 0 disables prefetching. Defaults to the session's
+                `page_prefetch` setting.
             **kwargs:
                 erc(int): The expected (success) response code for the request.
+                headers(dict): Headers added to these requests only.
                 others: Passed on to the requests package.
 
         Raises:
@@ -766,14 +1529,31 @@ class AsyncRestSession(object):
         """
         check_type(url, str)
         check_type(params, dict, optional=True)
+        check_type(prefetch, int, optional=True)
 
         # Expected response code
         erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["GET"])
 
+        prefetch = self._page_prefetch if prefetch is None else prefetch
+        if prefetch > 0 and not _prefetch_disabled.get():
+            pages = self._prefetch_pages(url, params, erc, prefetch, **kwargs)
+        else:
+            pages = self._fetch_pages(url, params, erc, **kwargs)
+
+        # Closing this generator closes (and cancels the prefetching of) the
+        # inner one right away, rather than when it is garbage collected
+        async with contextlib.aclosing(pages):
+            async for page in pages:
+                yield page
+
+    async def _fetch_pages(self, url, params, erc, **kwargs):
+        """GET and yield pages of data, one request after the other."""
         # First request
         response = await self.request("GET", url, erc, params=params, **kwargs)
+        page = 1
 
         while True:
+            self._page_fetched(response, page)
             yield extract_and_parse_json(response)
 
             if response.links.get("next"):
@@ -789,11 +1569,40 @@ class AsyncRestSession(object):
 
                 # Subsequent requests
                 response = await self.request("GET", next_url, erc, **kwargs)
+                page += 1
 
             else:
                 break
 
-    async def get_items(self, url, params=None, **kwargs):
+    async def _prefetch_pages(self, url, params, erc, prefetch, **kwargs):
+        """GET pages in a background task, `prefetch` pages ahead."""
+        queue = asyncio.Queue(maxsize=prefetch)
+
+        async def producer():
+            try:
+                async for page in self._fetch_pages(url, params, erc, **kwargs):
+                    await queue.put((page, None))
+            except Exception as e:
+                await queue.put((None, e))
+            else:
+                await queue.put((None, None))
+
+        task = asyncio.ensure_future(producer())
+        try:
+            while True:
+                page, error = await queue.get()
+                if error is not None:
+                    raise error
+                if page is None:
+                    break
+                yield page
+        finally:
+            # Stop fetching when the consumer stops early, and wait for the
+            # producer to release its request before the generator exits
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def get_items(self, url, params=None, stream=None, **kwargs):
         """Return a generator that GETs and yields individual JSON `items`.
 
         Yields individual `items` from Webex"s top-level {"items": [...]}
@@ -801,11 +1610,19 @@ class AsyncRestSession(object):
         generator will request additional pages as needed until all items have
         been returned.
 
+        In streaming mode, each page's response body is read and decoded
+        incrementally and every item is yielded as soon as it has been
+        received, so peak memory is bounded by a single item instead of a
+        whole page.  Pages are not prefetched in streaming mode.
+
         Args:
             url(str): The URL of the API endpoint.
             params(dict): The parameters for the HTTP GET request.
+            stream(bool): Decode items incrementally from the response
+                stream. Defaults to the session's `stream_items` setting.
             **kwargs:
                 erc(int): The expected (success) response code for the request.
+                headers(dict): Headers added to these requests only.
                 others: Passed on to the requests package.
 
         Raises:
@@ -815,33 +1632,78 @@ class AsyncRestSession(object):
                 top-level dictionary with an "items" key.
 
         """
-        # Get generator for pages of JSON data
-        # pages = await self.get_pages(url, params=params, **kwargs)
+        check_type(stream, bool, optional=True)
 
-        # for json_page in pages:
-        #     assert isinstance(json_page, dict)
+        if self._stream_items if stream is None else stream:
+            async with contextlib.aclosing(self._stream_items_pages(url, params=params, **kwargs)) as items:
+                async for item in items:
+                    yield item
+            return
 
-        #     items = json_page.get("items")
+        async with contextlib.aclosing(self.get_item_pages(url, params=params, **kwargs)) as pages:
+            async for items in pages:
+                for item in items:
+                    yield item
 
-        #     if items is None:
-        #         error_message = "'items' key not found in JSON data: {!r}".format(json_page)
-        #         raise MalformedResponse(error_message)
+    async def get_item_pages(self, url, params=None, **kwargs):
+        """Return a generator that GETs and yields the `items` of each page.
 
-        #     else:
-        #         # for item in items:
-        #         #     yield item
-        #         return items
-            
-        async for page in self.get_pages(url, params=params, **kwargs):
-            assert isinstance(page, dict)
-            items = page.get("items")
-            if items is None:
-                error_message = "'items' key not found in JSON data: {!r}".format(page)
-                raise MalformedResponse(error_message)
-            else:
-                # return items
-                for item in items:
+        Yields the list of `items` of each of Webex's top-level
+        {"items": [...]} JSON pages, requesting additional pages (and
+        prefetching them, per the session's `page_prefetch` setting) as
+        needed until all pages have been returned.  Consumers processing
+        whole pages avoid the per-item overhead of get_items().
+
+        Args:
+            url(str): The URL of the API endpoint.
+            params(dict): The parameters for the HTTP GET request.
+            **kwargs:
+                erc(int): The expected (success) response code for the request.
+                headers(dict): Headers added to these requests only.
+                others: Passed on to the requests package.
+
+        Raises:
+            ApiError: If anything other than the expected response code is
+                returned by the Webex API endpoint.
+            MalformedResponse: If the returned response does not contain a
+                top-level dictionary with an "items" key.
+
+        """
+        async with contextlib.aclosing(self.get_pages(url, params=params, **kwargs)) as pages:
+            async for page in pages:
+                assert isinstance(page, dict)
+                items = page.get("items")
+                if items is None:
+                    error_message = "'items' key not found in JSON data: {!r}".format(page)
+                    raise MalformedResponse(error_message)
+                yield items
+
+    async def _stream_items_pages(self, url, params=None, **kwargs):
+        """GET pages and yield their `items` while the bodies stream in."""
+        check_type(url, str)
+        check_type(params, dict, optional=True)
+
+        # Expected response code
+        erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["GET"])
+
+        next_url, next_params = url, params
+        page = 0
+        while next_url:
+            response = await self.request("GET", next_url, erc, stream=True, params=next_params, **kwargs)
+            page += 1
+            self._page_fetched(response, page)
+            try:
+                async for item in iter_json_items(response.aiter_bytes()):
                     yield item
+            finally:
+                # Release the connection, even when the consumer stops early
+                await response.aclose()
+
+            if response.links.get("next"):
+                next_url = _fix_next_url(response.links.get("next").get("url"), params)
+                next_params = None
+            else:
+                next_url = None
 
     async def post(self, url, json=None, data=None, **kwargs):
         """Sends a POST request.
@@ -888,7 +1750,11 @@ class AsyncRestSession(object):
         # Expected response code
         erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["PUT"])
 
-        response = await self.request("PUT", url, erc, json=json, data=data, **kwargs)
+        try:
+            response = await self.request("PUT", url, erc, json=json, data=data, **kwargs)
+        finally:
+            if self._cache is not None:
+                self._cache.invalidate(_cache_url(self.abs_url(url)))
         return extract_and_parse_json(response)
 
     async def delete(self, url, **kwargs):
@@ -910,4 +1776,8 @@ class AsyncRestSession(object):
         # Expected response code
         erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["DELETE"])
 
-        await self.request("DELETE", url, erc, **kwargs)
+        try:
+            await self.request("DELETE", url, erc, **kwargs)
+        finally:
+            if self._cache is not None:
+                self._cache.invalidate(_cache_url(self.abs_url(url)))
@@ -0,0 +1,165 @@
+import random
+
+import httpx
+
+from .config import (
+    DEFAULT_RETRY_BACKOFF_FACTOR,
+    DEFAULT_RETRY_MAX_ATTEMPTS,
+    DEFAULT_RETRY_MAX_BACKOFF,
+    DEFAULT_RETRY_METHODS,
+)
+from .exceptions import ApiError
+from .response_codes import RETRYABLE_RESPONSE_CODES
+from .utils import check_type
+
+
+class RetryPolicy(object):
+    """Policy deciding whether, and when, a failed request is retried.
+
+    A request is retried when it fails with one of the policy's `status_codes`
+    (an ApiError) or raises one of its `exceptions` (transport errors by
+    default), as long as the request method is retryable, fewer than
+    `max_attempts` attempts have been made and the retry can start before the
+    policy's total `deadline`.
+
+    The delay before each retry is the server's `Retry-After` value when one
+    was provided; otherwise it grows exponentially
+    (`backoff_factor * 2 ** (attempt - 1)`, capped at `max_backoff`) and, with
+    `jitter` enabled, is drawn uniformly from [0, delay] ("full jitter").
+
+    Rate-limit (429) responses are handled separately by the session and do
+    not count against `max_attempts`.
+
+    Only idempotent, read-only methods are retried by default; set
+    `retry_non_idempotent=True` to retry POST, PUT and DELETE requests too.
+    Use `RetryPolicy(max_attempts=1)` to disable retries.
+
+    """
+
+    def __init__(
+        self,
+        max_attempts=DEFAULT_RETRY_MAX_ATTEMPTS,
+        status_codes=RETRYABLE_RESPONSE_CODES,
+        exceptions=(httpx.TransportError,),
+        backoff_factor=DEFAULT_RETRY_BACKOFF_FACTOR,
+        max_backoff=DEFAULT_RETRY_MAX_BACKOFF,
+        jitter=True,
+        deadline=None,
+        methods=DEFAULT_RETRY_METHODS,
+        retry_non_idempotent=False,
+    ):
+        """Initialize a new RetryPolicy.
+
+        Args:
+            max_attempts(int): Maximum number of attempts per request,
+                including the first one.
+            status_codes(tuple): HTTP response codes that are retried.
+            exceptions(tuple): Exception types raised while sending a
+                request that are retried.
+            backoff_factor(int,float): Base delay (seconds) of the
+                exponential backoff.
+            max_backoff(int,float): Maximum delay (seconds) between attempts.
+            jitter(bool): Randomize backoff delays.
+            deadline(int,float): Maximum total seconds, measured from the
+                first attempt, within which retries may be started. None for
+                no deadline.
+            methods(tuple): HTTP methods that are retried.
+            retry_non_idempotent(bool): Retry requests of every method,
+                including POST, PUT and DELETE.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If max_attempts is less than one.
+
+        """
+        check_type(max_attempts, int)
+        check_type(status_codes, (tuple, list, set, frozenset))
+        check_type(exceptions, (tuple, list))
+        check_type(backoff_factor, (int, float))
+        check_type(max_backoff, (int, float))
+        check_type(jitter, bool)
+        check_type(deadline, (int, float), optional=True)
+        check_type(methods, (tuple, list, set, frozenset))
+        check_type(retry_non_idempotent, bool)
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.status_codes = frozenset(status_codes)
+        self.exceptions = tuple(exceptions)
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.deadline = deadline
+        self.methods = frozenset(method.upper() for method in methods)
+        self.retry_non_idempotent = retry_non_idempotent
+
+    def __repr__(self):
+        return "<{} max_attempts={} status_codes={} methods={}>".format(
+            self.__class__.__name__,
+            self.max_attempts,
+            sorted(self.status_codes),
+            "*" if self.retry_non_idempotent else sorted(self.methods),
+        )
+
+    def is_retryable_method(self, method):
+        """Whether requests using `method` may be retried."""
+        return self.retry_non_idempotent or method.upper() in self.methods
+
+    def is_retryable_error(self, error):
+        """Whether `error` is a retryable response code or exception."""
+        if isinstance(error, ApiError):
+            return error.status_code in self.status_codes
+        return isinstance(error, self.exceptions)
+
+    def backoff(self, attempt, retry_after=None):
+        """Return the delay (seconds) before the next attempt.
+
+        Args:
+            attempt(int): The number of attempts made so far.
+            retry_after(int,float): The server-provided `Retry-After` value,
+                if any; it takes precedence over the computed backoff.
+
+        """
+        if retry_after is not None:
+            return retry_after
+
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def get_retry_delay(self, method, attempt, elapsed, error):
+        """Decide whether a failed attempt is retried.
+
+        Args:
+            method(str): The HTTP method of the request.
+            attempt(int): The number of attempts made so far.
+            elapsed(float): Seconds since the first attempt was started.
+            error(Exception): The ApiError or exception the attempt failed
+                with.
+
+        Returns:
+            float: The delay (seconds) before the next attempt, or None if
+            the request should not be retried.
+
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if not self.is_retryable_method(method) or not self.is_retryable_error(error):
+            return None
+
+        delay = self.backoff(attempt, retry_after=_retry_after(error))
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+        return delay
+
+
+def _retry_after(error):
+    """Return the `Retry-After` seconds of an ApiError response, if any."""
+    if not isinstance(error, ApiError):
+        return None
+    try:
+        return max(0, int(error.response.headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,65 @@
+import asyncio
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight(object):
+    """Coalesce identical concurrent calls into a single in-flight call.
+
+    The first caller for a key starts the call; callers arriving with the same
+    key while it is still in flight wait for, and share, its result (or
+    exception).  Once the call completes the key is forgotten, so later
+    callers start a new call.
+
+    The call runs in its own task: cancelling one of the waiting callers does
+    not cancel the call for the others.
+
+    """
+
+    def __init__(self):
+        """Initialize a new SingleFlight group with no calls in flight."""
+        self._calls = {}
+        self._shared = 0
+
+    @property
+    def in_flight(self):
+        """The number of distinct calls currently in flight."""
+        return len(self._calls)
+
+    @property
+    def shared(self):
+        """The number of callers that have joined an existing call."""
+        return self._shared
+
+    async def do(self, key, coroutine_function, *args, **kwargs):
+        """Call `coroutine_function(*args, **kwargs)` once per in-flight key.
+
+        Args:
+            key: A hashable key identifying identical calls.
+            coroutine_function: The coroutine function to call.
+            *args: Positional arguments for the coroutine function.
+            **kwargs: Keyword arguments for the coroutine function.
+
+        Returns:
+            The result of the (possibly shared) call.
+
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(coroutine_function(*args, **kwargs))
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self._shared += 1
+            logger.debug("Joining in-flight call for %r.", key)
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key, task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved when every caller was cancelled
+        if not task.cancelled():
+            task.exception()
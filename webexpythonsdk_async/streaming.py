@@ -0,0 +1,128 @@
+import codecs
+import json
+
+from .exceptions import MalformedResponse
+
+
+_WHITESPACE = " \t\n\r"
+
+_NUMBER_CHARACTERS = "0123456789+-.eE"
+
+_decoder = json.JSONDecoder()
+
+
+class _JSONStream(object):
+    """Incrementally decoded text buffer over an async stream of bytes."""
+
+    def __init__(self, byte_iterator):
+        self._chunks = byte_iterator.__aiter__()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    async def read_more(self):
+        """Append the next chunk of text to the buffer; False at EOF."""
+        if self.eof:
+            return False
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self.eof = True
+            self.buffer += self._utf8.decode(b"", final=True)
+            return False
+
+        # Drop the consumed prefix so the buffer only holds unparsed text
+        self.buffer = self.buffer[self.pos :] + self._utf8.decode(chunk)
+        self.pos = 0
+        return True
+
+    async def peek(self):
+        """Skip whitespace and return the next character ("" at EOF)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not await self.read_more():
+                return ""
+
+    async def expect(self, characters):
+        """Consume and return the next character, which must be one of `characters`."""
+        character = await self.peek()
+        if not character or character not in characters:
+            raise MalformedResponse(
+                "Expected one of {!r} in JSON data; found {!r}.".format(characters, character or "end of data")
+            )
+        self.pos += 1
+        return character
+
+    async def value(self):
+        """Decode and consume the next complete JSON value."""
+        await self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                if await self.read_more():
+                    continue
+                raise MalformedResponse("Invalid JSON data: {}".format(e)) from e
+
+            # A number cut off at the end of the buffer (e.g. "12" of "12.5")
+            # may continue in the next chunk; only accept a value once it is
+            # followed by something other than a number character (or EOF).
+            if not self.eof and self.buffer[end : end + 1] in _NUMBER_CHARACTERS and await self.read_more():
+                continue
+
+            self.pos = end
+            return value
+
+
+async def iter_json_items(byte_iterator, key="items"):
+    """Yield the elements of a top-level JSON array as they are decoded.
+
+    Incrementally decodes a JSON object such as Webex's `{"items": [...]}`
+    list responses from an async iterator of bytes, yielding each element of
+    the `key` array as soon as it has been received.  Only the element being
+    decoded is held in memory, not the whole response body.
+
+    Args:
+        byte_iterator: An async iterable of bytes chunks (for example
+            `httpx.Response.aiter_bytes()`).
+        key(str): The top-level key of the array to yield elements from.
+
+    Raises:
+        MalformedResponse: If the data is not a JSON object containing `key`
+            as an array.
+
+    """
+    stream = _JSONStream(byte_iterator)
+    found = False
+
+    await stream.expect("{")
+    if await stream.peek() == "}":
+        stream.pos += 1
+    else:
+        while True:
+            name = await stream.value()
+            await stream.expect(":")
+
+            if name == key and await stream.peek() == "[":
+                found = True
+                stream.pos += 1
+                if await stream.peek() == "]":
+                    stream.pos += 1
+                else:
+                    while True:
+                        yield await stream.value()
+                        if await stream.expect(",]") == "]":
+                            break
+            else:
+                # Skip other top-level members, e.g. "notFoundIds"
+                await stream.value()
+
+            if await stream.expect(",}") == "}":
+                break
+
+    if not found:
+        raise MalformedResponse("'{}' key not found in JSON data.".format(key))
@@ -0,0 +1,347 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+import logging
+import threading
+import weakref
+
+from .api import AsyncWebexAPI
+from .config import DEFAULT_BATCH_CONCURRENCY
+from .generator_containers import GeneratorContainer
+
+
+logger = logging.getLogger(__name__)
+
+
+# Returned by _anext() when an async iterator is exhausted
+_EXHAUSTED = object()
+
+
+async def _in_context(context, coroutine):
+    """Run a coroutine in the contextvars context of the calling thread."""
+    return await asyncio.get_running_loop().create_task(coroutine, context=context)
+
+
+async def _aiter(async_iterable):
+    return async_iterable.__aiter__()
+
+
+async def _anext(async_iterator):
+    try:
+        return await async_iterator.__anext__()
+    except StopAsyncIteration:
+        return _EXHAUSTED
+
+
+async def _create_api(args, kwargs):
+    # Build the async API on the loop it will run on
+    return AsyncWebexAPI(*args, **kwargs)
+
+
+class _EventLoopThread(object):
+    """An asyncio event loop running in a background (daemon) thread."""
+
+    def __init__(self, name="webexpythonsdk-async-loop"):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_forever, name=name, daemon=True)
+        self._thread.start()
+
+    def _run_forever(self):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.close()
+
+    @property
+    def is_running(self):
+        """Whether the event loop thread is still running."""
+        return self._thread.is_alive() and not self._loop.is_closed()
+
+    def run(self, coroutine, timeout=None):
+        """Run a coroutine on the loop and block until it returns.
+
+        The coroutine runs in a copy of the calling thread's contextvars
+        context (e.g. `request_headers()` scopes).
+
+        Args:
+            coroutine: The coroutine to run.
+            timeout(int,float): Maximum number of seconds to wait for the
+                result.  None waits indefinitely.
+
+        Returns:
+            The coroutine's result.
+
+        Raises:
+            RuntimeError: If called from the loop's own thread (which would
+                deadlock), or after the loop has been stopped.
+
+        """
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError("Synchronous Webex API calls cannot be made from its own event loop thread.")
+        if not self.is_running:
+            coroutine.close()
+            raise RuntimeError("The WebexAPI object has been closed.")
+
+        future = asyncio.run_coroutine_threadsafe(
+            _in_context(contextvars.copy_context(), coroutine),
+            self._loop,
+        )
+        try:
+            return future.result(timeout)
+        except BaseException:
+            # Timeouts and interrupts (Ctrl-C) cancel the call on the loop
+            future.cancel()
+            raise
+
+    def iterate(self, async_iterable):
+        """Iterate over an async iterable from the calling thread.
+
+        The async iterator is closed (releasing any open response stream) when
+        the returned generator is closed or garbage collected.
+
+        """
+        async_iterator = self.run(_aiter(async_iterable))
+        try:
+            while True:
+                item = self.run(_anext(async_iterator))
+                if item is _EXHAUSTED:
+                    return
+                yield item
+        finally:
+            aclose = getattr(async_iterator, "aclose", None)
+            if aclose is not None and self.is_running and threading.current_thread() is not self._thread:
+                self.run(aclose())
+
+    def stop(self):
+        """Stop the event loop and wait for its thread to exit."""
+        if self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            if threading.current_thread() is not self._thread:
+                self._thread.join()
+
+
+class _SyncGeneratorContainer(object):
+    """Blocking proxy for a GeneratorContainer returned by a list method.
+
+    Iterating over the proxy, slicing it, or calling pages() or batches()
+    returns a generator driven by the event loop thread, like the async
+    container's.
+
+    """
+
+    def __init__(self, container, loop_thread):
+        self._container = container
+        self._loop_thread = loop_thread
+
+    def __repr__(self):
+        return "<Sync {!r}>".format(self._container)
+
+    def __iter__(self):
+        return self._loop_thread.iterate(self._container)
+
+    def __getitem__(self, item):
+        """Slice the container; see GeneratorContainer.__getitem__()."""
+        return self._loop_thread.iterate(self._container[item])
+
+    def pages(self):
+        """Iterate over the results one page at a time; see GeneratorContainer.pages()."""
+        return self._loop_thread.iterate(self._container.pages())
+
+    def batches(self, size):
+        """Iterate over the results in lists of `size` objects; see GeneratorContainer.batches()."""
+        return self._loop_thread.iterate(self._container.batches(size))
+
+
+class _SyncAPIWrapper(object):
+    """Blocking proxy for one of AsyncWebexAPI's API wrappers."""
+
+    def __init__(self, async_api, loop_thread):
+        self._async_api = async_api
+        self._loop_thread = loop_thread
+
+    def __repr__(self):
+        return "<Sync {!r}>".format(self._async_api)
+
+    def __getattr__(self, name):
+        attribute = getattr(self._async_api, name)
+        if not callable(attribute):
+            return attribute
+
+        loop_thread = self._loop_thread
+
+        @functools.wraps(attribute)
+        def blocking_method(*args, **kwargs):
+            result = attribute(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = loop_thread.run(result)
+            if isinstance(result, GeneratorContainer):
+                return _SyncGeneratorContainer(result, loop_thread)
+            if hasattr(result, "__aiter__"):
+                return loop_thread.iterate(result)
+            return result
+
+        # Cache the wrapper; later lookups bypass __getattr__
+        setattr(self, name, blocking_method)
+        return blocking_method
+
+
+class WebexAPI(object):
+    """Synchronous Webex API wrapper backed by the async engine.
+
+    Runs an AsyncWebexAPI on a dedicated background event loop thread and
+    exposes the same API wrappers (`api.rooms`, `api.messages`, ...) with
+    blocking methods.  Coroutine methods return their result; list methods
+    return a container which, like the async one, can be iterated over,
+    sliced, or iterated over by page (`pages()`) or batch (`batches()`),
+    each time yielding the listed objects from a generator.  `batch()` runs
+    many blocking calls concurrently.
+
+    Every call made through a WebexAPI object, from any number of threads,
+    shares one connection pool and the session's rate limiting, retries,
+    caching and request coalescing.  Calls are thread-safe: they are all
+    executed by the event loop thread.
+
+    Example:
+        with WebexAPI(access_token=token) as api:
+            for room in api.rooms.list():
+                print(room.title)
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Create a new WebexAPI object.
+
+        Accepts the same arguments as AsyncWebexAPI.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            AccessTokenError: If an access token is not provided via the
+                access_token argument or an environment variable.
+
+        """
+        self._loop_thread = _EventLoopThread()
+        # Stop the loop thread of WebexAPI objects that are never closed
+        self._finalizer = weakref.finalize(self, self._loop_thread.stop)
+
+        try:
+            self._async_api = self._loop_thread.run(_create_api(args, kwargs))
+        except BaseException:
+            self._finalizer()
+            raise
+
+        for name, async_api in vars(self._async_api).items():
+            if not name.startswith("_"):
+                setattr(self, name, _SyncAPIWrapper(async_api, self._loop_thread))
+
+    @property
+    def async_api(self):
+        """The AsyncWebexAPI object running on the background event loop."""
+        return self._async_api
+
+    @property
+    def access_token(self):
+        """The access token used for API calls to the Webex service."""
+        return self._async_api.access_token
+
+    @property
+    def base_url(self):
+        """The base URL prefixed to the individual API endpoint suffixes."""
+        return self._async_api.base_url
+
+    @property
+    def single_request_timeout(self):
+        """Timeout (in seconds) for an single HTTP request."""
+        return self._async_api.single_request_timeout
+
+    @property
+    def wait_on_rate_limit(self):
+        """Automatic rate-limit handling enabled / disabled."""
+        return self._async_api.wait_on_rate_limit
+
+    @property
+    def http2(self):
+        """HTTP/2 negotiation enabled / disabled."""
+        return self._async_api.http2
+
+    def batch(self, calls, concurrency=DEFAULT_BATCH_CONCURRENCY, on_progress=None):
+        """Run many blocking API calls with bounded concurrency.
+
+        The blocking counterpart of AsyncWebexAPI.batch(): each call runs in
+        a worker thread of the event loop (so at most as many calls as the
+        loop's default executor has threads run at once), while the requests
+        it sends share the session's connection pool and rate-limit gate.
+        `on_progress` is called from the event loop thread.  Interrupting the
+        batch cancels the calls not started yet; calls already running in a
+        worker thread complete.
+
+        Example:
+            results = api.batch(
+                [functools.partial(api.messages.delete, message_id) for message_id in message_ids],
+                concurrency=20,
+            )
+
+        Args:
+            calls(iterable): The calls; each one a callable taking no
+                arguments, e.g. a method of this object with its arguments
+                bound by functools.partial().
+            concurrency(int): Maximum number of calls in flight. Defaults to
+                webexpythonsdk_async.config.DEFAULT_BATCH_CONCURRENCY.
+            on_progress(callable): Called with the number of completed calls,
+                the total number of calls and the BatchResult, each time a
+                call completes.
+
+        Returns:
+            list: A BatchResult for each call, in the order of `calls`.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If concurrency is not positive.
+
+        """
+        calls = list(calls)
+        for call in calls:
+            if not callable(call):
+                raise TypeError("Synchronous batch calls must be callables; received: {!r}".format(call))
+        results = self._loop_thread.run(
+            self._async_api.batch(
+                [functools.partial(asyncio.to_thread, call) for call in calls],
+                concurrency=concurrency,
+                on_progress=on_progress,
+            )
+        )
+        for result, call in zip(results, calls, strict=True):
+            result.call = call
+        return results
+
+    @property
+    def closed(self):
+        """Whether the API object has been closed."""
+        return not self._finalizer.alive
+
+    def close(self, timeout=None):
+        """Close the API session and stop the background event loop.
+
+        In-flight requests are allowed to complete before the connection pool
+        is closed; see AsyncRestSession.aclose().
+
+        Args:
+            timeout(int,float): Maximum number of seconds to wait for
+                in-flight requests to complete. None waits indefinitely.
+
+        """
+        if self.closed:
+            return
+        try:
+            self._loop_thread.run(self._async_api.aclose(timeout=timeout))
+        finally:
+            self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
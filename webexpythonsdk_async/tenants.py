@@ -0,0 +1,191 @@
+import asyncio
+import inspect
+import logging
+from collections import OrderedDict
+
+import httpx
+
+from .api import AsyncWebexAPI
+from .config import DEFAULT_MAX_TENANTS
+from .restsession import _build_async_client
+from .singleflight import SingleFlight
+from .utils import check_type
+
+
+logger = logging.getLogger(__name__)
+
+
+# AsyncWebexAPI arguments that configure the shared client
+_CLIENT_ARGUMENTS = (
+    "max_connections",
+    "max_keepalive_connections",
+    "keepalive_expiry",
+    "http2",
+    "proxies",
+    "disable_ssl_verify",
+    "transport",
+)
+
+
+class TenantRegistry(object):
+    """Lazily created AsyncWebexAPI objects for many tenants, sharing one pool.
+
+    Every tenant's AsyncWebexAPI object sends its requests through a single
+    shared httpx.AsyncClient, authorizing each request with the tenant's own
+    access token, so the number of sockets does not grow with the number of
+    tenants.  API objects are created on first use and the registry drops
+    the least recently used ones once more than `max_tenants` are held,
+    keeping memory flat.  An evicted API object is not closed: it holds no
+    connections of its own, so callers still using it are unaffected, and it
+    is garbage collected once they release it.
+
+    Example:
+        async def token_for(org_id):
+            return await vault.read_token(org_id)
+
+        async with TenantRegistry(token_for, max_tenants=500) as tenants:
+            api = await tenants.get(org_id)
+            async for room in api.rooms.list():
+                ...
+
+    """
+
+    def __init__(self, token_provider, max_tenants=DEFAULT_MAX_TENANTS, client=None, **kwargs):
+        """Initialize a new, empty TenantRegistry.
+
+        Args:
+            token_provider(callable): Called with a tenant ID to get the
+                tenant's access token; may be a coroutine function.
+            max_tenants(int): Maximum number of API objects held; the least
+                recently used are dropped first.
+            client(httpx.AsyncClient): Optional client shared by the tenants;
+                it is not closed by the registry.  By default the registry
+                creates (and closes) one, configured by the connection pool,
+                proxy, SSL and transport keyword arguments.
+            **kwargs: Passed on to AsyncWebexAPI for every tenant.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If max_tenants is not positive.
+
+        """
+        if not callable(token_provider):
+            raise TypeError("token_provider must be callable; received: {!r}".format(token_provider))
+        check_type(max_tenants, int)
+        check_type(client, httpx.AsyncClient, optional=True)
+        if max_tenants <= 0:
+            raise ValueError("max_tenants must be a positive integer")
+
+        client_kwargs = {name: kwargs.pop(name) for name in _CLIENT_ARGUMENTS if name in kwargs}
+        self._owns_client = client is None
+        if client is None:
+            client = _build_async_client(**client_kwargs)
+
+        self._token_provider = token_provider
+        self._max_tenants = max_tenants
+        self._client = client
+        self._api_kwargs = kwargs
+        self._apis = OrderedDict()
+        self._creating = SingleFlight()
+        self._closed = False
+
+        self.created = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._apis)
+
+    def __contains__(self, tenant_id):
+        return tenant_id in self._apis
+
+    @property
+    def client(self):
+        """The httpx.AsyncClient shared by every tenant."""
+        return self._client
+
+    @property
+    def max_tenants(self):
+        """Maximum number of API objects held."""
+        return self._max_tenants
+
+    async def get(self, tenant_id):
+        """Return a tenant's AsyncWebexAPI object, creating it if needed.
+
+        Args:
+            tenant_id(str): The tenant (e.g. organization) ID.
+
+        Returns:
+            AsyncWebexAPI: The tenant's API object.
+
+        Raises:
+            RuntimeError: If the registry has been closed.
+
+        """
+        if self._closed:
+            raise RuntimeError("Cannot get a tenant, as the registry has been closed.")
+
+        api = self._apis.get(tenant_id)
+        if api is not None:
+            self._apis.move_to_end(tenant_id)
+            return api
+
+        # Concurrent first uses of a tenant create a single API object
+        return await self._creating.do(tenant_id, self._create, tenant_id)
+
+    async def _create(self, tenant_id):
+        access_token = self._token_provider(tenant_id)
+        if inspect.isawaitable(access_token):
+            access_token = await access_token
+
+        api = AsyncWebexAPI(access_token=access_token, client=self._client, **self._api_kwargs)
+        if self._closed:
+            await api.aclose()
+            raise RuntimeError("Cannot get a tenant, as the registry has been closed.")
+
+        self._apis[tenant_id] = api
+        self.created += 1
+        while len(self._apis) > self._max_tenants:
+            # The shared client stays open, so an evicted API object held by
+            # a caller keeps working; only the registry's reference is dropped
+            evicted_id, _ = self._apis.popitem(last=False)
+            self.evictions += 1
+            logger.debug("Evicting the API object of tenant %r.", evicted_id)
+        return api
+
+    async def invalidate(self, tenant_id):
+        """Close and forget a tenant's API object (e.g. after a token change).
+
+        The next `get()` creates a new API object with a fresh access token.
+
+        Args:
+            tenant_id(str): The tenant ID.
+
+        """
+        api = self._apis.pop(tenant_id, None)
+        if api is not None:
+            await api.aclose()
+
+    async def aclose(self, timeout=None):
+        """Close every tenant's API object and the shared client.
+
+        Args:
+            timeout(int,float): Maximum number of seconds to wait for
+                in-flight requests to complete. None waits indefinitely.
+
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        apis = list(self._apis.values())
+        self._apis.clear()
+        await asyncio.gather(*(api.aclose(timeout=timeout) for api in apis))
+
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
@@ -0,0 +1,2 @@
+from .cassettes import Cassette, CassetteError, RecordingTransport, ReplayTransport
+from .fake_webex import FakeWebexTransport
@@ -0,0 +1,289 @@
+import asyncio
+import base64
+import datetime
+import json
+import time
+from collections import defaultdict, deque
+
+import httpx
+
+from ..utils import check_type
+
+
+CASSETTE_FORMAT_VERSION = 1
+
+REPLAY_TIMINGS = ("none", "compressed", "original")
+
+# Request headers never written to a cassette
+_SECRET_HEADERS = frozenset(["authorization", "cookie"])
+
+# Response headers describing the wire encoding, which no longer applies to
+# the decoded bodies stored in cassettes
+_ENCODING_HEADERS = frozenset(["content-encoding", "content-length", "transfer-encoding", "set-cookie"])
+
+
+class CassetteError(Exception):
+    """A request has no matching interaction in the cassette."""
+
+
+def _encode_body(content):
+    try:
+        return content.decode("utf-8"), "utf-8"
+    except UnicodeDecodeError:
+        return base64.b64encode(content).decode("ascii"), "base64"
+
+
+def _decode_body(body, encoding):
+    if encoding == "base64":
+        return base64.b64decode(body)
+    return body.encode("utf-8")
+
+
+class Cassette(object):
+    """A recorded sequence of HTTP interactions (requests and responses).
+
+    Each interaction holds the request method and URL, the response status,
+    headers (including `Link` and `Retry-After`) and body, and its timing:
+    the seconds from the start of the recording until the request was sent
+    (`offset`) and until its response was received (`elapsed`).  Access
+    tokens and cookies are not recorded.
+
+    """
+
+    def __init__(self, interactions=None):
+        """Initialize a cassette.
+
+        Args:
+            interactions(list): Recorded interactions, as dictionaries.
+
+        """
+        check_type(interactions, list, optional=True)
+        self.interactions = list(interactions or [])
+
+    def __len__(self):
+        return len(self.interactions)
+
+    @classmethod
+    def load(cls, path):
+        """Load a cassette from a JSON file.
+
+        Raises:
+            ValueError: If the file is not a supported cassette.
+
+        """
+        with open(path, encoding="utf-8") as cassette_file:
+            data = json.load(cassette_file)
+        if data.get("version") != CASSETTE_FORMAT_VERSION:
+            raise ValueError("Unsupported cassette format version: {!r}".format(data.get("version")))
+        return cls(data["interactions"])
+
+    def save(self, path):
+        """Write the cassette to a JSON file."""
+        data = {
+            "version": CASSETTE_FORMAT_VERSION,
+            "saved": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "interactions": self.interactions,
+        }
+        with open(path, "w", encoding="utf-8") as cassette_file:
+            json.dump(data, cassette_file, indent=1, ensure_ascii=False)
+
+    def record(self, request, response, content, offset, elapsed):
+        """Append an interaction."""
+        body, encoding = _encode_body(content)
+        self.interactions.append(
+            {
+                "request": {
+                    "method": request.method,
+                    "url": str(request.url),
+                    "headers": [
+                        [name, value] for name, value in request.headers.items() if name.lower() not in _SECRET_HEADERS
+                    ],
+                },
+                "response": {
+                    "status_code": response.status_code,
+                    "headers": [
+                        [name, value]
+                        for name, value in response.headers.items()
+                        if name.lower() not in _ENCODING_HEADERS
+                    ],
+                    "body": body,
+                    "encoding": encoding,
+                },
+                "offset": round(offset, 6),
+                "elapsed": round(elapsed, 6),
+            }
+        )
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """An httpx transport recording every interaction into a Cassette.
+
+    Wraps a real transport (by default a new httpx.AsyncHTTPTransport) and
+    records the requests sent through it and their responses.
+
+    Example:
+        recorder = RecordingTransport()
+        async with AsyncWebexAPI(access_token=token, transport=recorder) as api:
+            async for message in api.messages.list(roomId=room_id):
+                ...
+        recorder.cassette.save("messages-export.json")
+
+    """
+
+    def __init__(self, transport=None, cassette=None):
+        """Initialize a new RecordingTransport.
+
+        Args:
+            transport(httpx.AsyncBaseTransport): The transport to record;
+                defaults to a new httpx.AsyncHTTPTransport.
+            cassette(Cassette): The cassette to append to; defaults to a new
+                empty cassette.
+
+        """
+        check_type(transport, httpx.AsyncBaseTransport, optional=True)
+        check_type(cassette, Cassette, optional=True)
+
+        self._transport = transport if transport is not None else httpx.AsyncHTTPTransport()
+        self.cassette = cassette if cassette is not None else Cassette()
+        self._start = None
+
+    async def handle_async_request(self, request):
+        """Send a request through the wrapped transport and record it."""
+        now = time.monotonic()
+        if self._start is None:
+            self._start = now
+
+        response = await self._transport.handle_async_request(request)
+        try:
+            # Bodies are recorded (and replayed) decoded
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        elapsed = time.monotonic() - now
+
+        self.cassette.record(request, response, content, now - self._start, elapsed)
+
+        headers = [(name, value) for name, value in response.headers.items() if name.lower() not in _ENCODING_HEADERS]
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=content,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self):
+        """Close the wrapped transport."""
+        await self._transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """An httpx transport answering requests from a Cassette.
+
+    Each request is answered with the next unused recorded response for the
+    same method and URL, so concurrent requests and pagination replay in
+    their recorded order.  Responses are delayed according to the timing
+    mode:
+
+        none: No delay.
+        compressed: The recorded timing, sped up by `speed`.
+        original: The recorded timing.
+
+    With recorded timing, each response is delayed by its recorded response
+    time, and is not delivered before its recorded time since the start of
+    the recording (`offset` + `elapsed`), counted from the first replayed
+    request.  A client sending its requests sooner than recorded is
+    therefore held to the recorded schedule, gaps between requests
+    included; a slower client only waits for the response times.  Responses
+    repeated after their recorded ones have been used only wait for their
+    response time.
+
+    Example:
+        replay = ReplayTransport(Cassette.load("messages-export.json"), timing="compressed")
+        api = AsyncWebexAPI(access_token="replay", transport=replay)
+
+    """
+
+    def __init__(self, cassette, timing="none", speed=10.0, repeat=False):
+        """Initialize a new ReplayTransport.
+
+        Args:
+            cassette(Cassette,str): The cassette, or the path of a cassette
+                file, to replay.
+            timing(str): The timing mode ("none", "compressed" or
+                "original").
+            speed(int,float): The speed-up factor of the compressed timing
+                mode.
+            repeat(bool): Answer requests whose recorded responses have all
+                been used with the last of them, instead of raising a
+                CassetteError (e.g. for polling loops).
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If timing is unknown or speed is not positive.
+
+        """
+        if isinstance(cassette, str):
+            cassette = Cassette.load(cassette)
+        check_type(cassette, Cassette)
+        check_type(timing, str)
+        check_type(speed, (int, float))
+        check_type(repeat, bool)
+        if timing not in REPLAY_TIMINGS:
+            raise ValueError("timing must be one of: {}".format(", ".join(REPLAY_TIMINGS)))
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+
+        self.cassette = cassette
+        self.timing = timing
+        self.speed = speed
+        self.repeat = repeat
+
+        self._queues = defaultdict(deque)
+        for interaction in cassette.interactions:
+            request = interaction["request"]
+            self._queues[(request["method"], request["url"])].append(interaction)
+        self._last = {}
+        self._start = None
+        self.replayed = 0
+
+    @property
+    def remaining(self):
+        """The number of recorded interactions not replayed yet."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    def _next_interaction(self, request):
+        """Return the interaction answering a request, and whether it is repeated."""
+        key = (request.method, str(request.url))
+        queue = self._queues.get(key)
+        if queue:
+            interaction = self._last[key] = queue.popleft()
+            return interaction, False
+        if self.repeat and key in self._last:
+            return self._last[key], True
+        raise CassetteError("No recorded response left for {} {}".format(request.method, request.url))
+
+    async def handle_async_request(self, request):
+        """Answer a request with its next recorded response."""
+        now = time.monotonic()
+        if self._start is None:
+            self._start = now
+
+        await request.aread()
+        interaction, repeated = self._next_interaction(request)
+        self.replayed += 1
+
+        if self.timing != "none":
+            scale = self.speed if self.timing == "compressed" else 1.0
+            delay = interaction["elapsed"] / scale
+            if not repeated:
+                # Hold the response to the recorded schedule
+                due = self._start + (interaction["offset"] + interaction["elapsed"]) / scale
+                delay = max(delay, due - time.monotonic())
+            await asyncio.sleep(delay)
+
+        response = interaction["response"]
+        return httpx.Response(
+            response["status_code"],
+            headers=[tuple(header) for header in response["headers"]],
+            content=_decode_body(response["body"], response["encoding"]),
+        )
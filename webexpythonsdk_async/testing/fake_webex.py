@@ -0,0 +1,523 @@
+import asyncio
+import base64
+import datetime
+import math
+import random
+import re
+import time
+import urllib.parse
+import uuid
+from collections import Counter, OrderedDict
+
+import httpx
+
+from ..config import DEFAULT_BASE_URL
+from ..json_backends import get_json_backend
+
+
+# Collections served by the fake, mapped to the resource type encoded in
+# their IDs
+RESOURCE_TYPES = OrderedDict(
+    [
+        ("people", "PEOPLE"),
+        ("rooms", "ROOM"),
+        ("memberships", "MEMBERSHIP"),
+        ("messages", "MESSAGE"),
+        ("events", "EVENT"),
+        ("meetings", None),
+    ]
+)
+
+DEFAULT_PAGE_SIZE = 100
+
+MAX_PAGE_SIZE = 1000
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_RANGE = re.compile(r"bytes=(\d*)-(\d*)")
+
+
+def _timestamp():
+    return datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def _new_id(resource_type):
+    if resource_type is None:
+        # Meeting IDs are hex strings
+        return uuid.uuid4().hex
+    raw = "ciscospark://us/{}/{}".format(resource_type, uuid.uuid4())
+    return base64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii").rstrip("=")
+
+
+def _parse_multipart(content_type, body):
+    """Return the fields and files of a multipart/form-data body."""
+    match = re.search(r'boundary="?([^";]+)"?', content_type)
+    if not match:
+        return {}, {}
+    delimiter = b"--" + match.group(1).encode("latin-1")
+
+    fields, files = {}, {}
+    for part in body.split(delimiter)[1:]:
+        if part.startswith(b"--"):
+            break
+        head, _, value = part.strip(b"\r\n").partition(b"\r\n\r\n")
+        headers = head.decode("latin-1")
+        name = re.search(r'name="([^"]*)"', headers)
+        if not name:
+            continue
+        filename = re.search(r'filename="([^"]*)"', headers)
+        if filename:
+            files[name.group(1)] = (filename.group(1), value)
+        else:
+            fields[name.group(1)] = value.decode("utf-8")
+    return fields, files
+
+
+class _FakeError(Exception):
+    """Aborts handling a request with an error response."""
+
+    def __init__(self, status_code, message, headers=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+        self.headers = headers or {}
+
+
+class _ChunkedStream(httpx.AsyncByteStream):
+    """Deliver a response body in fixed-size chunks, like a network read."""
+
+    def __init__(self, content, chunk_size, fail_after=None):
+        self._content = content
+        self._chunk_size = chunk_size
+        self._fail_after = fail_after
+
+    async def __aiter__(self):
+        end = len(self._content) if self._fail_after is None else min(self._fail_after, len(self._content))
+        for start in range(0, end, self._chunk_size):
+            yield self._content[start : min(start + self._chunk_size, end)]
+        if self._fail_after is not None:
+            raise httpx.ReadError("Injected connection drop.")
+
+
+class FakeWebexTransport(httpx.AsyncBaseTransport):
+    """In-process stand-in for the Webex REST API, as an httpx transport.
+
+    Serves the people, rooms, memberships, messages (including direct
+    messages), events and meetings endpoints from in-memory collections,
+    with Webex-style IDs, filters and RFC5988 `Link` header pagination, so
+    AsyncRestSession pagination, retries and rate limiting can be tested
+    and benchmarked offline.
+
+    Latency, rate limiting (429 with Retry-After) and server errors are
+    configurable, `fail_next()` injects deterministic faults and
+    `interrupt_next()` drops file downloads midway.
+
+    Example:
+        fake = FakeWebexTransport(latency=0.02, rate_limit=(300, 60))
+        room = fake.add("rooms", title="Load test")
+        fake.add_many("messages", 5000, roomId=room["id"], text="hello")
+
+        api = AsyncWebexAPI(access_token="fake-token", transport=fake)
+        async for message in api.messages.list(roomId=room["id"]):
+            ...
+
+    """
+
+    def __init__(
+        self,
+        base_url=DEFAULT_BASE_URL,
+        latency=0.0,
+        rate_limit=None,
+        retry_after=1,
+        error_rate=0.0,
+        error_status=503,
+        chunk_size=None,
+        seed=None,
+    ):
+        """Initialize a new fake Webex API with only the "me" person.
+
+        Args:
+            base_url(str): The base URL the fake answers for.
+            latency(int,float,tuple): Seconds each response is delayed by, or
+                a (minimum, maximum) range to pick from at random.
+            rate_limit(tuple): (requests, seconds) allowed per access token
+                in each fixed window; further requests get a 429 response.
+                None disables rate limiting.
+            retry_after(int): The Retry-After of injected 429 responses.
+            error_rate(float): Probability (0-1) of answering a request with
+                `error_status`.
+            error_status(int): Status code of random errors.
+            chunk_size(int): Deliver response bodies in chunks of this many
+                bytes; None delivers each body in one chunk.
+            seed(int): Seed of the random number generator, for
+                reproducible latencies and errors.
+
+        """
+        self._base_url = base_url
+        self._base_path = urllib.parse.urlparse(base_url).path.rstrip("/") + "/"
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.chunk_size = chunk_size
+        self._random = random.Random(seed)
+
+        self.collections = {name: OrderedDict() for name in RESOURCE_TYPES}
+        self.contents = {}
+        self._faults = []
+        self._interruptions = []
+        self._windows = {}
+
+        self.requests = Counter()
+
+        self.me = self.add(
+            "people",
+            emails=["fake-bot@webex.bot"],
+            displayName="Fake Bot",
+            nickName="Fake Bot",
+            type="bot",
+        )
+
+    @property
+    def base_url(self):
+        """The base URL the fake answers for."""
+        return self._base_url
+
+    @property
+    def request_count(self):
+        """Total number of requests received."""
+        return sum(self.requests.values())
+
+    # Data management
+
+    def add(self, collection, **fields):
+        """Add an object to a collection and return it.
+
+        Missing `id` and `created` fields are generated.
+
+        Args:
+            collection(str): The collection name (e.g. "rooms").
+            **fields: The object's fields.
+
+        Returns:
+            dict: The stored object.
+
+        """
+        obj = {"id": _new_id(RESOURCE_TYPES[collection])}
+        obj.update(fields)
+        obj.setdefault("created", _timestamp())
+        self.collections[collection][obj["id"]] = obj
+        return obj
+
+    def add_many(self, collection, count, **fields):
+        """Add `count` objects with the same fields to a collection.
+
+        String field values may contain "{i}", replaced by the object's
+        index.
+
+        Returns:
+            list: The stored objects.
+
+        """
+        return [
+            self.add(
+                collection,
+                **{key: value.format(i=i) if isinstance(value, str) else value for key, value in fields.items()},
+            )
+            for i in range(count)
+        ]
+
+    def add_content(self, filename, data, content_type="application/octet-stream"):
+        """Store a file and return its download URL (like message `files`).
+
+        Args:
+            filename(str): The file name.
+            data(bytes): The file content.
+            content_type(str): The file's media type.
+
+        Returns:
+            str: The URL the file can be downloaded from.
+
+        """
+        content_id = _new_id("CONTENT")
+        self.contents[content_id] = (filename, bytes(data), content_type)
+        return "{}contents/{}/0".format(self._base_url, content_id)
+
+    def fail_next(self, count=1, status_code=503, retry_after=None):
+        """Answer the next `count` requests with an error.
+
+        Args:
+            count(int): The number of requests to fail.
+            status_code(int): The error status code (e.g. 429, 503).
+            retry_after(int): Retry-After header of the error responses;
+                defaults to the transport's `retry_after` for 429s.
+
+        """
+        if retry_after is None and status_code == 429:
+            retry_after = self.retry_after
+        self._faults.extend([(status_code, retry_after)] * count)
+
+    def interrupt_next(self, count=1, after_bytes=0):
+        """Drop the connection of the next file downloads midway.
+
+        Args:
+            count(int): The number of downloads (`contents` responses) to
+                interrupt.
+            after_bytes(int): The number of body bytes sent before the
+                connection is dropped with an httpx.ReadError.
+
+        """
+        self._interruptions.extend([after_bytes] * count)
+
+    def reset_stats(self):
+        """Reset the request counters."""
+        self.requests.clear()
+
+    # Transport interface
+
+    async def handle_async_request(self, request):
+        """Answer a request from the in-memory collections."""
+        await request.aread()
+        self.requests[(request.method, self._endpoint(request.url.path))] += 1
+
+        if self.latency:
+            latency = self.latency
+            if isinstance(latency, tuple):
+                latency = self._random.uniform(*latency)
+            await asyncio.sleep(latency)
+
+        try:
+            status_code, body, headers = self._handle(request)
+        except _FakeError as e:
+            status_code, headers = e.status_code, e.headers
+            body = {
+                "message": e.message,
+                "errors": [{"description": e.message}],
+                "trackingId": "FAKE_" + uuid.uuid4().hex,
+            }
+
+        headers = dict(headers)
+        headers.setdefault("TrackingID", "FAKE_" + uuid.uuid4().hex)
+        if body is None:
+            content = b""
+        elif isinstance(body, bytes):
+            content = body
+        else:
+            content = get_json_backend().dumps(body)
+            headers["Content-Type"] = "application/json;charset=UTF-8"
+
+        fail_after = None
+        if (
+            self._interruptions
+            and status_code in (200, 206)
+            and self._endpoint(request.url.path).startswith("contents/")
+        ):
+            fail_after = self._interruptions.pop(0)
+        if self.chunk_size or fail_after is not None:
+            headers["Content-Length"] = str(len(content))
+            chunk_size = self.chunk_size or DEFAULT_CHUNK_SIZE
+            return httpx.Response(status_code, headers=headers, stream=_ChunkedStream(content, chunk_size, fail_after))
+        return httpx.Response(status_code, headers=headers, content=content)
+
+    def _endpoint(self, path):
+        if path.startswith(self._base_path):
+            path = path[len(self._base_path) :]
+        return path.strip("/")
+
+    def _check_faults(self, request):
+        if self._faults:
+            status_code, retry_after = self._faults.pop(0)
+            headers = {"Retry-After": str(retry_after)} if retry_after is not None else {}
+            raise _FakeError(status_code, "Injected fault.", headers)
+
+        if self.rate_limit:
+            limit, period = self.rate_limit
+            token = request.headers.get("Authorization", "")
+            now = time.monotonic()
+            window_start, count = self._windows.get(token, (now, 0))
+            if now - window_start >= period:
+                window_start, count = now, 0
+            if count >= limit:
+                retry_after = max(1, math.ceil(window_start + period - now))
+                raise _FakeError(429, "Too many requests.", {"Retry-After": str(retry_after)})
+            self._windows[token] = (window_start, count + 1)
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            raise _FakeError(self.error_status, "Injected server error.")
+
+    def _handle(self, request):
+        if not request.headers.get("Authorization", "").startswith("Bearer "):
+            raise _FakeError(401, "The request requires a valid access token.")
+        self._check_faults(request)
+
+        segments = self._endpoint(request.url.path).split("/")
+        collection = segments[0]
+        if collection == "contents" and request.method in ("GET", "HEAD"):
+            return self._content(request, segments[1] if len(segments) > 1 else "")
+        if segments == ["messages", "direct"] and request.method == "GET":
+            return self._list(request, "messages", endpoint="messages/direct")
+        if collection not in self.collections or len(segments) > 2:
+            raise _FakeError(404, "The requested resource could not be found.")
+
+        method = request.method
+        if len(segments) == 1:
+            if method == "GET":
+                return self._list(request, collection)
+            if method == "POST":
+                return 200, self._create(collection, self._request_fields(request)), {}
+            raise _FakeError(405, "Method not allowed.")
+
+        resource_id = segments[1]
+        if collection == "people" and resource_id == "me":
+            resource_id = self.me["id"]
+        obj = self.collections[collection].get(resource_id)
+        if obj is None:
+            raise _FakeError(404, "The requested resource could not be found.")
+
+        if method == "GET":
+            etag = 'W/"{}"'.format(hash(tuple(sorted((k, str(v)) for k, v in obj.items()))) & 0xFFFFFFFF)
+            if request.headers.get("If-None-Match") == etag:
+                return 304, None, {"ETag": etag}
+            return 200, obj, {"ETag": etag}
+        if method == "PUT":
+            obj.update(self._request_fields(request))
+            obj["lastActivity" if collection == "rooms" else "updated"] = _timestamp()
+            self._record_event(collection, "updated", obj)
+            return 200, obj, {}
+        if method == "DELETE":
+            del self.collections[collection][resource_id]
+            self._record_event(collection, "deleted", obj)
+            return 204, None, {}
+        raise _FakeError(405, "Method not allowed.")
+
+    def _content(self, request, content_id):
+        if content_id not in self.contents:
+            raise _FakeError(404, "The requested resource could not be found.")
+        filename, data, content_type = self.contents[content_id]
+        headers = {
+            "Content-Type": content_type,
+            "Content-Disposition": 'attachment; filename="{}"'.format(filename),
+            "Accept-Ranges": "bytes",
+        }
+
+        byte_range = _RANGE.fullmatch(request.headers.get("Range", ""))
+        if byte_range and (byte_range.group(1) or byte_range.group(2)):
+            first, last = byte_range.groups()
+            if not first:
+                first, last = max(0, len(data) - int(last)), len(data) - 1
+            else:
+                first, last = int(first), min(int(last or len(data) - 1), len(data) - 1)
+            if first > last:
+                raise _FakeError(416, "Range not satisfiable.", {"Content-Range": "bytes */{}".format(len(data))})
+            headers["Content-Range"] = "bytes {}-{}/{}".format(first, last, len(data))
+            return 206, data[first : last + 1], headers
+        return 200, data, headers
+
+    def _request_fields(self, request):
+        content_type = request.headers.get("Content-Type", "")
+        if content_type.startswith("multipart/form-data"):
+            fields, files = _parse_multipart(content_type, request.content)
+            if files:
+                fields["files"] = [self.add_content(filename, data) for filename, data in files.values()]
+            return fields
+        if not request.content:
+            return {}
+        try:
+            return get_json_backend().loads(request.content)
+        except ValueError:
+            raise _FakeError(400, "The request body is not valid JSON.") from None
+
+    def _list(self, request, collection, endpoint=None):
+        endpoint = endpoint or collection
+        direct = endpoint == "messages/direct"
+        params = dict(request.url.params)
+        try:
+            page_size = min(int(params.pop("max", DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+            cursor = int(params.pop("cursor", 0))
+        except ValueError:
+            raise _FakeError(400, "Invalid max or cursor parameter.") from None
+
+        if direct and "personId" not in params and "personEmail" not in params:
+            raise _FakeError(400, "personId or personEmail is required.")
+        if collection == "messages" and not direct and "roomId" not in params:
+            raise _FakeError(400, "roomId is required.")
+
+        items = list(self.collections[collection].values())
+        if collection in ("messages", "events"):
+            # Newest first
+            items.reverse()
+        if direct:
+            items = [item for item in items if item.get("roomType") == "direct"]
+        for key, value in params.items():
+            if key == "email":
+                items = [item for item in items if value in item.get("emails", ())]
+            elif key == "mentionedPeople":
+                person = self.me["id"] if value == "me" else value
+                items = [item for item in items if person in item.get("mentionedPeople", ())]
+            elif direct and key in ("personId", "personEmail"):
+                # The messages of the 1:1 room, sent by either person
+                to_key = "toPersonId" if key == "personId" else "toPersonEmail"
+                items = [item for item in items if value in (item.get(key), item.get(to_key))]
+            elif key in ("sortBy", "from", "to", "before", "beforeMessage"):
+                continue
+            else:
+                items = [item for item in items if str(item.get(key)) == value]
+
+        page = items[cursor : cursor + page_size]
+        headers = {}
+        if cursor + page_size < len(items):
+            query = dict(params, max=page_size, cursor=cursor + page_size)
+            next_url = "{}{}?{}".format(self._base_url, endpoint, urllib.parse.urlencode(query))
+            headers["Link"] = '<{}>; rel="next"'.format(next_url)
+        return 200, {"items": page}, headers
+
+    def _create(self, collection, fields):
+        if collection == "rooms":
+            if not fields.get("title"):
+                raise _FakeError(400, "title is required.")
+            fields.setdefault("type", "group")
+            fields.setdefault("isLocked", False)
+            fields.setdefault("creatorId", self.me["id"])
+            fields["lastActivity"] = _timestamp()
+            room = self.add(collection, **fields)
+            self._create("memberships", {"roomId": room["id"], "personId": self.me["id"]})
+            return room
+
+        if collection == "memberships":
+            if not fields.get("roomId") or not (fields.get("personId") or fields.get("personEmail")):
+                raise _FakeError(400, "roomId and personId or personEmail are required.")
+            fields.setdefault("isModerator", False)
+            fields.setdefault("isMonitor", False)
+
+        if collection == "messages":
+            if not (fields.get("roomId") or fields.get("toPersonId") or fields.get("toPersonEmail")):
+                raise _FakeError(400, "roomId, toPersonId or toPersonEmail is required.")
+            fields.setdefault("roomType", "group" if fields.get("roomId") else "direct")
+            fields.setdefault("roomId", _new_id("ROOM"))
+            fields.setdefault("personId", self.me["id"])
+            fields.setdefault("personEmail", self.me["emails"][0])
+
+        if collection == "meetings":
+            if not fields.get("title"):
+                raise _FakeError(400, "title is required.")
+            fields.setdefault("meetingType", "meetingSeries")
+            fields.setdefault("state", "active")
+            fields.setdefault("hostUserId", self.me["id"])
+
+        if collection == "events":
+            raise _FakeError(405, "Method not allowed.")
+
+        obj = self.add(collection, **fields)
+        self._record_event(collection, "created", obj)
+        return obj
+
+    def _record_event(self, collection, event_type, obj):
+        if collection in ("messages", "memberships"):
+            self.add(
+                "events",
+                resource=collection,
+                type=event_type,
+                actorId=self.me["id"],
+                data=dict(obj),
+            )
@@ -0,0 +1,121 @@
+import logging
+
+from .ratelimit import RateLimitGate
+from .restsession import AsyncRestSession
+from .utils import check_type
+
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledToken(object):
+    """An access token of a token pool and its rate-limit state."""
+
+    __slots__ = ("index", "authorization", "gate", "in_flight", "requests", "rate_limits")
+
+    def __init__(self, index, access_token, jitter):
+        self.index = index
+        self.authorization = "Bearer " + access_token
+        self.gate = RateLimitGate(jitter=jitter)
+        self.in_flight = 0
+        self.requests = 0
+        self.rate_limits = 0
+
+
+class AsyncTokenPoolSession(AsyncRestSession):
+    """Async RESTful HTTP session sending requests with a pool of tokens.
+
+    Every request is authorized with the least-loaded access token of the
+    pool that is not cooling down after a rate-limit response: the token
+    with the fewest requests in flight, then the fewest requests sent.  A
+    rate-limit (429) response holds only the token that received it, for
+    its Retry-After period; requests fail over to the other tokens and only
+    wait when every token is cooling down.
+
+    The tokens must all be allowed to perform the requests sent through the
+    session (e.g. several bot identities that are members of the same
+    rooms), and should belong to different identities: Webex rate limits
+    are applied per identity.
+
+    """
+
+    def __init__(self, access_tokens, base_url, **kwargs):
+        """Initialize a new AsyncTokenPoolSession object.
+
+        Args:
+            access_tokens(list): The Webex access tokens to send requests
+                with.
+            base_url(str): The base URL that will be suffixed onto API
+                endpoint relative URLs to produce a callable absolute URL.
+            **kwargs: Passed on to AsyncRestSession.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If access_tokens is empty.
+
+        """
+        check_type(access_tokens, (list, tuple))
+        if not access_tokens:
+            raise ValueError("access_tokens must contain at least one access token")
+        for access_token in access_tokens:
+            check_type(access_token, str)
+
+        super().__init__(access_tokens[0], base_url, **kwargs)
+
+        jitter = self.rate_limit_gate.jitter
+        self._tokens = [_PooledToken(index, token, jitter) for index, token in enumerate(access_tokens)]
+        self._access_tokens = tuple(access_tokens)
+
+    @property
+    def access_tokens(self):
+        """The access tokens of the pool."""
+        return self._access_tokens
+
+    def token_stats(self):
+        """Return the usage and rate-limit state of each token of the pool.
+
+        Returns:
+            list: A dict per token, in pool order, with its `index`,
+            `in_flight` and total `requests` and `rate_limits` counts, and
+            the seconds it is still cooling down (`retry_after`).
+
+        """
+        return [
+            {
+                "index": token.index,
+                "in_flight": token.in_flight,
+                "requests": token.requests,
+                "rate_limits": token.rate_limits,
+                "retry_after": token.gate.retry_after,
+            }
+            for token in self._tokens
+        ]
+
+    async def _acquire_identity(self):
+        """Pick the least-loaded token that is not cooling down."""
+        waited = 0.0
+        while True:
+            available = [token for token in self._tokens if not token.gate.is_closed]
+            if available:
+                token = min(available, key=lambda token: (token.in_flight, token.requests))
+                token.in_flight += 1
+                token.requests += 1
+                return token, waited
+
+            # Every token is cooling down; wait for the first to recover
+            token = min(self._tokens, key=lambda token: token.gate.retry_after)
+            waited += await token.gate.wait()
+
+    def _release_identity(self, identity):
+        identity.in_flight -= 1
+
+    def _hold_identity(self, identity, retry_after):
+        identity.rate_limits += 1
+        identity.gate.hold(retry_after)
+        logger.debug(
+            "Access token #%d is rate-limited for %s seconds; %d of %d tokens available.",
+            identity.index,
+            retry_after,
+            sum(not token.gate.is_closed for token in self._tokens),
+            len(self._tokens),
+        )
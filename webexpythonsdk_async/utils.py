@@ -1,16 +1,17 @@
 native_str = str
 
-import json
 import mimetypes
 import os
+import re
 import sys
 import urllib.parse
 import warnings
-from collections import namedtuple, OrderedDict
+from collections import namedtuple
 from datetime import datetime, timedelta, tzinfo
 
 
 from .config import WEBEX_DATETIME_FORMAT
+from .json_backends import get_json_backend
 from .exceptions import (
     ApiError,
     RateLimitError,
@@ -57,6 +58,63 @@ def validate_base_url(base_url):
         raise ValueError(error_message)
 
 
+def endpoint_path(url, base_url):
+    """Return the API endpoint path of a URL, relative to the base URL.
+
+    Args:
+        url(str): A relative or absolute API endpoint URL.
+        base_url(str): The base URL of the API.
+
+    Returns:
+        str: The endpoint path without the base URL path, query string or
+        leading / trailing slashes (e.g. "messages/<id>").
+
+    """
+    path = urllib.parse.urlparse(url).path
+    base_path = urllib.parse.urlparse(base_url).path
+    if base_path and path.startswith(base_path):
+        path = path[len(base_path) :]
+    return path.strip("/")
+
+
+def endpoint_family(url, base_url):
+    """Return the endpoint family of a URL (e.g. "messages", "people").
+
+    Args:
+        url(str): A relative or absolute API endpoint URL.
+        base_url(str): The base URL of the API.
+
+    Returns:
+        str: The first path segment of the endpoint path.
+
+    """
+    return endpoint_path(url, base_url).split("/", 1)[0]
+
+
+# Path segments that identify a resource rather than an endpoint: Webex IDs
+# (base64, usually 40+ characters), UUIDs, meeting IDs and numbers
+_ID_SEGMENT = re.compile(r"^(?:\d+|(?=[^/]*\d)[A-Za-z0-9_=+.\-]{16,})$")
+
+
+def endpoint_template(url, base_url):
+    """Return the endpoint path of a URL with resource IDs collapsed.
+
+    Collapsing IDs gives every resource of an endpoint the same label, for
+    example "rooms/Y2lzY29...Zl" becomes "rooms/{id}".
+
+    Args:
+        url(str): A relative or absolute API endpoint URL.
+        base_url(str): The base URL of the API.
+
+    Returns:
+        str: The endpoint path with ID segments replaced by "{id}".
+
+    """
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in endpoint_path(url, base_url).split("/")
+    )
+
+
 def is_web_url(string):
     """Check to see if string is an validly-formatted web url."""
     assert isinstance(string, str)
@@ -156,8 +214,8 @@ def check_response_code(response: httpx.Response, expected_response_code: int):
     Args:
         response(httpx.response): The response object returned by a request
             using the httpx package.
-        expected_response_code(int): The expected response code (HTTP response
-            code).
+        expected_response_code(int,tuple): The expected response code (HTTP
+            response code), or a tuple of acceptable response codes.
 
     Raises:
         ApiError: If the httpx.response.status_code does not match the
@@ -166,6 +224,8 @@ def check_response_code(response: httpx.Response, expected_response_code: int):
     """
     if response.status_code == expected_response_code:
         pass
+    elif isinstance(expected_response_code, tuple) and response.status_code in expected_response_code:
+        pass
     elif response.status_code == RATE_LIMIT_RESPONSE_CODE:
         raise RateLimitError(response)
     else:
@@ -179,11 +239,14 @@ def extract_and_parse_json(response):
         response(httpx.response): The response object returned by a request
             using the httpx package.
 
+    The body is decoded straight from the raw response bytes by the active
+    JSON backend (see `json_backends.set_json_backend`).
+
     Returns:
         The parsed JSON data as the appropriate native Python data type.
 
     """
-    return json.loads(response.text, object_hook=OrderedDict)
+    return get_json_backend().loads(response.content)
 
 
 def json_dict(json_data):
@@ -202,7 +265,7 @@ def json_dict(json_data):
     if isinstance(json_data, dict):
         return json_data
     elif isinstance(json_data, str):
-        return json.loads(json_data, object_hook=OrderedDict)
+        return get_json_backend().loads(json_data)
     else:
         raise TypeError("'json_data' must be a dictionary or valid JSON string; received: {!r}".format(json_data))
 